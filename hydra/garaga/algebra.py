@@ -4,7 +4,7 @@ import random
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
-from sympy import legendre_symbol, sqrt_mod
+from garaga import int_poly, modular_sqrt
 
 T = TypeVar("T", "PyFelt", "Fp2")
 
@@ -145,16 +145,13 @@ class PyFelt:
         return self.__inv__().__mul__(left)
 
     def is_quad_residue(self) -> bool:
-        return legendre_symbol(self.value, self.p) == 1
+        return modular_sqrt.is_square(self.value, self.p)
 
     def sqrt(self, min_root: bool = True) -> PyFelt:
         if not self.is_quad_residue():
             raise ValueError("Cannot square root a non-quadratic residue")
-        roots = sqrt_mod(self.value, self.p, all_roots=True)
-        if min_root:
-            return PyFelt(min(roots), self.p)
-        else:
-            return PyFelt(max(roots), self.p)
+        min_sqrt, max_sqrt = modular_sqrt.sqrt_roots(self.value, self.p)
+        return PyFelt(min_sqrt if min_root else max_sqrt, self.p)
 
 
 @dataclass(slots=True)
@@ -291,7 +288,7 @@ class Fp2:
 
     def legendre(self) -> int:
         norm = self.norm()
-        return legendre_symbol(norm.value, self.p)
+        return modular_sqrt.legendre(norm.value, self.p)
 
     def is_quad_residue(self) -> bool:
         return self.legendre() == 1
@@ -660,14 +657,25 @@ class Polynomial(Generic[T]):
                 f"Cannot multiply polynomial of type {self.coeff_type} by polynomial of type {other.type}"
             )
 
-        len_self = len(self.coefficients)
-        len_other = len(other.coefficients)
-        buf = [self.zero_field] * (len_self + len_other - 1)
-        for i in range(len_self):
-            if self.coefficients[i].value == self.zero_field_value:
-                continue  # optimization for sparse polynomials
-            for j in range(len_other):
-                buf[i + j] += self.coefficients[i] * other.coefficients[j]
+        if self.coeff_type == PyFelt:
+            p = self.p
+            buf = [
+                PyFelt(c, p)
+                for c in int_poly.mul(
+                    [c.value for c in self.coefficients],
+                    [c.value for c in other.coefficients],
+                    p,
+                )
+            ]
+        else:
+            len_self = len(self.coefficients)
+            len_other = len(other.coefficients)
+            buf = [self.zero_field] * (len_self + len_other - 1)
+            for i in range(len_self):
+                if self.coefficients[i].value == self.zero_field_value:
+                    continue  # optimization for sparse polynomials
+                for j in range(len_other):
+                    buf[i + j] += self.coefficients[i] * other.coefficients[j]
 
         while len(buf) > 0 and buf[-1].value == self.zero_field_value:
             buf.pop()
@@ -722,6 +730,27 @@ class Polynomial(Generic[T]):
         if num_deg < den_deg:
             return (Polynomial.zero(self.p, self.coeff_type), self)
 
+        raw_init = (
+            self.coeff_type,
+            self.p,
+            self.field,
+            self.zero_field,
+            self.zero_field_value,
+        )
+        if self.coeff_type == PyFelt:
+            p = self.p
+            q, r = int_poly.divmod_(
+                [c.value for c in self.coefficients[: num_deg + 1]],
+                [c.value for c in denominator.coefficients[: den_deg + 1]],
+                p,
+            )
+            # Same shapes as the generic loop : the remainder keeps the length of the numerator.
+            r += [0] * (len(self.coefficients) - len(r))
+            return (
+                Polynomial([PyFelt(c, p) for c in q], raw_init=raw_init),
+                Polynomial([PyFelt(c, p) for c in r], raw_init=raw_init),
+            )
+
         remainder = Polynomial(
             self.coefficients[:],
             raw_init=(
@@ -818,13 +847,37 @@ class Polynomial(Generic[T]):
         assert isinstance(
             point, self.coeff_type
         ), f"point type must match polynomial type {self.coeff_type}"
-        xi = self.field.one()
+        if self.coeff_type == PyFelt:
+            return PyFelt(
+                int_poly.evaluate(
+                    [c.value for c in self.coefficients], point.value, self.p
+                ),
+                self.p,
+            )
+        # Horner
         value = self.zero_field
-        for c in self.coefficients:
-            value = value + c * xi
-            xi = xi * point
+        for c in reversed(self.coefficients):
+            value = value * point + c
         return value
 
+    def evaluate_many(self, points: list[PyFelt | Fp2]) -> list[PyFelt | Fp2]:
+        """
+        Evaluates the polynomial at all the points.
+        For PyFelt coefficients, many points are evaluated at once with a subproduct tree.
+        """
+        if self.coeff_type != PyFelt:
+            return [self.evaluate(x) for x in points]
+        assert all(
+            isinstance(x, PyFelt) for x in points
+        ), f"point type must match polynomial type {self.coeff_type}"
+        p = self.p
+        return [
+            PyFelt(v, p)
+            for v in int_poly.evaluate_many(
+                [c.value for c in self.coefficients], [x.value for x in points], p
+            )
+        ]
+
     def __pow__(self, exponent: int) -> "Polynomial":
         if exponent == 0:
             return Polynomial([self.field.one()])
@@ -888,6 +941,21 @@ class Polynomial(Generic[T]):
             b (Polynomial): A polynomial such that a * x + b * y = g.
             g (Polynomial): The greatest common divisor of x and y.
         """
+        raw_init = (x.coeff_type, x.p, x.field, x.zero_field, x.zero_field_value)
+        if x.coeff_type == PyFelt:
+            p = x.p
+            a, b, g = int_poly.xgcd(
+                [c.value for c in x.coefficients],
+                [c.value for c in y.coefficients],
+                p,
+            )
+            return tuple(
+                Polynomial(
+                    [PyFelt(c, p) for c in poly] or [x.zero_field], raw_init=raw_init
+                )
+                for poly in (a, b, g)
+            )
+
         one = Polynomial.one(x.p, x.coeff_type)
         zero = Polynomial.zero(x.p, x.coeff_type)
         old_r, r = (x, y)
@@ -903,7 +971,6 @@ class Polynomial(Generic[T]):
         lcinv = old_r.leading_coefficient().__inv__()
 
         # a, b, g
-        raw_init = (x.coeff_type, x.p, x.field, x.zero_field, x.zero_field_value)
         return (
             Polynomial([c * lcinv for c in old_s.coefficients], raw_init=raw_init),
             Polynomial([c * lcinv for c in old_t.coefficients], raw_init=raw_init),
@@ -915,7 +982,7 @@ class Polynomial(Generic[T]):
         p: int, domain: list[PyFelt], values: list[PyFelt]
     ) -> Polynomial:
         """
-        Performs Lagrange interpolation on a set of points.
+        Performs Lagrange interpolation on a set of points, using a subproduct tree of the domain.
 
         Parameters:
         p (int): The prime modulus for the field.
@@ -930,20 +997,170 @@ class Polynomial(Generic[T]):
         ), "number of elements in domain does not match number of values -- cannot interpolate"
         assert len(domain) > 0, "cannot interpolate between zero points"
         field = BaseField(p)
-        X = Polynomial([field.zero(), field.one()])
-        acc = Polynomial([field.zero()])
-        for i in range(len(domain)):
-            prod = Polynomial([values[i]])
-            for j in range(len(domain)):
-                if j == i:
-                    continue
-                prod = (
-                    prod
-                    * (X - Polynomial([domain[j]]))
-                    * Polynomial([(domain[i] - domain[j]).__inv__()])
-                )
-            acc = acc + prod
-        return acc
+        coeffs = int_poly.interpolate(
+            [x.value for x in domain], [y.value for y in values], p
+        )
+        return Polynomial([field(c) for c in coeffs] or [field.zero()])
+
+
+class IntPolynomial:
+    """
+    Compact variant of Polynomial[PyFelt], holding the modulus once and the coefficients as plain ints,
+    lowest degree first and without trailing zeros (the zero polynomial has no coefficients).
+    Coefficients are converted to PyFelt only at the API boundary (get_coeffs, __getitem__, evaluate, ...),
+    so it can be used in place of a Polynomial[PyFelt] in RationalFunction and FunctionFelt.
+    """
+
+    __slots__ = ["coefficients", "p"]
+
+    def __init__(self, coefficients: list[int], p: int):
+        self.coefficients: list[int] = int_poly.trim(coefficients)
+        self.p = p
+
+    @staticmethod
+    def from_polynomial(poly: Polynomial[PyFelt]) -> "IntPolynomial":
+        assert poly.coeff_type == PyFelt, f"Expected PyFelt polynomial, got {poly}"
+        return IntPolynomial([c.value for c in poly.coefficients], poly.p)
+
+    def to_polynomial(self) -> Polynomial[PyFelt]:
+        return Polynomial(self.get_coeffs())
+
+    @staticmethod
+    def zero(p: int) -> "IntPolynomial":
+        return IntPolynomial([], p)
+
+    @staticmethod
+    def one(p: int) -> "IntPolynomial":
+        return IntPolynomial([1], p)
+
+    @property
+    def field(self) -> BaseField:
+        return BaseField(self.p)
+
+    @property
+    def coeff_type(self) -> type[PyFelt]:
+        return PyFelt
+
+    def __repr__(self) -> str:
+        return f"IntPolynomial({self.coefficients})"
+
+    def print_as_sage_poly(self, var_name: str = "z", as_hex: bool = False) -> str:
+        return self.to_polynomial().print_as_sage_poly(var_name, as_hex)
+
+    def __getitem__(self, i: int) -> PyFelt:
+        if 0 <= i < len(self.coefficients):
+            return PyFelt(self.coefficients[i], self.p)
+        return PyFelt(0, self.p)
+
+    def __len__(self) -> int:
+        return len(self.coefficients)
+
+    def degree(self) -> int:
+        return len(self.coefficients) - 1
+
+    def is_zero(self) -> bool:
+        return not self.coefficients
+
+    def get_coeffs(self) -> list[PyFelt]:
+        p = self.p
+        if not self.coefficients:
+            return [PyFelt(0, p)]
+        return [PyFelt(c, p) for c in self.coefficients]
+
+    def get_value_coeffs(self) -> list[int]:
+        return self.coefficients[:] if self.coefficients else [0]
+
+    def leading_coefficient(self) -> PyFelt:
+        return self[self.degree()]
+
+    def differentiate(self) -> "IntPolynomial":
+        p = self.p
+        return IntPolynomial(
+            [i * c % p for i, c in enumerate(self.coefficients) if i > 0], p
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Polynomial):
+            other = IntPolynomial.from_polynomial(other)
+        if not isinstance(other, IntPolynomial):
+            raise TypeError(f"Cannot compare IntPolynomial with {type(other)}")
+        return self.p == other.p and self.coefficients == other.coefficients
+
+    def __add__(self, other: "IntPolynomial") -> "IntPolynomial":
+        return IntPolynomial(
+            int_poly.add(self.coefficients, other.coefficients, self.p), self.p
+        )
+
+    def __neg__(self) -> "IntPolynomial":
+        p = self.p
+        return IntPolynomial([-c % p for c in self.coefficients], p)
+
+    def __sub__(self, other: "IntPolynomial") -> "IntPolynomial":
+        return IntPolynomial(
+            int_poly.sub(self.coefficients, other.coefficients, self.p), self.p
+        )
+
+    def __mul__(
+        self, other: "IntPolynomial" | PyFelt | ModuloCircuitElement | int
+    ) -> "IntPolynomial":
+        if isinstance(other, IntPolynomial):
+            return IntPolynomial(
+                int_poly.mul(self.coefficients, other.coefficients, self.p), self.p
+            )
+        if isinstance(other, (PyFelt, ModuloCircuitElement)):
+            other = other.value
+        if isinstance(other, int):
+            return IntPolynomial(
+                int_poly.scale(self.coefficients, other % self.p, self.p), self.p
+            )
+        raise TypeError(f"Cannot multiply IntPolynomial by {type(other)}")
+
+    def __rmul__(self, other: PyFelt | ModuloCircuitElement | int) -> "IntPolynomial":
+        return self.__mul__(other)
+
+    def __divmod__(
+        self, denominator: "IntPolynomial"
+    ) -> tuple["IntPolynomial", "IntPolynomial"]:
+        q, r = int_poly.divmod_(self.coefficients, denominator.coefficients, self.p)
+        return IntPolynomial(q, self.p), IntPolynomial(r, self.p)
+
+    def __truediv__(self, other: "IntPolynomial") -> "IntPolynomial":
+        quo, rem = divmod(self, other)
+        assert (
+            rem.is_zero()
+        ), "cannot perform polynomial division because remainder is not zero"
+        return quo
+
+    def __floordiv__(self, other: "IntPolynomial") -> "IntPolynomial":
+        return divmod(self, other)[0]
+
+    def __mod__(self, other: "IntPolynomial") -> "IntPolynomial":
+        return divmod(self, other)[1]
+
+    def evaluate(self, point: PyFelt) -> PyFelt:
+        assert isinstance(
+            point, PyFelt
+        ), f"point type must be PyFelt, got {type(point)}"
+        return PyFelt(int_poly.evaluate(self.coefficients, point.value, self.p), self.p)
+
+    def evaluate_many(self, points: list[PyFelt]) -> list[PyFelt]:
+        p = self.p
+        return [
+            PyFelt(v, p)
+            for v in int_poly.evaluate_many(
+                self.coefficients, [x.value for x in points], p
+            )
+        ]
+
+    @staticmethod
+    def xgcd(
+        x: "IntPolynomial", y: "IntPolynomial"
+    ) -> tuple["IntPolynomial", "IntPolynomial", "IntPolynomial"]:
+        """
+        Extended Euclidean Algorithm, see Polynomial.xgcd.
+        """
+        a, b, g = int_poly.xgcd(x.coefficients, y.coefficients, x.p)
+        return IntPolynomial(a, x.p), IntPolynomial(b, x.p), IntPolynomial(g, x.p)
 
 
 @dataclass(slots=True)
@@ -964,7 +1181,7 @@ class RationalFunction(Generic[T]):
         return cls(Polynomial.one(p, type), Polynomial.one(p, type))
 
     def simplify(self) -> "RationalFunction":
-        _, _, gcd = Polynomial.xgcd(self.numerator, self.denominator)
+        _, _, gcd = type(self.numerator).xgcd(self.numerator, self.denominator)
         num_simplified = self.numerator // gcd
         den_simplified = self.denominator // gcd
         return RationalFunction(
@@ -1,12 +1,14 @@
 import functools
+import hashlib
+import os
 import random
 from dataclasses import dataclass
 from enum import Enum
-from typing import TypeAlias
+from typing import ClassVar, TypeAlias
 
 from fastecdsa import curvemath
 
-from garaga import garaga_rs
+from garaga import garaga_rs, jacobian
 from garaga.algebra import (
     BaseField,
     BaseFp2Field,
@@ -290,6 +292,29 @@ def jy00(value: int) -> list[int]:
 
 GARAGA_RS_SUPPORTED_CURVES = {BN254_ID, BLS12_381_ID}
 
+# Whether G1Point.msm uses garaga_rs.g1_msm instead of the Jacobian MSM of garaga.jacobian.
+# Off until the native MSM is benchmarked against the Python one.
+NATIVE_G1_MSM = False
+# Whether G2Point.msm, add_many and scalar_mul_many use the batched garaga_rs bindings, when the
+# extension provides them, instead of one garaga_rs call per point.
+NATIVE_G2_BATCH = True
+
+# Non residue 1 power 2, non residue 1 power 3, non residue 2 power 2, (-1) * non residue 2 power 3.
+# Used to compute the Frobenius images of Q in the final BN254 Miller loop step
+# (MultiMillerLoopCircuit and hints.multi_miller_witness.multi_miller_loop).
+BN254_FROBENIUS_CONSTANTS = (
+    (
+        21575463638280843010398324269430826099269044274347216827212613867836435027261,
+        10307601595873709700152284273816112264069230130616436755625194854815875713954,
+    ),
+    (
+        2821565182194536844548159561693502659359617185244120367078079554186484126554,
+        3505843767911556378687030309984248845540243509899259641013678093033130930403,
+    ),
+    21888242871839275220042445260109153167277707414472061641714758635765020556616,
+    -21888242871839275222246405745257275088696311157297823662689037894645226208582,
+)
+
 Curve: TypeAlias = WeierstrassCurve
 
 CURVES: dict[int, WeierstrassCurve] = {
@@ -534,6 +559,125 @@ def get_irreducible_poly(curve_id: int | CurveID, extension_degree: int) -> Poly
     )
 
 
+@functools.cache
+def get_glv_beta(curve_id: int | CurveID) -> int:
+    """
+    Returns the cube root of unity beta of the base field of a BLS12 curve such that the endomorphism
+    phi(x, y) = (beta * x, y) acts on the prime order subgroup of G1 as the multiplication by -x^2,
+    x being the curve parameter. Used by G1Point.is_in_prime_order_subgroup.
+    """
+    if isinstance(curve_id, CurveID):
+        curve_id = curve_id.value
+    curve = CURVES[curve_id]
+    assert isinstance(curve, PairingCurve) and curve.h != 1
+    p = curve.p
+    omega = pow(curve.fp_generator, (p - 1) // 3, p)
+    # -x^2 * G == phi(G) <=> x^2 * G == (beta * Gx, -Gy)
+    X, Y, Z = jacobian.scalar_mul(curve.Gx, curve.Gy, curve.x**2, curve.a, p)
+    for beta in (omega, omega * omega % p):
+        ZZ = Z * Z % p
+        if X == beta * curve.Gx * ZZ % p and Y == -curve.Gy * ZZ * Z % p:
+            return beta
+    raise ValueError(f"No GLV endomorphism found for curve {curve_id}")
+
+
+@functools.cache
+def get_psi_constants(
+    curve_id: int | CurveID,
+) -> tuple[tuple[int, int], tuple[int, int]]:
+    """
+    Returns the coefficients (cx, cy) of the untwist-Frobenius-twist endomorphism of G2,
+    psi(x, y) = (cx * conjugate(x), cy * conjugate(y)).
+    """
+    if isinstance(curve_id, CurveID):
+        curve_id = curve_id.value
+    curve = CURVES[curve_id]
+    assert isinstance(curve, PairingCurve)
+    field = get_base_field(curve_id, Fp2)
+    # Non residue of Fp2 defining the sextic twist.
+    xi = field({BN254_ID: (9, 1), BLS12_381_ID: (1, 1)}[curve_id])
+    cx = xi ** ((curve.p - 1) // 3)
+    cy = xi ** ((curve.p - 1) // 2)
+    if field((curve.b20, curve.b21)) * xi != field((curve.b, 0)):
+        # M-type twist (b' = b * xi) instead of D-type (b' = b / xi).
+        cx, cy = cx.__inv__(), cy.__inv__()
+    return (cx.a0.value, cx.a1.value), (cy.a0.value, cy.a1.value)
+
+
+FIXED_BASE_CACHE_DIR = "build/fixed_base_cache"
+# Fixed-base tables (see jacobian.fixed_base_table) of the points registered with
+# G1Point.precompute_tables.
+_FIXED_BASE_TABLES: dict["G1Point", list[list[tuple[int, int]]]] = {}
+
+
+def fixed_base_cache_key(points: list["G1Point"]) -> str:
+    """
+    Content address of the fixed-base tables of a list of points : sha256 of the curve id,
+    the iso_point flag, the window size and the coordinates of every point.
+    """
+    curve_id = points[0].curve_id
+    n_bytes = (CURVES[curve_id.value].p.bit_length() + 7) // 8
+    h = hashlib.sha256(
+        bytes([curve_id.value, points[0].iso_point, jacobian.FIXED_BASE_WINDOW])
+    )
+    for P in points:
+        h.update(P.x.to_bytes(n_bytes, "big") + P.y.to_bytes(n_bytes, "big"))
+    return f"{curve_id.name.lower()}_{h.hexdigest()}"
+
+
+def save_fixed_base_tables(
+    key: str, tables: list[list[list[tuple[int, int]]]], curve_id: CurveID
+) -> None:
+    """
+    Writes the tables as a flat array of fixed-width big-endian coordinates.
+    Best effort, as the lines cache : a read-only build directory only disables it.
+    """
+    n_bytes = (CURVES[curve_id.value].p.bit_length() + 7) // 8
+    filename = os.path.join(FIXED_BASE_CACHE_DIR, f"{key}.bin")
+    try:
+        os.makedirs(FIXED_BASE_CACHE_DIR, exist_ok=True)
+        tmp = f"{filename}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(
+                b"".join(
+                    c.to_bytes(n_bytes, "big")
+                    for table in tables
+                    for row in table
+                    for xy in row
+                    for c in xy
+                )
+            )
+        os.replace(tmp, filename)
+    except OSError:
+        pass
+
+
+def load_fixed_base_tables(
+    key: str, points: list["G1Point"]
+) -> list[list[list[tuple[int, int]]]] | None:
+    curve = CURVES[points[0].curve_id.value]
+    n_bytes = (curve.p.bit_length() + 7) // 8
+    w = jacobian.FIXED_BASE_WINDOW
+    n_windows = (curve.n.bit_length() + w - 1) // w
+    size = (1 << w) - 1
+    try:
+        with open(os.path.join(FIXED_BASE_CACHE_DIR, f"{key}.bin"), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) != len(points) * n_windows * size * 2 * n_bytes:
+        return None
+    coords = [
+        int.from_bytes(data[i : i + n_bytes], "big")
+        for i in range(0, len(data), n_bytes)
+    ]
+    entries = list(zip(coords[::2], coords[1::2]))
+    return [
+        [entries[k : k + size] for k in range(i, i + n_windows * size, size)]
+        for i in range(0, len(entries), n_windows * size)
+    ]
+
+
 @dataclass(slots=True)
 class G1Point:
     """
@@ -550,6 +694,12 @@ class G1Point:
     curve_id: CurveID
     iso_point: bool = False
 
+    # When True, points built with G1Point.trusted are validated as well.
+    # Set by the test suite, or with the GARAGA_VALIDATE_TRUSTED_POINTS=1 environment variable.
+    validate_trusted: ClassVar[bool] = (
+        os.environ.get("GARAGA_VALIDATE_TRUSTED_POINTS", "0") == "1"
+    )
+
     def __str__(self) -> str:
         return f"G1Point({self.x}, {self.y}) on curve {self.curve_id}"
 
@@ -584,6 +734,24 @@ class G1Point:
         if not self.is_on_curve():
             raise ValueError(f"Point {self} is not on the curve {self.curve_id}")
 
+    @staticmethod
+    def trusted(
+        x: int, y: int, curve_id: CurveID, iso_point: bool = False
+    ) -> "G1Point":
+        """
+        Builds a point known to be on the curve, skipping the on-curve check of __post_init__.
+        Only for points computed internally (group operations, hash to curve, ...).
+        Points parsed from external inputs must be built with the regular constructor.
+        """
+        if G1Point.validate_trusted:
+            return G1Point(x, y, curve_id, iso_point)
+        point = object.__new__(G1Point)
+        point.x = x
+        point.y = y
+        point.curve_id = curve_id
+        point.iso_point = iso_point
+        return point
+
     @staticmethod
     def infinity(curve_id: CurveID) -> "G1Point":
         """
@@ -655,11 +823,34 @@ class G1Point:
     def is_in_prime_order_subgroup(self) -> bool:
         """
         Checks if the point is in the prime order subgroup.
+        Trivial for curves of cofactor 1. On BLS12 curves, uses the GLV endomorphism criterion
+        phi(P) == -x^2 * P (Scott, "A note on group membership tests for G1, G2 and GT on
+        BLS pairing-friendly curves"), a multiplication by x^2 of half the size of the curve order.
 
         Returns:
             bool: True if the point is in the prime order subgroup, False otherwise.
         """
-        return self.scalar_mul(CURVES[self.curve_id.value].n).is_infinity()
+        curve = CURVES[self.curve_id.value]
+        if self.is_infinity() or (curve.h == 1 and not self.iso_point):
+            return True
+        if self.iso_point or self.curve_id != CurveID.BLS12_381:
+            return self.scalar_mul(curve.n).is_infinity()
+        p = curve.p
+        X, Y, Z = jacobian.scalar_mul(self.x, self.y, curve.x**2, curve.a, p)
+        # x^2 * P == (beta * x, -y) in Jacobian coordinates.
+        ZZ = Z * Z % p
+        return (
+            Z != 0
+            and X == get_glv_beta(self.curve_id) * self.x * ZZ % p
+            and Y == -self.y * ZZ * Z % p
+        )
+
+    @staticmethod
+    def is_in_prime_order_subgroup_many(points: list["G1Point"]) -> list[bool]:
+        """
+        Checks if each point is in the prime order subgroup, see is_in_prime_order_subgroup.
+        """
+        return [P.is_in_prime_order_subgroup() for P in points]
 
     def is_on_curve(self) -> bool:
         """
@@ -715,6 +906,7 @@ class G1Point:
         ), "n must be less than the order of the curve"
 
         gen = G1Point(CURVES[curve_id.value].Gx, CURVES[curve_id.value].Gy, curve_id)
+        G1Point.precompute_tables([gen])
         return gen.scalar_mul(n)
 
     @staticmethod
@@ -732,9 +924,81 @@ class G1Point:
         assert len(points) == len(
             scalars
         ), f"Points and scalar length mismatch: {len(points)} points and {len(scalars)} scalars"
-        muls = [P.scalar_mul(s) for P, s in zip(points, scalars)]
-        scalar_mul = functools.reduce(lambda acc, p: acc.add(p), muls)
-        return scalar_mul
+        if len(points) == 1:
+            return points[0].scalar_mul(scalars[0])
+        curve_id = points[0].curve_id
+        iso_point = points[0].iso_point
+        if any(P.curve_id != curve_id or P.iso_point != iso_point for P in points):
+            raise ValueError("Points are not on the same curve")
+        curve = CURVES[curve_id.value]
+        p = curve.p
+        # Negative scalars are handled by negating the points.
+        coords = [
+            (P.x, P.y) if s >= 0 else (P.x, -P.y % p) for P, s in zip(points, scalars)
+        ]
+        a = curve.swu_params.A if iso_point else curve.a
+        # Fixed-base tables, if all the (finite) points have one.
+        tables = [_FIXED_BASE_TABLES.get(P) for P in points]
+        if all(
+            P.is_infinity()
+            or (
+                t is not None
+                and abs(s).bit_length() <= jacobian.FIXED_BASE_WINDOW * len(t)
+            )
+            for P, t, s in zip(points, tables, scalars)
+        ):
+            x, y = jacobian.to_affine(
+                jacobian.fixed_base_msm(
+                    [t for t in tables if t is not None],
+                    [s for t, s in zip(tables, scalars) if t is not None],
+                    a,
+                    p,
+                ),
+                p,
+            )
+            return G1Point.trusted(x, y, curve_id, iso_point)
+        scalars = [abs(s) for s in scalars]
+        if NATIVE_G1_MSM and not iso_point and hasattr(garaga_rs, "g1_msm"):
+            x, y = garaga_rs.g1_msm(
+                [c for xy in coords for c in xy], scalars, curve_id.value
+            )
+        else:
+            x, y = jacobian.to_affine(jacobian.msm(coords, scalars, a, p), p)
+        return G1Point.trusted(x, y, curve_id, iso_point)
+
+    @staticmethod
+    def precompute_tables(points: list["G1Point"], persist: bool = False) -> None:
+        """
+        Builds the fixed-base tables of the given points, used from then on by scalar_mul and msm
+        whenever all the points of the multiplication have one.
+        Meant for points known in advance and multiplied many times (generator, verifying key points).
+        If persist is True, the tables of this list of points are also cached in FIXED_BASE_CACHE_DIR.
+        """
+        missing = [
+            P
+            for P in dict.fromkeys(points)
+            if not P.is_infinity() and P not in _FIXED_BASE_TABLES
+        ]
+        if not missing:
+            return
+        curve_id = missing[0].curve_id
+        iso_point = missing[0].iso_point
+        if any(P.curve_id != curve_id or P.iso_point != iso_point for P in missing):
+            raise ValueError("Points are not on the same curve")
+        curve = CURVES[curve_id.value]
+
+        key = fixed_base_cache_key(missing)
+        tables = load_fixed_base_tables(key, missing) if persist else None
+        if tables is None:
+            a = curve.swu_params.A if iso_point else curve.a
+            n_bits = curve.n.bit_length()
+            tables = [
+                jacobian.fixed_base_table(P.x, P.y, n_bits, a, curve.p) for P in missing
+            ]
+            if persist:
+                save_fixed_base_tables(key, tables, curve_id)
+        for P, table in zip(missing, tables):
+            _FIXED_BASE_TABLES[P] = table
 
     def scalar_mul(self, scalar: int) -> "G1Point":
         """
@@ -756,6 +1020,15 @@ class G1Point:
         else:
             a = CURVES[self.curve_id.value].a
             b = CURVES[self.curve_id.value].b
+        table = _FIXED_BASE_TABLES.get(self)
+        if table is not None and abs(
+            scalar
+        ).bit_length() <= jacobian.FIXED_BASE_WINDOW * len(table):
+            p = CURVES[self.curve_id.value].p
+            x, y = jacobian.to_affine(
+                jacobian.fixed_base_msm([table], [scalar], a, p), p
+            )
+            return G1Point.trusted(x, y, self.curve_id, self.iso_point)
         # Fastecdsa C binding.
         x, y = curvemath.mul(
             str(self.x),
@@ -770,9 +1043,9 @@ class G1Point:
         )
         # Fastecdsa already returns (0, 0) for the identity element.
         if scalar < 0:
-            return -G1Point(int(x), int(y), self.curve_id, self.iso_point)
+            return -G1Point.trusted(int(x), int(y), self.curve_id, self.iso_point)
         else:
-            return G1Point(int(x), int(y), self.curve_id, self.iso_point)
+            return G1Point.trusted(int(x), int(y), self.curve_id, self.iso_point)
 
     def add(self, other: "G1Point") -> "G1Point":
         """
@@ -815,7 +1088,7 @@ class G1Point:
             str(CURVES[self.curve_id.value].Gy),
         )
 
-        return G1Point(int(x), int(y), self.curve_id, self.iso_point)
+        return G1Point.trusted(int(x), int(y), self.curve_id, self.iso_point)
 
     def __neg__(self) -> "G1Point":
         """
@@ -824,7 +1097,7 @@ class G1Point:
         Returns:
             G1Point: The negated point.
         """
-        return G1Point(
+        return G1Point.trusted(
             self.x,
             -self.y % CURVES[self.curve_id.value].p,
             self.curve_id,
@@ -891,6 +1164,28 @@ class G2Point:
         x = E2(*self.x, p)
         return y**2 == x**3 + a * x + b
 
+    @staticmethod
+    def _from_native(coords, curve_id: CurveID) -> "G2Point":
+        """
+        Builds a G2Point from the (x0, x1, y0, y1) coordinates of a garaga_rs result,
+        without re-checking that it is on the curve.
+        """
+        point = object.__new__(G2Point)
+        object.__setattr__(point, "x", (coords[0], coords[1]))
+        object.__setattr__(point, "y", (coords[2], coords[3]))
+        object.__setattr__(point, "curve_id", curve_id)
+        return point
+
+    @staticmethod
+    def _from_native_list(values: list[int], curve_id: CurveID) -> list["G2Point"]:
+        return [
+            G2Point._from_native(values[i : i + 4], curve_id)
+            for i in range(0, len(values), 4)
+        ]
+
+    def _coords(self) -> tuple[int, int, int, int]:
+        return (self.x[0], self.x[1], self.y[0], self.y[1])
+
     @staticmethod
     def gen_random_point(curve_id: CurveID) -> "G2Point":
         """
@@ -901,7 +1196,7 @@ class G2Point:
         scalar = random.randint(1, curve.n - 1)
         a = (curve.G2x[0], curve.G2x[1], curve.G2y[0], curve.G2y[1])
         b = garaga_rs.g2_scalar_mul(curve_id.value, a, scalar)
-        return G2Point((b[0], b[1]), (b[2], b[3]), curve_id)
+        return G2Point._from_native(b, curve_id)
 
     @staticmethod
     def get_nG(curve_id: CurveID, n: int) -> "G2Point":
@@ -916,7 +1211,7 @@ class G2Point:
             curve = CURVES[curve_id.value]
             a = (curve.G2x[0], curve.G2x[1], curve.G2y[0], curve.G2y[1])
             b = garaga_rs.g2_scalar_mul(curve_id.value, a, n)
-            return G2Point((b[0], b[1]), (b[2], b[3]), curve_id)
+            return G2Point._from_native(b, curve_id)
         else:
             raise NotImplementedError(
                 "G2Point.get_nG is not implemented for this curve"
@@ -930,9 +1225,8 @@ class G2Point:
         if scalar < 0:
             return -self.scalar_mul(-scalar)
         if self.curve_id.value in GARAGA_RS_SUPPORTED_CURVES:
-            a = (self.x[0], self.x[1], self.y[0], self.y[1])
-            b = garaga_rs.g2_scalar_mul(self.curve_id.value, a, scalar)
-            return G2Point((b[0], b[1]), (b[2], b[3]), self.curve_id)
+            b = garaga_rs.g2_scalar_mul(self.curve_id.value, self._coords(), scalar)
+            return G2Point._from_native(b, self.curve_id)
         else:
             raise NotImplementedError(
                 "G2Point.scalar_mul is not implemented for this curve"
@@ -946,10 +1240,8 @@ class G2Point:
         if self.curve_id != other.curve_id:
             raise ValueError("Points are not on the same curve")
         if self.curve_id.value in GARAGA_RS_SUPPORTED_CURVES:
-            a = (self.x[0], self.x[1], self.y[0], self.y[1])
-            b = (other.x[0], other.x[1], other.y[0], other.y[1])
-            c = garaga_rs.g2_add(self.curve_id.value, a, b)
-            return G2Point((c[0], c[1]), (c[2], c[3]), self.curve_id)
+            c = garaga_rs.g2_add(self.curve_id.value, self._coords(), other._coords())
+            return G2Point._from_native(c, self.curve_id)
         else:
             raise NotImplementedError("G2Point.add is not implemented for this curve")
 
@@ -959,13 +1251,136 @@ class G2Point:
             (self.x[0], self.x[1]), (-self.y[0] % p, -self.y[1] % p), self.curve_id
         )
 
+    def psi(self) -> "G2Point":
+        """
+        Untwist-Frobenius-twist endomorphism of G2, see get_psi_constants.
+        """
+        if self.is_infinity():
+            return self
+        p = CURVES[self.curve_id.value].p
+        (cx0, cx1), (cy0, cy1) = get_psi_constants(self.curve_id)
+        # (c0 + c1 * u) * (a0 - a1 * u) with u^2 = -1.
+        x0, x1 = self.x[0], -self.x[1]
+        y0, y1 = self.y[0], -self.y[1]
+        return G2Point._from_native(
+            (
+                (cx0 * x0 - cx1 * x1) % p,
+                (cx0 * x1 + cx1 * x0) % p,
+                (cy0 * y0 - cy1 * y1) % p,
+                (cy0 * y1 + cy1 * y0) % p,
+            ),
+            self.curve_id,
+        )
+
+    def is_in_prime_order_subgroup(self) -> bool:
+        """
+        Checks if the point is in the prime order subgroup of G2, see is_in_prime_order_subgroup_many.
+        """
+        return G2Point.is_in_prime_order_subgroup_many([self])[0]
+
     @staticmethod
-    def msm(points: list["G2Point"], scalars: list[int]) -> "G2Point":
+    def is_in_prime_order_subgroup_many(points: list["G2Point"]) -> list[bool]:
+        """
+        Checks if each point is in the prime order subgroup of G2 with the psi endomorphism criteria
+        psi(Q) == [6x^2]Q on BN curves and psi(Q) == [x]Q on BLS12 curves (El Housni, Guillevic, Piellard,
+        "Co-factor clearing and subgroup membership testing on pairing-friendly curves"; Scott).
+        Done natively in a single garaga_rs call when available, otherwise with Jacobian
+        arithmetic over Fp2, which unlike G2Point.scalar_mul accepts points outside of the subgroup.
+        """
+        if not points:
+            return []
+        curve_id = G2Point._check_same_curve(points)
+        if hasattr(garaga_rs, "g2_subgroup_check_batch"):
+            return garaga_rs.g2_subgroup_check_batch(
+                curve_id.value, [c for Q in points for c in Q._coords()]
+            )
+        curve = CURVES[curve_id.value]
+        k = 6 * curve.x**2 if curve_id == CurveID.BN254 else curve.x
+        res = []
+        for Q in points:
+            if Q.is_infinity():
+                res.append(True)
+                continue
+            psi_Q = Q.psi()
+            kQ = jacobian.scalar_mul_fp2(Q.x, Q.y, k, curve.p)
+            res.append(jacobian.equals_affine_fp2(kQ, psi_Q.x, psi_Q.y, curve.p))
+        return res
+
+    @staticmethod
+    def _check_same_curve(points: list["G2Point"]) -> CurveID:
         assert all(isinstance(p, G2Point) for p in points)
+        curve_id = points[0].curve_id
+        if any(P.curve_id != curve_id for P in points):
+            raise ValueError("Points are not on the same curve")
+        if curve_id.value not in GARAGA_RS_SUPPORTED_CURVES:
+            raise NotImplementedError(
+                "G2 operations are not implemented for this curve"
+            )
+        return curve_id
+
+    @staticmethod
+    def msm(points: list["G2Point"], scalars: list[int]) -> "G2Point":
         assert len(points) == len(scalars)
-        muls = [P.scalar_mul(s) for P, s in zip(points, scalars)]
-        scalar_mul = functools.reduce(lambda acc, p: acc.add(p), muls)
-        return scalar_mul
+        curve_id = G2Point._check_same_curve(points)
+        n = CURVES[curve_id.value].n
+        if (
+            not NATIVE_G2_BATCH
+            or not hasattr(garaga_rs, "g2_msm")
+            or any(abs(s) >= n for s in scalars)
+        ):
+            muls = G2Point.scalar_mul_many(points, scalars)
+            return functools.reduce(lambda acc, p: acc.add(p), muls)
+        # Negative scalars are handled by negating the points.
+        coords = [
+            c
+            for P, s in zip(points, scalars)
+            for c in (P._coords() if s >= 0 else (-P)._coords())
+        ]
+        res = garaga_rs.g2_msm(curve_id.value, coords, [abs(s) for s in scalars])
+        return G2Point._from_native(res, curve_id)
+
+    @staticmethod
+    def add_many(
+        points_a: list["G2Point"], points_b: list["G2Point"]
+    ) -> list["G2Point"]:
+        """
+        Returns the list of the sums points_a[i] + points_b[i], with a single garaga_rs call
+        if the extension provides g2_add_batch.
+        """
+        assert len(points_a) == len(points_b)
+        if not points_a:
+            return []
+        curve_id = G2Point._check_same_curve(points_a + points_b)
+        if not NATIVE_G2_BATCH or not hasattr(garaga_rs, "g2_add_batch"):
+            return [a.add(b) for a, b in zip(points_a, points_b)]
+        res = garaga_rs.g2_add_batch(
+            curve_id.value,
+            [c for P in points_a for c in P._coords()],
+            [c for P in points_b for c in P._coords()],
+        )
+        return G2Point._from_native_list(res, curve_id)
+
+    @staticmethod
+    def scalar_mul_many(points: list["G2Point"], scalars: list[int]) -> list["G2Point"]:
+        """
+        Returns the list of the products scalars[i] * points[i], with a single garaga_rs call
+        if the extension provides g2_scalar_mul_batch.
+        """
+        assert len(points) == len(scalars)
+        if not points:
+            return []
+        curve_id = G2Point._check_same_curve(points)
+        if not NATIVE_G2_BATCH or not hasattr(garaga_rs, "g2_scalar_mul_batch"):
+            return [P.scalar_mul(s) for P, s in zip(points, scalars)]
+        coords = [
+            c
+            for P, s in zip(points, scalars)
+            for c in (P._coords() if s >= 0 else (-P)._coords())
+        ]
+        res = garaga_rs.g2_scalar_mul_batch(
+            curve_id.value, coords, [abs(s) for s in scalars]
+        )
+        return G2Point._from_native_list(res, curve_id)
 
     def to_pyfelt_list(self) -> list[PyFelt]:
         field = get_base_field(self.curve_id.value)
@@ -1027,7 +1442,8 @@ class G1G2Pair:
                 args.append(pair.q.y[0])
                 args.append(pair.q.y[1])
             res = garaga_rs.multi_pairing(curve_id.value, args)
-            return E12(res, curve_id.value)
+            # Pairing results are in the cyclotomic subgroup.
+            return E12(res, curve_id.value, cyclotomic=True)
         else:
             raise NotImplementedError("G1G2Pair.pair is not implemented for this curve")
 
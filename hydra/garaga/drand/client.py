@@ -1,12 +1,14 @@
+import asyncio
 import binascii
+import concurrent.futures
 import hashlib
-import random
+import json
+import os
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Callable, List, Optional, Union
 
-import requests
-from requests.exceptions import RequestException
+import aiohttp
 
 from garaga.definitions import CurveID, Fp2, G1Point, G2Point, get_base_field
 from garaga.hints import io
@@ -57,23 +59,111 @@ BASE_URLS = [
 ]
 
 
-def make_request(endpoint: str) -> requests.Response:
-    base_urls = BASE_URLS.copy()
-    url = random.choice(base_urls)
-    while len(base_urls) > 0:
-        try:
-            response = requests.get(f"{url}{endpoint}")
-            response.raise_for_status()
-            return response
-        except RequestException as e:
-            print(f"Request to {url} failed: {str(e)}. Removing from list.")
-            base_urls.remove(url)
-            if len(base_urls) == 0:
-                raise RequestException("All URLs failed")
-            url = random.choice(base_urls)
+# Finalized rounds are immutable, they are kept there once fetched.
+DRAND_CACHE_DIR = "build/drand_cache"
+REQUEST_TIMEOUT = 10  # seconds
+
+_CHAIN_INFOS: dict[str, "NetworkInfo"] = {}
+
+
+class DrandRequestError(Exception):
+    pass
+
+
+async def _fetch_json(
+    session: aiohttp.ClientSession,
+    url: str,
+    validate: Callable[[dict], bool] | None,
+    expected_type: type = dict,
+) -> dict | list:
+    async with session.get(url) as response:
+        response.raise_for_status()
+        data = await response.json(content_type=None)
+    if not isinstance(data, expected_type):
+        raise ValueError(
+            f"Invalid response from {url}: expected a JSON {expected_type.__name__}"
+        )
+    if validate is not None and not validate(data):
+        raise ValueError(f"Invalid response from {url}")
+    return data
+
+
+async def request_json(
+    endpoint: str,
+    validate: Callable[[dict], bool] | None = None,
+    base_urls: list[str] | None = None,
+    session: aiohttp.ClientSession | None = None,
+    expected_type: type = dict,
+) -> dict | list:
+    """
+    Queries all the mirrors concurrently and returns the first valid JSON response,
+    of type expected_type, cancelling the requests still pending.
+    """
+    base_urls = BASE_URLS if base_urls is None else base_urls
+    if session is None:
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            return await request_json(
+                endpoint, validate, base_urls, session, expected_type
+            )
+
+    tasks = [
+        asyncio.create_task(
+            _fetch_json(
+                session, f"{url.rstrip('/')}{endpoint}", validate, expected_type
+            )
+        )
+        for url in base_urls
+    ]
+    errors = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                return await next_done
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                errors.append(f"{type(e).__name__}: {e}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    raise DrandRequestError(f"All URLs failed for {endpoint}: {errors}")
+
+
+def _round_cache_path(chain_hash: str, round_number: int) -> str:
+    return os.path.join(DRAND_CACHE_DIR, chain_hash, f"{round_number}.json")
+
+
+def load_cached_round(chain_hash: str, round_number: int) -> dict | None:
+    try:
+        with open(_round_cache_path(chain_hash, round_number)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_round(chain_hash: str, data: dict) -> None:
+    """
+    Best effort, as the other build caches : a read-only build directory only disables it.
+    """
+    filename = _round_cache_path(chain_hash, io.to_int(data["round"]))
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        tmp = f"{filename}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, filename)
+    except OSError:
+        pass
 
 
 def deserialize_bls_point(s_string: bytes) -> Union[G1Point, G2Point]:
+    point = _deserialize_bls_point(s_string)
+    if not point.is_in_prime_order_subgroup():
+        raise ValueError("Point is not in the prime order subgroup")
+    return point
+
+
+def _deserialize_bls_point(s_string: bytes) -> Union[G1Point, G2Point]:
     m_byte = s_string[0] & 0xE0
     if m_byte in (0x20, 0x60, 0xE0):
         raise ValueError("Invalid encoding")
@@ -144,9 +234,8 @@ def deserialize_bls_point(s_string: bytes) -> Union[G1Point, G2Point]:
             raise ValueError(f"Invalid length for compressed point: {len(s_string)}")
 
 
-def get_chains() -> List[str]:
-    response = make_request("/chains")
-    all_chains = response.json()
+async def get_chains_async(base_urls: list[str] | None = None) -> List[str]:
+    all_chains = await request_json("/chains", None, base_urls, expected_type=list)
     # only keep chains present in DrandNetwork enum
     chains = [
         chain
@@ -156,9 +245,22 @@ def get_chains() -> List[str]:
     return chains
 
 
-def get_chain_info(chain_hash: str) -> NetworkInfo:
-    response = make_request(f"/{chain_hash}/info")
-    data = response.json()
+async def get_chain_info_async(
+    chain_hash: str,
+    base_urls: list[str] | None = None,
+    session: aiohttp.ClientSession | None = None,
+) -> NetworkInfo:
+    """
+    Returns the info of a chain, memoized per chain hash.
+    """
+    if chain_hash in _CHAIN_INFOS:
+        return _CHAIN_INFOS[chain_hash]
+    data = await request_json(
+        f"/{chain_hash}/info",
+        lambda data: data.get("hash") == chain_hash,
+        base_urls,
+        session,
+    )
 
     # Parse the public key
     public_key_hex = data["public_key"]
@@ -169,7 +271,7 @@ def get_chain_info(chain_hash: str) -> NetworkInfo:
     except Exception as e:
         public_key = G2Point.infinity(CurveID.BLS12_381)
 
-    return NetworkInfo(
+    info = NetworkInfo(
         public_key=public_key,
         period=data["period"],
         genesis_time=data["genesis_time"],
@@ -178,16 +280,102 @@ def get_chain_info(chain_hash: str) -> NetworkInfo:
         scheme_id=data["schemeID"],
         beacon_id=data.get("metadata", {}).get("beaconID"),
     )
+    _CHAIN_INFOS[chain_hash] = info
+    return info
+
+
+async def get_latest_randomness_async(
+    chain_hash: str,
+    base_urls: list[str] | None = None,
+    session: aiohttp.ClientSession | None = None,
+) -> RandomnessBeacon:
+    data = await request_json(
+        f"/{chain_hash}/public/latest",
+        lambda data: "round" in data and "signature" in data,
+        base_urls,
+        session,
+    )
+    save_round(chain_hash, data)
+    return _parse_randomness_beacon(data)
+
+
+async def get_randomness_async(
+    chain_hash: str,
+    round_number: int,
+    base_urls: list[str] | None = None,
+    session: aiohttp.ClientSession | None = None,
+) -> RandomnessBeacon:
+    """
+    Returns the beacon of a round, from the local cache if it was already fetched.
+    """
+    data = load_cached_round(chain_hash, round_number)
+    if data is None:
+        data = await request_json(
+            f"/{chain_hash}/public/{round_number}",
+            lambda data: data.get("round") == round_number and "signature" in data,
+            base_urls,
+            session,
+        )
+        save_round(chain_hash, data)
+    return _parse_randomness_beacon(data)
+
+
+async def get_randomness_many_async(
+    chain_hash: str,
+    round_numbers: list[int],
+    base_urls: list[str] | None = None,
+    max_concurrency: int = 32,
+) -> list[RandomnessBeacon]:
+    """
+    Fetches many rounds concurrently over a single session, at most max_concurrency
+    of them in flight at once. Results are in the order of round_numbers.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+
+        async def fetch(round_number: int) -> RandomnessBeacon:
+            async with semaphore:
+                return await get_randomness_async(
+                    chain_hash, round_number, base_urls, session
+                )
+
+        return await asyncio.gather(*(fetch(r) for r in round_numbers))
+
+
+def _run_sync(coro):
+    """
+    Runs a coroutine to completion, in a separate thread when called from a running
+    event loop (asyncio.run can't be nested).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def get_chains() -> List[str]:
+    return _run_sync(get_chains_async())
+
+
+def get_chain_info(chain_hash: str) -> NetworkInfo:
+    return _run_sync(get_chain_info_async(chain_hash))
 
 
 def get_latest_randomness(chain_hash: str) -> RandomnessBeacon:
-    response = make_request(f"/{chain_hash}/public/latest")
-    return _parse_randomness_beacon(response.json())
+    return _run_sync(get_latest_randomness_async(chain_hash))
 
 
 def get_randomness(chain_hash: str, round_number: int) -> RandomnessBeacon:
-    response = make_request(f"/{chain_hash}/public/{round_number}")
-    return _parse_randomness_beacon(response.json())
+    return _run_sync(get_randomness_async(chain_hash, round_number))
+
+
+def get_randomness_many(
+    chain_hash: str, round_numbers: list[int]
+) -> list[RandomnessBeacon]:
+    return _run_sync(get_randomness_many_async(chain_hash, round_numbers))
 
 
 def _parse_randomness_beacon(data: dict) -> RandomnessBeacon:
@@ -4,7 +4,15 @@ import functools
 from dataclasses import dataclass
 
 from garaga import garaga_rs
-from garaga.algebra import Fp2, FunctionFelt, Polynomial, PyFelt, RationalFunction, T
+from garaga.algebra import (
+    Fp2,
+    FunctionFelt,
+    IntPolynomial,
+    Polynomial,
+    PyFelt,
+    RationalFunction,
+    T,
+)
 from garaga.definitions import CURVES, CurveID, G1Point, G2Point, get_base_field
 from garaga.hints.neg_3 import (
     construct_digit_vectors,
@@ -147,15 +155,16 @@ def zk_ecip_hint(
             pts, list(scalars), c_id.value
         )
 
-        a_num = [field(f) for f in a_num] if len(a_num) > 0 else [field.zero()]
-        a_den = [field(f) for f in a_den] if len(a_den) > 0 else [field.one()]
-        b_num = [field(f) for f in b_num] if len(b_num) > 0 else [field.zero()]
-        b_den = [field(f) for f in b_den] if len(b_den) > 0 else [field.one()]
+        p = field.p
+        a_num = [f % p for f in a_num]
+        a_den = [f % p for f in a_den] if len(a_den) > 0 else [1]
+        b_num = [f % p for f in b_num]
+        b_den = [f % p for f in b_den] if len(b_den) > 0 else [1]
 
-        Q = G1Point(q[0], q[1], c_id)
+        Q = G1Point.trusted(q[0], q[1], c_id)
         sum_dlog = FunctionFelt(
-            RationalFunction(Polynomial(a_num), Polynomial(a_den)),
-            RationalFunction(Polynomial(b_num), Polynomial(b_den)),
+            RationalFunction(IntPolynomial(a_num, p), IntPolynomial(a_den, p)),
+            RationalFunction(IntPolynomial(b_num, p), IntPolynomial(b_den, p)),
         )
     else:
         dss = construct_digit_vectors(scalars)
@@ -614,10 +623,15 @@ def dlog(d: FF) -> FunctionFelt:
     ].is_zero(), f"Den[1] is not zero: {Den_FF[1].print_as_sage_poly('x')}"
 
     Den: Polynomial = Den_FF[0]
+    Num = [Num[0], Num[1]]
+    if d.type == PyFelt:
+        # Only the (large) gcd and divisions remain, run them on int coefficients.
+        Den = IntPolynomial.from_polynomial(Den)
+        Num = [IntPolynomial.from_polynomial(N) for N in Num]
 
-    _, _, gcd_0 = Polynomial.xgcd(Num[0], Den)
+    _, _, gcd_0 = type(Den).xgcd(Num[0], Den)
     # print(f"GCD_0: {gcd_0.print_as_sage_poly('x')}")
-    _, _, gcd_1 = Polynomial.xgcd(Num[1], Den)
+    _, _, gcd_1 = type(Den).xgcd(Num[1], Den)
     # print(f"GCD_1: {gcd_1.print_as_sage_poly('x')}")
 
     # Simplify the numerator and denominator by dividing by the gcd
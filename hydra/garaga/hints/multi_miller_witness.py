@@ -2,7 +2,14 @@ import math
 
 from garaga import garaga_rs
 from garaga.algebra import PyFelt
-from garaga.definitions import CURVES, CurveID, G1G2Pair, G1Point, G2Point
+from garaga.definitions import (
+    BN254_FROBENIUS_CONSTANTS,
+    CURVES,
+    CurveID,
+    G1G2Pair,
+    G1Point,
+    G2Point,
+)
 from garaga.hints.tower_backup import E12
 
 
@@ -23,6 +30,185 @@ def get_final_exp_witness(curve_id: int, f: E12) -> tuple[E12, E12]:
     return c, wi
 
 
+def multi_miller_loop(
+    curve_id: int,
+    P: list[tuple[int, int]],
+    Q: list[tuple[tuple[int, int], tuple[int, int]]],
+) -> list[int]:
+    """
+    Computes the output of the Miller loop of MultiMillerLoopCircuit on plain integers, without tracing a circuit.
+    Returns the 12 coefficients of f in direct (polynomial) representation.
+
+    The result matches MultiMillerLoopCircuit.miller_loop exactly (same affine lines, same line scaling by
+    1/y_P and -x_P/y_P, same final step), which is required for the final exponentiation witnesses of the
+    MPCheck circuits. Note that garaga_rs.multi_miller_loop (arkworks) returns a different representative
+    of the same class, that only agrees after the final exponentiation.
+    """
+    assert len(P) == len(Q) > 0, "P and Q must have the same length > 0"
+    curve = CURVES[curve_id]
+    p = curve.p
+    irr = curve.irreducible_polys[12]
+    irr0, irr6 = irr[0] % p, irr[6] % p
+
+    def fp2_mul(a, b):
+        t0 = a[0] * b[0]
+        t1 = a[1] * b[1]
+        return ((t0 - t1) % p, ((a[0] + a[1]) * (b[0] + b[1]) - t0 - t1) % p)
+
+    def fp2_square(a):
+        return ((a[0] + a[1]) * (a[0] - a[1]) % p, 2 * a[0] * a[1] % p)
+
+    def fp2_div(a, b):
+        inv = pow(b[0] * b[0] + b[1] * b[1], -1, p)
+        return fp2_mul(a, (b[0] * inv % p, -b[1] * inv % p))
+
+    def fp2_sub(a, b):
+        return ((a[0] - b[0]) % p, (a[1] - b[1]) % p)
+
+    def fp2_add(a, b):
+        return ((a[0] + b[0]) % p, (a[1] + b[1]) % p)
+
+    def extf_mul(x, y):
+        # Product of polynomials in w, reduced modulo w^12 + irr6 * w^6 + irr0.
+        r = [0] * 23
+        for i, xi in enumerate(x):
+            if xi:
+                for j, yj in enumerate(y):
+                    if yj:
+                        r[i + j] += xi * yj
+        for k in range(22, 11, -1):
+            t = r[k] % p
+            if t:
+                r[k - 12] -= t * irr0
+                r[k - 6] -= t * irr6
+        return [c % p for c in r[:12]]
+
+    y_inv = [pow(yP, -1, p) for _, yP in P]
+    x_neg_over_y = [-xP * yi % p for (xP, _), yi in zip(P, y_inv)]
+
+    if curve_id == CurveID.BN254.value:
+
+        def line(k, R0, R1):
+            a, b = x_neg_over_y[k], y_inv[k]
+            l = [0] * 12
+            l[0] = 1
+            l[1] = (R0[0] - 9 * R0[1]) * a % p
+            l[3] = (R1[0] - 9 * R1[1]) * b % p
+            l[7] = R0[1] * a % p
+            l[9] = R1[1] * b % p
+            return l
+
+    elif curve_id == CurveID.BLS12_381.value:
+
+        def line(k, R0, R1):
+            a, b = x_neg_over_y[k], y_inv[k]
+            l = [0] * 12
+            l[0] = (R1[0] - R1[1]) * b % p
+            l[2] = (R0[0] - R0[1]) * a % p
+            l[3] = 1
+            l[6] = R1[1] * b % p
+            l[8] = R0[1] * a % p
+            return l
+
+    else:
+        raise NotImplementedError(f"Curve {curve_id} not implemented")
+
+    def line_through(λ, T):
+        # Line of slope λ going through T, as (R0, R1) = (λ, λ * x_T - y_T)
+        return λ, fp2_sub(fp2_mul(λ, T[0]), T[1])
+
+    def double(T):
+        λ = fp2_div(
+            (
+                3 * (T[0][0] + T[0][1]) * (T[0][0] - T[0][1]) % p,
+                6 * T[0][0] * T[0][1] % p,
+            ),
+            fp2_add(T[1], T[1]),
+        )
+        xr = fp2_sub(fp2_square(λ), fp2_add(T[0], T[0]))
+        yr = fp2_sub(fp2_mul(λ, fp2_sub(T[0], xr)), T[1])
+        return (xr, yr), [line_through(λ, T)]
+
+    def double_and_add(T, S):
+        # 2T + S computed as (T + S) + T
+        λ1 = fp2_div(fp2_sub(T[1], S[1]), fp2_sub(T[0], S[0]))
+        x3 = fp2_sub(fp2_square(λ1), fp2_add(T[0], S[0]))
+        λ2 = fp2_sub(
+            (0, 0), fp2_add(λ1, fp2_div(fp2_add(T[1], T[1]), fp2_sub(x3, T[0])))
+        )
+        x4 = fp2_sub(fp2_sub(fp2_square(λ2), T[0]), x3)
+        y4 = fp2_sub(fp2_mul(λ2, fp2_sub(T[0], x4)), T[1])
+        return (x4, y4), [line_through(λ1, T), line_through(λ2, T)]
+
+    def triple(T):
+        den = fp2_add(T[1], T[1])
+        λ1 = fp2_div(
+            (
+                3 * (T[0][0] + T[0][1]) * (T[0][0] - T[0][1]) % p,
+                6 * T[0][0] * T[0][1] % p,
+            ),
+            den,
+        )
+        x2 = fp2_sub(fp2_square(λ1), fp2_add(T[0], T[0]))
+        λ2 = fp2_sub(fp2_div(den, fp2_sub(T[0], x2)), λ1)
+        xr = fp2_sub(fp2_square(λ2), fp2_add(T[0], x2))
+        yr = fp2_sub(fp2_mul(λ2, fp2_sub(T[0], xr)), T[1])
+        return (xr, yr), [line_through(λ1, T), line_through(λ2, T)]
+
+    def step(f, Ts, op, *args):
+        new_f = extf_mul(f, f)
+        new_Ts = []
+        for k, T in enumerate(Ts):
+            T, lines = op(T, *(a[k] for a in args))
+            for R0, R1 in lines:
+                new_f = extf_mul(new_f, line(k, R0, R1))
+            new_Ts.append(T)
+        return new_f, new_Ts
+
+    Q = [((x[0] % p, x[1] % p), (y[0] % p, y[1] % p)) for x, y in Q]
+    Q_neg = [(x, ((-y[0]) % p, (-y[1]) % p)) for x, y in Q]
+    loop_counter = curve.loop_counter
+    start_index = len(loop_counter) - 2
+
+    f = [1] + [0] * 11
+    if loop_counter[start_index] == 1:
+        f, Ts = step(f, Q, triple)
+    elif loop_counter[start_index] == 0:
+        f, Ts = step(f, Q, double)
+    else:
+        raise NotImplementedError(
+            f"Init bit {loop_counter[start_index]} not implemented"
+        )
+
+    for i in range(start_index - 1, -1, -1):
+        if loop_counter[i] == 0:
+            f, Ts = step(f, Ts, double)
+        elif loop_counter[i] == 1:
+            f, Ts = step(f, Ts, double_and_add, Q)
+        elif loop_counter[i] == -1:
+            f, Ts = step(f, Ts, double_and_add, Q_neg)
+        else:
+            raise NotImplementedError(f"Bit {loop_counter[i]} not implemented")
+
+    if curve_id == CurveID.BN254.value:
+        nr1p2, nr1p3, nr2p2, nr2p3 = BN254_FROBENIUS_CONSTANTS
+        for k, (T, (x, y)) in enumerate(zip(Ts, Q)):
+            q1x = fp2_mul((x[0], -x[1] % p), nr1p2)
+            q1y = fp2_mul((y[0], -y[1] % p), nr1p3)
+            q2x = (x[0] * nr2p2 % p, x[1] * nr2p2 % p)
+            q2y = (y[0] * nr2p3 % p, y[1] * nr2p3 % p)
+            λ1 = fp2_div(fp2_sub(T[1], q1y), fp2_sub(T[0], q1x))
+            xr = fp2_sub(fp2_square(λ1), fp2_add(T[0], q1x))
+            yr = fp2_sub(fp2_mul(λ1, fp2_sub(T[0], xr)), T[1])
+            λ2 = fp2_div(fp2_sub(yr, q2y), fp2_sub(xr, q2x))
+            f = extf_mul(f, line(k, *line_through(λ1, T)))
+            f = extf_mul(f, line(k, *line_through(λ2, (xr, yr))))
+    elif curve_id == CurveID.BLS12_381.value:
+        f = [c if i % 2 == 0 else -c % p for i, c in enumerate(f)]
+
+    return f
+
+
 def get_lambda(curve_id: CurveID) -> int:
     x = CURVES[curve_id.value].x
     q = CURVES[curve_id.value].p
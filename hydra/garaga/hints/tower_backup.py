@@ -3,10 +3,35 @@ Tower based arithmetic for BN254 and BLS12-381 on Fq2, Fq6, Fq12.
 """
 
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from garaga import garaga_rs
 from garaga.algebra import ModuloCircuitElement, Polynomial, PyFelt
-from garaga.definitions import CURVES, direct_to_tower, get_base_field, tower_to_direct
+from garaga.definitions import (
+    CURVES,
+    GARAGA_RS_SUPPORTED_CURVES,
+    direct_to_tower,
+    get_base_field,
+    tower_to_direct,
+)
+
+# Whether multiplications, squarings, inversions and exponentiations of E6 and E12 elements go
+# through the garaga_rs tower arithmetic (for supported curves), when the extension provides it.
+# E2 operations stay in Python, where they cost less than the conversions of a native call.
+NATIVE_TOWER = True
+
+
+# Whether E12.cyclotomic_pow goes through garaga_rs.e12_cyclotomic_exp. Off until the native
+# exponentiation is tested against the Python one.
+NATIVE_CYCLOTOMIC_EXP = False
+
+
+def use_native_tower(curve_id: int) -> bool:
+    return (
+        NATIVE_TOWER
+        and curve_id in GARAGA_RS_SUPPORTED_CURVES
+        and hasattr(garaga_rs, "tower_mul")
+    )
 
 
 @dataclass(slots=True)
@@ -233,6 +258,13 @@ class E6:
         return E6([-self.b0, -self.b1, -self.b2], self.curve_id)
 
     def __mul__(self, other):
+        if use_native_tower(self.curve_id):
+            return E6(
+                garaga_rs.tower_mul(
+                    self.curve_id, self.value_coeffs, other.value_coeffs
+                ),
+                self.curve_id,
+            )
         x0, x1, x2 = self.b0, self.b1, self.b2
         y0, y1, y2 = other.b0, other.b1, other.b2
 
@@ -249,6 +281,10 @@ class E6:
         return self.__mul__(other)
 
     def __inv__(self):
+        if use_native_tower(self.curve_id):
+            return E6(
+                garaga_rs.tower_inv(self.curve_id, self.value_coeffs), self.curve_id
+            )
         t0, t1, t2 = self.b0 * self.b0, self.b1 * self.b1, self.b2 * self.b2
         t3, t4, t5 = self.b0 * self.b1, self.b0 * self.b2, self.b1 * self.b2
         c0 = t0 - self.non_residue * t5
@@ -298,6 +334,10 @@ class E6:
             return self
         elif p < 0:
             return self.__inv__() ** (-p)
+        elif use_native_tower(self.curve_id):
+            return E6(
+                garaga_rs.tower_pow(self.curve_id, self.value_coeffs, p), self.curve_id
+            )
 
         # Start the computation.
         result = self.one(
@@ -319,9 +359,13 @@ class E12:
     c0: E6
     c1: E6
     curve_id: int
+    # Whether the element is known to be in the cyclotomic subgroup (x^(p^6 + 1) = 1),
+    # as pairing results are. Enables cyclotomic_square and cyclotomic_pow in __pow__.
+    cyclotomic: bool = field(default=False, compare=False)
 
-    def __init__(self, x: list[PyFelt | E6], curve_id: int):
+    def __init__(self, x: list[PyFelt | E6], curve_id: int, cyclotomic: bool = False):
         self.curve_id = curve_id
+        self.cyclotomic = cyclotomic
         if isinstance(x[0], (PyFelt, int)) and len(x) == 12:
             self.c0 = E6(x=x[0:6], curve_id=curve_id)
             self.c1 = E6(x=x[6:12], curve_id=curve_id)
@@ -404,6 +448,14 @@ class E12:
         return E12([field(random.randint(0, field.p - 1)) for _ in range(12)], curve_id)
 
     def __mul__(self, other):
+        if use_native_tower(self.curve_id):
+            return E12(
+                garaga_rs.tower_mul(
+                    self.curve_id, self.value_coeffs, other.value_coeffs
+                ),
+                self.curve_id,
+                self.cyclotomic and other.cyclotomic,
+            )
         a = self.c0 + self.c1
         b = other.c0 + other.c1
         a = a * b
@@ -412,12 +464,18 @@ class E12:
         z1 = a - b - c
         c = c.mul_by_non_residue()
         z0 = c + b
-        return E12([z0, z1], self.curve_id)
+        return E12([z0, z1], self.curve_id, self.cyclotomic and other.cyclotomic)
 
     def conjugate(self):
-        return E12([self.c0, -self.c1], self.curve_id)
+        return E12([self.c0, -self.c1], self.curve_id, self.cyclotomic)
 
     def square(self):
+        if use_native_tower(self.curve_id):
+            return E12(
+                garaga_rs.tower_square(self.curve_id, self.value_coeffs),
+                self.curve_id,
+                self.cyclotomic,
+            )
         c0 = self.c0 - self.c1
         c3 = -(self.c1.mul_by_non_residue()) + self.c0
         c2 = self.c0 * self.c1
@@ -425,16 +483,125 @@ class E12:
         c1 = c2 + c2
         c2 = c2.mul_by_non_residue()
         c0 = c0 + c2
-        return E12([c0, c1], self.curve_id)
+        return E12([c0, c1], self.curve_id, self.cyclotomic)
+
+    def cyclotomic_square(self):
+        """
+        Granger-Scott squaring of an element of the cyclotomic subgroup, with 6 E2 squarings
+        instead of the 2 E6 multiplications of square.
+        """
+        p = self.c0.b0.p
+        n0, n1 = self.c0.non_residue.a0, self.c0.non_residue.a1
+        x = self.value_coeffs
+
+        def sq(a0, a1):
+            return ((a0 + a1) * (a0 - a1), 2 * a0 * a1)
+
+        def mul_nr(a0, a1):
+            return (a0 * n0 - a1 * n1, a0 * n1 + a1 * n0)
+
+        # Coefficients (c0.b0, c0.b1, c0.b2, c1.b0, c1.b1, c1.b2) = (x0, ..., x5).
+        x0, x1, x2 = (x[0], x[1]), (x[2], x[3]), (x[4], x[5])
+        x3, x4, x5 = (x[6], x[7]), (x[8], x[9]), (x[10], x[11])
+
+        t0 = sq(*x4)
+        t1 = sq(*x0)
+        t6 = sq(x4[0] + x0[0], x4[1] + x0[1])  # 2 * x4 * x0 = t6 - t0 - t1
+        t6 = (t6[0] - t0[0] - t1[0], t6[1] - t0[1] - t1[1])
+        t2 = sq(*x2)
+        t3 = sq(*x3)
+        t7 = sq(x2[0] + x3[0], x2[1] + x3[1])  # 2 * x2 * x3
+        t7 = (t7[0] - t2[0] - t3[0], t7[1] - t2[1] - t3[1])
+        t4 = sq(*x5)
+        t5 = sq(*x1)
+        t8 = sq(x5[0] + x1[0], x5[1] + x1[1])  # 2 * x5 * x1 * nr
+        t8 = mul_nr(t8[0] - t4[0] - t5[0], t8[1] - t4[1] - t5[1])
+
+        t0 = mul_nr(*t0)  # x4^2 * nr + x0^2
+        t0 = (t0[0] + t1[0], t0[1] + t1[1])
+        t2 = mul_nr(*t2)  # x2^2 * nr + x3^2
+        t2 = (t2[0] + t3[0], t2[1] + t3[1])
+        t4 = mul_nr(*t4)  # x5^2 * nr + x1^2
+        t4 = (t4[0] + t5[0], t4[1] + t5[1])
+
+        # z = 3 * t - 2 * x for the c0 coefficients and 3 * t + 2 * x for the c1 coefficients.
+        coeffs = [
+            (3 * t[k] + 2 * sign * xi[k]) % p
+            for t, xi, sign in (
+                (t0, x0, -1),
+                (t2, x1, -1),
+                (t4, x2, -1),
+                (t8, x3, 1),
+                (t6, x4, 1),
+                (t7, x5, 1),
+            )
+            for k in (0, 1)
+        ]
+        return E12(coeffs, self.curve_id, True)
+
+    def cyclotomic_pow(self, e: int):
+        """
+        Exponentiation of an element of the cyclotomic subgroup, where the inverse is the conjugate.
+        Runs natively through garaga_rs if NATIVE_CYCLOTOMIC_EXP is set, otherwise with cyclotomic
+        squarings and a width-4 signed window (NAF) recoding of the exponent.
+        """
+        if e < 0:
+            return self.conjugate().cyclotomic_pow(-e)
+        if e == 0:
+            one = E12.one(self.curve_id)
+            one.cyclotomic = True
+            return one
+        if (
+            NATIVE_CYCLOTOMIC_EXP
+            and self.curve_id in GARAGA_RS_SUPPORTED_CURVES
+            and hasattr(garaga_rs, "e12_cyclotomic_exp")
+        ):
+            res = garaga_rs.e12_cyclotomic_exp(self.curve_id, self.value_coeffs, e)
+            return E12(res, self.curve_id, True)
+
+        # Odd powers x, x^3, ..., x^7.
+        x2 = self.cyclotomic_square()
+        odd_powers = [self]
+        for _ in range(3):
+            odd_powers.append(odd_powers[-1] * x2)
+
+        digits = []
+        while e:
+            if e & 1:
+                d = e & 15
+                if d > 8:
+                    d -= 16
+                e -= d
+            else:
+                d = 0
+            digits.append(d)
+            e >>= 1
+
+        result = None
+        for d in reversed(digits):
+            if result is not None:
+                result = result.cyclotomic_square()
+            if d:
+                term = odd_powers[abs(d) >> 1]
+                if d < 0:
+                    term = term.conjugate()
+                result = term if result is None else result * term
+        return result
 
     def __inv__(self):
+        if use_native_tower(self.curve_id):
+            return E12(
+                garaga_rs.tower_inv(self.curve_id, self.value_coeffs),
+                self.curve_id,
+                self.cyclotomic,
+            )
         t0, t1 = self.c0 * self.c0, self.c1 * self.c1
         tmp = t1.mul_by_non_residue()
         t0 = t0 - tmp
         t1 = t0.__inv__()
         c0 = self.c0 * t1
         c1 = -self.c1 * t1
-        return E12([c0, c1], curve_id=self.curve_id)
+        return E12([c0, c1], curve_id=self.curve_id, cyclotomic=self.cyclotomic)
 
     def div(self, other):
         if isinstance(other, E12):
@@ -443,7 +610,8 @@ class E12:
 
     def __pow__(self, p: int):
         """
-        Compute x**p in F_p^12 using square-and-multiply algorithm.
+        Compute x**p in F_p^12 using square-and-multiply algorithm,
+        or cyclotomic_pow if x is known to be in the cyclotomic subgroup.
         Args:
         p: The exponent, a non-negative integer.
         Returns:
@@ -451,6 +619,9 @@ class E12:
         """
         assert isinstance(p, int), f"Invalid exponent {p=}"
 
+        if self.cyclotomic:
+            return self.cyclotomic_pow(p)
+
         # Handle the easy cases.
         if p == 0:
             # x**0 = 1, where 1 is the multiplicative identity in F_p^2.
@@ -460,6 +631,10 @@ class E12:
             return self
         elif p < 0:
             return self.__inv__() ** (-p)
+        elif use_native_tower(self.curve_id):
+            return E12(
+                garaga_rs.tower_pow(self.curve_id, self.value_coeffs, p), self.curve_id
+            )
 
         # Start the computation.
         result = self.one(
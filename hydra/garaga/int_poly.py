@@ -0,0 +1,421 @@
+"""
+Polynomial arithmetic on plain lists of integer coefficients modulo a prime p, lowest degree first.
+Inputs are expected to be reduced in [0, p). Outputs are reduced and NOT trimmed:
+the product of polynomials of lengths n and m always has length n + m - 1.
+
+These kernels back the Polynomial class for PyFelt coefficients, where allocating a PyFelt
+per intermediate product dominates the cost of the naive loops.
+"""
+
+# Below this size (of the smallest operand), the schoolbook product is the fastest.
+KARATSUBA_THRESHOLD = 24
+# Above this size (of the smallest operand), pack the polynomials into big integers
+# and let CPython's big integer multiplication (itself Karatsuba) do the work.
+KRONECKER_THRESHOLD = 64
+# Above this size (of the quotient and the divisor), divide with a Newton inversion
+# of the reversed divisor.
+NEWTON_DIVISION_THRESHOLD = 64
+# Above this degree, the extended gcd uses the half-gcd algorithm.
+HGCD_THRESHOLD = 256
+# Above this number of points, evaluate and interpolate with a subproduct tree.
+MULTIPOINT_THRESHOLD = 256
+
+
+def mul(a: list[int], b: list[int], p: int) -> list[int]:
+    """
+    Multiplies two polynomials with coefficients in [0, p).
+    Dispatches to schoolbook, Karatsuba or Kronecker substitution depending on the sizes.
+    """
+    if not a or not b:
+        return []
+    n = min(len(a), len(b))
+    if n < KARATSUBA_THRESHOLD:
+        return mul_schoolbook(a, b, p)
+    if n < KRONECKER_THRESHOLD:
+        return mul_karatsuba(a, b, p)
+    return mul_kronecker(a, b, p)
+
+
+def mul_schoolbook(a: list[int], b: list[int], p: int) -> list[int]:
+    if not a or not b:
+        return []
+    buf = [0] * (len(a) + len(b) - 1)
+    for i, ai in enumerate(a):
+        if ai == 0:
+            continue  # optimization for sparse polynomials
+        for j, bj in enumerate(b):
+            buf[i + j] += ai * bj
+    return [c % p for c in buf]
+
+
+def mul_karatsuba(a: list[int], b: list[int], p: int) -> list[int]:
+    if not a or not b:
+        return []
+    return [c % p for c in _karatsuba(a, b)]
+
+
+def _karatsuba(a: list[int], b: list[int]) -> list[int]:
+    """
+    Unreduced Karatsuba product. Intermediate coefficients may be negative or larger than p.
+    """
+    n, m = len(a), len(b)
+    if min(n, m) < KARATSUBA_THRESHOLD:
+        buf = [0] * (n + m - 1)
+        for i, ai in enumerate(a):
+            if ai == 0:
+                continue
+            for j, bj in enumerate(b):
+                buf[i + j] += ai * bj
+        return buf
+    if n != m:
+        # Unbalanced operands : split the largest one in chunks of the size of the smallest.
+        if n < m:
+            a, b, n, m = b, a, m, n
+        res = [0] * (n + m - 1)
+        for k in range(0, n, m):
+            for i, c in enumerate(_karatsuba(a[k : k + m], b)):
+                res[k + i] += c
+        return res
+
+    h = n // 2
+    a0, a1 = a[:h], a[h:]
+    b0, b1 = b[:h], b[h:]
+    z0 = _karatsuba(a0, b0)
+    z2 = _karatsuba(a1, b1)
+    sa = [x + y for x, y in zip(a1, a0)] + a1[h:]
+    sb = [x + y for x, y in zip(b1, b0)] + b1[h:]
+    z1 = _karatsuba(sa, sb)
+
+    res = [0] * (2 * n - 1)
+    for i, c in enumerate(z0):
+        res[i] += c
+        z1[i] -= c
+    for i, c in enumerate(z2):
+        res[i + 2 * h] += c
+        z1[i] -= c
+    for i, c in enumerate(z1):
+        if i + h < len(res):
+            res[i + h] += c
+    return res
+
+
+def mul_kronecker(a: list[int], b: list[int], p: int) -> list[int]:
+    """
+    Kronecker substitution : evaluates both polynomials at X = 2^(8 * width), multiplies the two
+    big integers and reads the coefficients of the product back, width being large enough
+    so that no coefficient of the unreduced product overflows into the next one.
+    """
+    if not a or not b:
+        return []
+    n_out = len(a) + len(b) - 1
+    width = (2 * (p - 1).bit_length() + min(len(a), len(b)).bit_length() + 7) // 8
+    x = int.from_bytes(b"".join(c.to_bytes(width, "little") for c in a), "little")
+    y = int.from_bytes(b"".join(c.to_bytes(width, "little") for c in b), "little")
+    z = (x * y).to_bytes(n_out * width, "little")
+    return [
+        int.from_bytes(z[i : i + width], "little") % p
+        for i in range(0, n_out * width, width)
+    ]
+
+
+def trim(a: list[int]) -> list[int]:
+    """
+    Removes the trailing zero coefficients in place and returns a. The zero polynomial is [].
+    """
+    while a and a[-1] == 0:
+        a.pop()
+    return a
+
+
+def add(a: list[int], b: list[int], p: int) -> list[int]:
+    if len(a) < len(b):
+        a, b = b, a
+    res = a[:]
+    for i, c in enumerate(b):
+        res[i] = (res[i] + c) % p
+    return res
+
+
+def sub(a: list[int], b: list[int], p: int) -> list[int]:
+    res = a + [0] * (len(b) - len(a))
+    for i, c in enumerate(b):
+        res[i] = (res[i] - c) % p
+    return res
+
+
+def scale(a: list[int], c: int, p: int) -> list[int]:
+    return [x * c % p for x in a]
+
+
+def divmod_(a: list[int], b: list[int], p: int) -> tuple[list[int], list[int]]:
+    """
+    Euclidean division of a by b. b must be trimmed and non zero.
+    Returns the trimmed quotient and remainder.
+    """
+    if not b:
+        raise ValueError("Cannot divide by zero polynomial")
+    a = trim(a[:])
+    if len(a) < len(b):
+        return [], a
+    if min(len(a) - len(b) + 1, len(b)) >= NEWTON_DIVISION_THRESHOLD:
+        return divmod_newton(a, b, p)
+    return divmod_schoolbook(a, b, p)
+
+
+def divmod_schoolbook(
+    a: list[int], b: list[int], p: int
+) -> tuple[list[int], list[int]]:
+    a = trim(a[:])
+    db = len(b) - 1
+    if len(a) <= db:
+        return [], a
+    inv = pow(b[-1], -1, p)
+    r = a[:]
+    q = [0] * (len(a) - db)
+    for k in range(len(a) - 1, db - 1, -1):
+        c = r[k] % p
+        if c == 0:
+            continue
+        c = c * inv % p
+        q[k - db] = c
+        shift = k - db
+        for j in range(db):
+            r[shift + j] -= c * b[j]
+    return trim(q), trim([x % p for x in r[:db]])
+
+
+def inverse_series(f: list[int], n: int, p: int) -> list[int]:
+    """
+    Returns g such that f * g = 1 mod X^n, with Newton iteration g <- g * (2 - f * g).
+    f[0] must be invertible.
+    """
+    g = [pow(f[0], -1, p)]
+    k = 1
+    while k < n:
+        k = min(2 * k, n)
+        e = mul(f[:k], g, p)[:k]
+        e = [-c % p for c in e]
+        e[0] = (e[0] + 2) % p
+        g = mul(g, e, p)[:k]
+    return g
+
+
+def divmod_newton(a: list[int], b: list[int], p: int) -> tuple[list[int], list[int]]:
+    """
+    Euclidean division with the reversed polynomials :
+    rev(q) = rev(a) / rev(b) mod X^(deg a - deg b + 1), then r = a - q * b.
+    """
+    a = trim(a[:])
+    if len(a) < len(b):
+        return [], a
+    m = len(a) - len(b) + 1
+    rev_b_inv = inverse_series(b[::-1], m, p)
+    q = mul(a[::-1][:m], rev_b_inv, p)[:m][::-1]
+    qb = mul(q, b, p)
+    r = [(x - y) % p for x, y in zip(a[: len(b) - 1], qb)]
+    return trim(q), trim(r)
+
+
+_IDENTITY = ([1], [], [], [1])
+
+
+def _mat_mul(
+    A: tuple[list[int], list[int], list[int], list[int]],
+    B: tuple[list[int], list[int], list[int], list[int]],
+    p: int,
+) -> tuple[list[int], list[int], list[int], list[int]]:
+    """
+    Product of 2x2 matrices of polynomials, stored as (m00, m01, m10, m11).
+    """
+    return (
+        trim(add(mul(A[0], B[0], p), mul(A[1], B[2], p), p)),
+        trim(add(mul(A[0], B[1], p), mul(A[1], B[3], p), p)),
+        trim(add(mul(A[2], B[0], p), mul(A[3], B[2], p), p)),
+        trim(add(mul(A[2], B[1], p), mul(A[3], B[3], p), p)),
+    )
+
+
+def _mat_apply(
+    M: tuple[list[int], list[int], list[int], list[int]],
+    a: list[int],
+    b: list[int],
+    p: int,
+) -> tuple[list[int], list[int]]:
+    return (
+        trim(add(mul(M[0], a, p), mul(M[1], b, p), p)),
+        trim(add(mul(M[2], a, p), mul(M[3], b, p), p)),
+    )
+
+
+def _quotient_step(
+    q: list[int],
+    M: tuple[list[int], list[int], list[int], list[int]],
+    p: int,
+) -> tuple[list[int], list[int], list[int], list[int]]:
+    """
+    Multiplies M on the left by the quotient matrix [[0, 1], [1, -q]] of the Euclidean step
+    (a, b) -> (b, a - q * b).
+    """
+    return (
+        M[2],
+        M[3],
+        trim(sub(M[0], mul(q, M[2], p), p)),
+        trim(sub(M[1], mul(q, M[3], p), p)),
+    )
+
+
+def hgcd(
+    a: list[int], b: list[int], p: int
+) -> tuple[list[int], list[int], list[int], list[int]]:
+    """
+    Half-gcd of trimmed a, b with deg a > deg b.
+    Returns the product M of the quotient matrices of the Euclidean remainder sequence of (a, b)
+    up to the first remainders (c, d) = M * (a, b) with deg c >= ceil(deg a / 2) > deg d.
+    """
+    m = len(a) // 2  # ceil(deg a / 2)
+    if len(b) - 1 < m:
+        return _IDENTITY
+    if len(a) - 1 <= HGCD_THRESHOLD:
+        # Small sizes : run the Euclidean steps one by one.
+        R = _IDENTITY
+        while len(b) - 1 >= m:
+            q, r = divmod_(a, b, p)
+            R = _quotient_step(q, R, p)
+            a, b = b, r
+        return R
+    R = hgcd(a[m:], b[m:], p)
+    c, d = _mat_apply(R, a, b, p)
+    if len(d) - 1 < m:
+        return R
+    q, r = divmod_(c, d, p)
+    R = _quotient_step(q, R, p)
+    c, d = d, r
+    if len(d) - 1 < m:
+        return R
+    k = 2 * m - (len(c) - 1)
+    S = hgcd(c[k:], d[k:], p)
+    return _mat_mul(S, R, p)
+
+
+def xgcd(a: list[int], b: list[int], p: int) -> tuple[list[int], list[int], list[int]]:
+    """
+    Extended Euclidean algorithm. Returns (s, t, g) such that s * a + t * b = g, with g monic.
+    The cofactors are the ones of the classical Euclidean algorithm.
+    """
+    r0, r1 = trim(a[:]), trim(b[:])
+    M = _IDENTITY
+    while r1:
+        if len(r0) > len(r1) and len(r0) - 1 > HGCD_THRESHOLD:
+            R = hgcd(r0, r1, p)
+            if R != _IDENTITY:
+                r0, r1 = _mat_apply(R, r0, r1, p)
+                M = _mat_mul(R, M, p)
+                continue
+        q, r = divmod_(r0, r1, p)
+        r0, r1 = r1, r
+        M = _quotient_step(q, M, p)
+    s, t = M[0], M[1]
+    if not r0:
+        return s, t, r0
+    lc_inv = pow(r0[-1], -1, p)
+    return scale(s, lc_inv, p), scale(t, lc_inv, p), scale(r0, lc_inv, p)
+
+
+def evaluate(a: list[int], x: int, p: int) -> int:
+    """
+    Horner evaluation of a at x.
+    """
+    acc = 0
+    for c in reversed(a):
+        acc = (acc * x + c) % p
+    return acc
+
+
+def evaluate_many(a: list[int], xs: list[int], p: int) -> list[int]:
+    """
+    Evaluates a at all the points xs.
+    Many points are handled by reducing a modulo the nodes of the subproduct tree of xs.
+    """
+    if len(xs) < MULTIPOINT_THRESHOLD or len(a) < MULTIPOINT_THRESHOLD:
+        return [evaluate(a, x, p) for x in xs]
+    return _evaluate_tree(trim(a[:]), subproduct_tree(xs, p), p)
+
+
+def subproduct_tree(xs: list[int], p: int) -> list[list[list[int]]]:
+    """
+    Returns the levels of the subproduct tree of xs, from the leaves (X - x_i) to the root prod(X - x_i).
+    The nodes of a level are the products of pairs of nodes of the level below,
+    the last node being carried over when the level has an odd size.
+    """
+    level = [[-x % p, 1] for x in xs]
+    tree = [level]
+    while len(level) > 1:
+        level = [
+            mul(level[i], level[i + 1], p) if i + 1 < len(level) else level[i]
+            for i in range(0, len(level), 2)
+        ]
+        tree.append(level)
+    return tree
+
+
+def _evaluate_tree(a: list[int], tree: list[list[list[int]]], p: int) -> list[int]:
+    remainders = [divmod_(a, tree[-1][0], p)[1]]
+    for level in reversed(tree[:-1]):
+        remainders = [
+            divmod_(remainders[i // 2], node, p)[1] for i, node in enumerate(level)
+        ]
+    return [r[0] if r else 0 for r in remainders]
+
+
+def interpolate(xs: list[int], ys: list[int], p: int) -> list[int]:
+    """
+    Returns the trimmed polynomial of degree < len(xs) taking the values ys at the distinct points xs.
+    With M = prod(X - x_i), the result is sum(ys[i] / M'(x_i) * M / (X - x_i)),
+    computed bottom up in the subproduct tree of xs.
+    """
+    tree = subproduct_tree(xs, p)
+    root = tree[-1][0]
+    d_root = [i * c % p for i, c in enumerate(root)][1:]
+    if len(xs) < MULTIPOINT_THRESHOLD:
+        d_values = [evaluate(d_root, x, p) for x in xs]
+    else:
+        d_values = _evaluate_tree(d_root, tree, p)
+    try:
+        weights = batch_inverse(d_values, p)
+    except ValueError:
+        raise ValueError("Interpolation points must be distinct")
+
+    # Combination of the leaves : [ys[i] / M'(x_i)].
+    level = [[y * w % p] for y, w in zip(ys, weights)]
+    for nodes in tree[:-1]:
+        # The node of the level above covering nodes[i] and nodes[i+1] gets
+        # level[i] * nodes[i+1] + level[i+1] * nodes[i].
+        level = [
+            (
+                add(mul(level[i], nodes[i + 1], p), mul(level[i + 1], nodes[i], p), p)
+                if i + 1 < len(nodes)
+                else level[i]
+            )
+            for i in range(0, len(nodes), 2)
+        ]
+    return trim(level[0])
+
+
+def batch_inverse(values: list[int], p: int) -> list[int]:
+    """
+    Inverts a list of field elements modulo p with a single modular inversion (Montgomery's trick).
+    Raises a ValueError if one of the values is zero.
+    """
+    prefix = [1] * len(values)
+    acc = 1
+    for i, x in enumerate(values):
+        if x == 0:
+            raise ValueError(f"Cannot invert 0 modulo {p}")
+        prefix[i] = acc
+        acc = acc * x % p
+    acc = pow(acc, -1, p)
+    res = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        res[i] = acc * prefix[i] % p
+        acc = acc * values[i] % p
+    return res
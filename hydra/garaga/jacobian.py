@@ -0,0 +1,341 @@
+"""
+Short Weierstrass curve arithmetic y^2 = x^3 + ax + b on plain int coordinates modulo a prime p.
+Points are kept in Jacobian coordinates (X, Y, Z), standing for the affine point (X / Z^2, Y / Z^3),
+so that no modular inversion is needed until the final conversion back to affine coordinates.
+The point at infinity is any point with Z = 0, and (0, 0) in affine coordinates as in G1Point.
+
+These kernels back G1Point.msm, where going through the string based fastecdsa bindings
+for every point dominates the cost, and the fixed-base tables of G1Point.precompute_tables.
+The *_fp2 variants work on G2 points of curves with a = 0 over Fp2 = Fp[u] / (u^2 + 1),
+with (c0, c1) tuples as coordinates. They accept points outside of the prime order subgroup.
+"""
+
+from garaga.int_poly import batch_inverse
+
+JacobianPoint = tuple[int, int, int]
+
+INFINITY: JacobianPoint = (1, 1, 0)
+
+# Window size (in bits) of the fixed-base tables.
+FIXED_BASE_WINDOW = 4
+
+
+def to_jacobian(x: int, y: int) -> JacobianPoint:
+    if x == 0 and y == 0:
+        return INFINITY
+    return (x, y, 1)
+
+
+def to_affine(P: JacobianPoint, p: int) -> tuple[int, int]:
+    X, Y, Z = P
+    if Z == 0:
+        return (0, 0)
+    z_inv = pow(Z, -1, p)
+    z_inv2 = z_inv * z_inv % p
+    return (X * z_inv2 % p, Y * z_inv2 * z_inv % p)
+
+
+def to_affine_many(Ps: list[JacobianPoint], p: int) -> list[tuple[int, int]]:
+    """
+    Converts many points back to affine coordinates with a single modular inversion.
+    """
+    finite = [i for i, P in enumerate(Ps) if P[2] != 0]
+    z_invs = batch_inverse([Ps[i][2] for i in finite], p)
+    res = [(0, 0)] * len(Ps)
+    for i, z_inv in zip(finite, z_invs):
+        X, Y, _ = Ps[i]
+        z_inv2 = z_inv * z_inv % p
+        res[i] = (X * z_inv2 % p, Y * z_inv2 * z_inv % p)
+    return res
+
+
+def neg(P: JacobianPoint, p: int) -> JacobianPoint:
+    return (P[0], -P[1] % p, P[2])
+
+
+def double(P: JacobianPoint, a: int, p: int) -> JacobianPoint:
+    X, Y, Z = P
+    if Z == 0 or Y == 0:
+        return INFINITY
+    YY = Y * Y % p
+    S = 4 * X * YY % p
+    if a == 0:
+        M = 3 * X * X % p
+    else:
+        ZZ = Z * Z % p
+        M = (3 * X * X + a * ZZ * ZZ) % p
+    X3 = (M * M - 2 * S) % p
+    Y3 = (M * (S - X3) - 8 * YY * YY) % p
+    Z3 = 2 * Y * Z % p
+    return (X3, Y3, Z3)
+
+
+def add(P: JacobianPoint, Q: JacobianPoint, a: int, p: int) -> JacobianPoint:
+    X1, Y1, Z1 = P
+    X2, Y2, Z2 = Q
+    if Z1 == 0:
+        return Q
+    if Z2 == 0:
+        return P
+    Z1Z1 = Z1 * Z1 % p
+    Z2Z2 = Z2 * Z2 % p
+    U1 = X1 * Z2Z2 % p
+    U2 = X2 * Z1Z1 % p
+    S1 = Y1 * Z2 * Z2Z2 % p
+    S2 = Y2 * Z1 * Z1Z1 % p
+    H = (U2 - U1) % p
+    R = (S2 - S1) % p
+    if H == 0:
+        if R == 0:
+            return double(P, a, p)
+        return INFINITY
+    HH = H * H % p
+    HHH = H * HH % p
+    V = U1 * HH % p
+    X3 = (R * R - HHH - 2 * V) % p
+    Y3 = (R * (V - X3) - S1 * HHH) % p
+    Z3 = Z1 * Z2 * H % p
+    return (X3, Y3, Z3)
+
+
+def add_affine(P: JacobianPoint, x2: int, y2: int, a: int, p: int) -> JacobianPoint:
+    """
+    Mixed addition of a Jacobian point P and a finite affine point (x2, y2).
+    """
+    X1, Y1, Z1 = P
+    if Z1 == 0:
+        return (x2, y2, 1)
+    Z1Z1 = Z1 * Z1 % p
+    U2 = x2 * Z1Z1 % p
+    S2 = y2 * Z1 * Z1Z1 % p
+    H = (U2 - X1) % p
+    R = (S2 - Y1) % p
+    if H == 0:
+        if R == 0:
+            return double(P, a, p)
+        return INFINITY
+    HH = H * H % p
+    HHH = H * HH % p
+    V = X1 * HH % p
+    X3 = (R * R - HHH - 2 * V) % p
+    Y3 = (R * (V - X3) - Y1 * HHH) % p
+    Z3 = Z1 * H % p
+    return (X3, Y3, Z3)
+
+
+def scalar_mul(x: int, y: int, k: int, a: int, p: int) -> JacobianPoint:
+    """
+    Double and add multiplication of the affine point (x, y) by the scalar k.
+    """
+    if k < 0:
+        k, y = -k, -y % p
+    if k == 0 or (x == 0 and y == 0):
+        return INFINITY
+    R = INFINITY
+    for bit in bin(k)[2:]:
+        R = double(R, a, p)
+        if bit == "1":
+            R = add_affine(R, x, y, a, p)
+    return R
+
+
+def pippenger_window(n: int) -> int:
+    """
+    Window size (in bits) minimizing the number of additions of a Pippenger MSM of n points.
+    """
+    if n < 4:
+        return 2
+    if n < 32:
+        return 3
+    return max(4, n.bit_length() - 2)
+
+
+def msm(
+    points: list[tuple[int, int]], scalars: list[int], a: int, p: int
+) -> JacobianPoint:
+    """
+    Pippenger's bucket method for sum(scalars[i] * points[i]), with affine input points.
+    Negative scalars are handled by negating the corresponding points.
+    """
+    assert len(points) == len(
+        scalars
+    ), f"Points and scalar length mismatch: {len(points)} points and {len(scalars)} scalars"
+    pts = []
+    ks = []
+    for (x, y), k in zip(points, scalars):
+        if k == 0 or (x == 0 and y == 0):
+            continue
+        if k < 0:
+            k, y = -k, -y % p
+        pts.append((x, y))
+        ks.append(k)
+    if not ks:
+        return INFINITY
+    if len(ks) == 1:
+        return scalar_mul(pts[0][0], pts[0][1], ks[0], a, p)
+
+    c = pippenger_window(len(ks))
+    mask = (1 << c) - 1
+    n_windows = (max(ks).bit_length() + c - 1) // c
+    R = INFINITY
+    for w in reversed(range(n_windows)):
+        for _ in range(c):
+            R = double(R, a, p)
+        shift = w * c
+        buckets = [INFINITY] * (mask + 1)
+        for (x, y), k in zip(pts, ks):
+            d = (k >> shift) & mask
+            if d:
+                buckets[d] = add_affine(buckets[d], x, y, a, p)
+        # sum(d * buckets[d]) as a running sum from the highest bucket.
+        running = INFINITY
+        window_sum = INFINITY
+        for d in range(mask, 0, -1):
+            running = add(running, buckets[d], a, p)
+            window_sum = add(window_sum, running, a, p)
+        R = add(R, window_sum, a, p)
+    return R
+
+
+def fixed_base_table(
+    x: int, y: int, n_bits: int, a: int, p: int, w: int = FIXED_BASE_WINDOW
+) -> list[list[tuple[int, int]]]:
+    """
+    Precomputed multiples of the fixed point (x, y) for scalars of up to n_bits bits :
+    table[j][d - 1] = d * 2^(w * j) * (x, y) in affine coordinates, for d in [1, 2^w).
+    A multiplication by a scalar then costs one mixed addition per non zero w-bit digit
+    and no doubling.
+    """
+    n_windows = (n_bits + w - 1) // w
+    size = (1 << w) - 1
+    rows = []
+    base = to_jacobian(x, y)
+    for _ in range(n_windows):
+        row = [base]
+        for _ in range(size - 1):
+            row.append(add(row[-1], base, a, p))
+        rows.append(row)
+        base = add(row[-1], base, a, p)
+    flat = to_affine_many([P for row in rows for P in row], p)
+    return [flat[j * size : (j + 1) * size] for j in range(n_windows)]
+
+
+def fixed_base_msm(
+    tables: list[list[list[tuple[int, int]]]],
+    scalars: list[int],
+    a: int,
+    p: int,
+    w: int = FIXED_BASE_WINDOW,
+) -> JacobianPoint:
+    """
+    sum(scalars[i] * P_i) where tables[i] is the fixed_base_table of P_i.
+    abs(scalars[i]) must be smaller than 2^(w * len(tables[i])).
+    """
+    mask = (1 << w) - 1
+    R = INFINITY
+    for table, k in zip(tables, scalars):
+        negate = k < 0
+        k = abs(k)
+        assert k >> (w * len(table)) == 0, "Scalar too large for the fixed base table"
+        j = 0
+        while k:
+            d = k & mask
+            if d:
+                x, y = table[j][d - 1]
+                if x != 0 or y != 0:
+                    R = add_affine(R, x, -y % p if negate else y, a, p)
+            k >>= w
+            j += 1
+    return R
+
+
+Fp2Element = tuple[int, int]
+JacobianPointFp2 = tuple[Fp2Element, Fp2Element, Fp2Element]
+
+INFINITY_FP2: JacobianPointFp2 = ((1, 0), (1, 0), (0, 0))
+
+
+def fp2_mul(a: Fp2Element, b: Fp2Element, p: int) -> Fp2Element:
+    a0b0 = a[0] * b[0]
+    a1b1 = a[1] * b[1]
+    return ((a0b0 - a1b1) % p, ((a[0] + a[1]) * (b[0] + b[1]) - a0b0 - a1b1) % p)
+
+
+def fp2_square(a: Fp2Element, p: int) -> Fp2Element:
+    return ((a[0] + a[1]) * (a[0] - a[1]) % p, 2 * a[0] * a[1] % p)
+
+
+def double_fp2(P: JacobianPointFp2, p: int) -> JacobianPointFp2:
+    X, Y, Z = P
+    if Z == (0, 0) or Y == (0, 0):
+        return INFINITY_FP2
+    YY = fp2_square(Y, p)
+    S = fp2_mul(X, YY, p)
+    S = (4 * S[0] % p, 4 * S[1] % p)
+    XX = fp2_square(X, p)
+    M = (3 * XX[0] % p, 3 * XX[1] % p)
+    MM = fp2_square(M, p)
+    X3 = ((MM[0] - 2 * S[0]) % p, (MM[1] - 2 * S[1]) % p)
+    YYYY = fp2_square(YY, p)
+    T = fp2_mul(M, ((S[0] - X3[0]) % p, (S[1] - X3[1]) % p), p)
+    Y3 = ((T[0] - 8 * YYYY[0]) % p, (T[1] - 8 * YYYY[1]) % p)
+    YZ = fp2_mul(Y, Z, p)
+    Z3 = (2 * YZ[0] % p, 2 * YZ[1] % p)
+    return (X3, Y3, Z3)
+
+
+def add_affine_fp2(
+    P: JacobianPointFp2, x2: Fp2Element, y2: Fp2Element, p: int
+) -> JacobianPointFp2:
+    """
+    Mixed addition of a Jacobian point P and a finite affine point (x2, y2).
+    """
+    X1, Y1, Z1 = P
+    if Z1 == (0, 0):
+        return (x2, y2, (1, 0))
+    Z1Z1 = fp2_square(Z1, p)
+    U2 = fp2_mul(x2, Z1Z1, p)
+    S2 = fp2_mul(fp2_mul(y2, Z1, p), Z1Z1, p)
+    H = ((U2[0] - X1[0]) % p, (U2[1] - X1[1]) % p)
+    R = ((S2[0] - Y1[0]) % p, (S2[1] - Y1[1]) % p)
+    if H == (0, 0):
+        if R == (0, 0):
+            return double_fp2(P, p)
+        return INFINITY_FP2
+    HH = fp2_square(H, p)
+    HHH = fp2_mul(H, HH, p)
+    V = fp2_mul(X1, HH, p)
+    RR = fp2_square(R, p)
+    X3 = ((RR[0] - HHH[0] - 2 * V[0]) % p, (RR[1] - HHH[1] - 2 * V[1]) % p)
+    T = fp2_mul(R, ((V[0] - X3[0]) % p, (V[1] - X3[1]) % p), p)
+    U = fp2_mul(Y1, HHH, p)
+    Y3 = ((T[0] - U[0]) % p, (T[1] - U[1]) % p)
+    Z3 = fp2_mul(Z1, H, p)
+    return (X3, Y3, Z3)
+
+
+def scalar_mul_fp2(x: Fp2Element, y: Fp2Element, k: int, p: int) -> JacobianPointFp2:
+    """
+    Double and add multiplication of the finite affine point (x, y) by the scalar k.
+    """
+    if k < 0:
+        k, y = -k, (-y[0] % p, -y[1] % p)
+    R = INFINITY_FP2
+    for bit in bin(k)[2:] if k else "":
+        R = double_fp2(R, p)
+        if bit == "1":
+            R = add_affine_fp2(R, x, y, p)
+    return R
+
+
+def equals_affine_fp2(
+    P: JacobianPointFp2, x: Fp2Element, y: Fp2Element, p: int
+) -> bool:
+    """
+    Checks whether the Jacobian point P is the finite affine point (x, y), without inversion.
+    """
+    X, Y, Z = P
+    if Z == (0, 0):
+        return False
+    ZZ = fp2_square(Z, p)
+    return X == fp2_mul(x, ZZ, p) and Y == fp2_mul(y, fp2_mul(ZZ, Z, p), p)
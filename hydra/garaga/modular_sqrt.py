@@ -0,0 +1,106 @@
+"""
+Square roots and quadratic characters modulo a prime p, on plain integers.
+The constants of each modulus are computed once and cached:
+- p = 3 mod 4 (BN254, BLS12-381, secp256k1, secp256r1): a single exponentiation,
+- p = 5 mod 8 (ed25519): Atkin's algorithm, a single exponentiation,
+- otherwise: Tonelli-Shanks, with a precomputed non residue.
+"""
+
+from functools import lru_cache
+
+
+def jacobi(a: int, n: int) -> int:
+    """
+    Jacobi symbol (a/n) for an odd positive n, with the binary algorithm.
+    Equals the Legendre symbol when n is prime.
+    """
+    assert n > 0 and n & 1, f"n must be odd and positive, got {n}"
+    a %= n
+    t = 1
+    while a:
+        # Strip the factors of two at once, (2/n) = -1 iff n = 3, 5 mod 8.
+        s = (a & -a).bit_length() - 1
+        a >>= s
+        if s & 1 and n & 7 in (3, 5):
+            t = -t
+        # Quadratic reciprocity.
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            t = -t
+        a %= n
+    return t if n == 1 else 0
+
+
+def legendre(a: int, p: int) -> int:
+    """
+    Legendre symbol (a/p) of a modulo the odd prime p : 1, -1 or 0.
+    """
+    return jacobi(a, p)
+
+
+def is_square(a: int, p: int) -> bool:
+    """
+    Returns True if a is a non zero square modulo the odd prime p.
+    """
+    return jacobi(a, p) == 1
+
+
+@lru_cache(maxsize=None)
+def _tonelli_shanks_constants(p: int) -> tuple[int, int, int]:
+    """
+    Returns (s, q, c) with p - 1 = q * 2^s, q odd, and c = z^q for a non residue z.
+    """
+    s = ((p - 1) & (1 - p)).bit_length() - 1
+    q = (p - 1) >> s
+    z = 2
+    while jacobi(z, p) != -1:
+        z += 1
+    return s, q, pow(z, q, p)
+
+
+def _tonelli_shanks(a: int, p: int) -> int:
+    s, q, c = _tonelli_shanks_constants(p)
+    x = pow(a, (q + 1) // 2, p)
+    b = pow(a, q, p)
+    m = s
+    while b != 1:
+        # Least i such that b^(2^i) = 1.
+        i, b2 = 0, b
+        while b2 != 1:
+            b2 = b2 * b2 % p
+            i += 1
+        t = pow(c, 1 << (m - i - 1), p)
+        x = x * t % p
+        c = t * t % p
+        b = b * c % p
+        m = i
+    return x
+
+
+def sqrt(a: int, p: int) -> int:
+    """
+    Returns a square root of a modulo the odd prime p (not normalized to a specific root).
+    Raises a ValueError if a is not a square.
+    """
+    a %= p
+    if a == 0:
+        return 0
+    if not is_square(a, p):
+        raise ValueError("Cannot square root a non-quadratic residue")
+    if p & 3 == 3:
+        return pow(a, (p + 1) >> 2, p)
+    if p & 7 == 5:
+        # Atkin : with t = (2a)^((p-5)/8) and i = 2at^2 (a square root of -1),
+        # at(i - 1) is a square root of a.
+        t = pow(2 * a, (p - 5) >> 3, p)
+        i = 2 * a * t * t % p
+        return a * t * (i - 1) % p
+    return _tonelli_shanks(a, p)
+
+
+def sqrt_roots(a: int, p: int) -> tuple[int, int]:
+    """
+    Returns the (min, max) square roots of a modulo the odd prime p.
+    """
+    root = sqrt(a, p)
+    return min(root, p - root), max(root, (p - root) % p)
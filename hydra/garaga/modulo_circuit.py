@@ -1,11 +1,12 @@
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 from typing import List, Union
 
 from garaga.algebra import BaseField, ModuloCircuitElement, PyFelt
 from garaga.definitions import BASE, CURVES, N_LIMBS, STARK, CurveID, get_sparsity
 from garaga.hints.extf_mul import nondeterministic_extension_field_div
 from garaga.hints.io import bigint_split
+from garaga.int_poly import batch_inverse
 from garaga.modulo_circuit_structs import Cairo1SerializableStruct
 
 BATCH_SIZE = 1  # Batch Size, only used in cairo 0 mode.
@@ -44,6 +45,25 @@ class CairoVMOps(Enum):
     ASSERT_EQ = "=="
 
 
+class TapeOps(IntEnum):
+    """
+    Enum for the operations of a CircuitProgram tape.
+    The modulo builtin only knows ADD and MUL, where the unknown value can be any of the three operands.
+    The tape resolves which operand is computed so that every instruction writes its result slot:
+    -ADD: r = a + b
+    -SUB: r = a - b
+    -MUL: r = a * b
+    -DIV: r = a / b
+    -INV: r = 1 / a
+    """
+
+    ADD = 0
+    SUB = 1
+    MUL = 2
+    DIV = 3
+    INV = 4
+
+
 @dataclass(slots=True, frozen=True)
 class ModuloCircuitInstruction:
     operation: ModBuiltinOps
@@ -53,6 +73,117 @@ class ModuloCircuitInstruction:
     comment: str | None
 
 
+@dataclass(slots=True, frozen=True)
+class CircuitProgram:
+    """
+    A flat recording of a traced ModuloCircuit, taken after the non interactive transform.
+    The topology of a circuit only depends on the shape of its input, so it can be recorded once
+    and replayed on any new input without allocating a ValueSegmentItem, ModuloCircuitInstruction
+    or PyFelt per operation.
+
+    Values are addressed by slots, the dense index of an element in the transformed value segment:
+    [CONSTANT | INPUT | COMMIT | WITNESS | FELT | BUILTIN].
+
+    Attributes:
+        name (str): The name of the recorded circuit.
+        p (int): The modulus of the circuit.
+        constants (tuple[int, ...]): The values of the CONSTANT slots.
+        n_inputs (int): The number of INPUT, COMMIT, WITNESS and FELT slots, in that order.
+        tape (tuple[tuple[int, int, int, int], ...]): (op, left, right, result) slots, see TapeOps.
+        assert_eq (tuple[tuple[int, int, int, int], ...]): (op, left, right, result) slots
+            of the assert_eq instructions, checking left op right == result.
+        output (tuple[int, ...]): The slots of the output elements.
+    """
+
+    name: str
+    p: int
+    constants: tuple[int, ...]
+    n_inputs: int
+    tape: tuple[tuple[int, int, int, int], ...]
+    assert_eq: tuple[tuple[int, int, int, int], ...]
+    output: tuple[int, ...]
+
+    @property
+    def n_slots(self) -> int:
+        return len(self.constants) + self.n_inputs + len(self.tape)
+
+    def evaluate(self, input: list[int], check_asserts: bool = False) -> list[int]:
+        """
+        Replays the program on a new input and returns the values of the output slots.
+        The input must be given in the order of the transformed value segment, ie INPUT, COMMIT, WITNESS, FELT.
+        Hint values (COMMIT, WITNESS) are part of the input, exactly as in the compiled Cairo circuit.
+        """
+        assert (
+            len(input) == self.n_inputs
+        ), f"Expected {self.n_inputs} inputs for program {self.name}, got {len(input)}"
+        p = self.p
+        v = [0] * self.n_slots
+        n_constants = len(self.constants)
+        v[:n_constants] = self.constants
+        v[n_constants : n_constants + self.n_inputs] = [x % p for x in input]
+        # Raw ints instead of TapeOps members to keep the loop tight, most frequent ops first.
+        for op, a, b, r in self.tape:
+            if op == 2:
+                v[r] = v[a] * v[b] % p
+            elif op == 0:
+                v[r] = (v[a] + v[b]) % p
+            elif op == 1:
+                v[r] = (v[a] - v[b]) % p
+            elif op == 3:
+                v[r] = v[a] * pow(v[b], -1, p) % p
+            else:
+                v[r] = pow(v[a], -1, p)
+        if check_asserts:
+            self._check_asserts(v)
+        return [v[i] for i in self.output]
+
+    def evaluate_batch(
+        self, inputs: list[list[int]], check_asserts: bool = False
+    ) -> list[list[int]]:
+        """
+        Replays the program on N independent inputs at once and returns the N output lists.
+        Values are stored column-wise (one list of N ints per slot), so the interpreter overhead
+        of each tape instruction is paid once per batch instead of once per input.
+        Inversions of a whole column share a single modular inversion (Montgomery's trick).
+        """
+        n = len(inputs)
+        if n == 0:
+            return []
+        assert all(
+            len(input) == self.n_inputs for input in inputs
+        ), f"Expected {self.n_inputs} inputs per row for program {self.name}"
+        p = self.p
+        v: list[list[int]] = [None] * self.n_slots
+        n_constants = len(self.constants)
+        for i, c in enumerate(self.constants):
+            v[i] = [c] * n
+        for i, column in enumerate(zip(*inputs)):
+            v[n_constants + i] = [x % p for x in column]
+        for op, a, b, r in self.tape:
+            if op == 2:
+                v[r] = [x * y % p for x, y in zip(v[a], v[b])]
+            elif op == 0:
+                v[r] = [(x + y) % p for x, y in zip(v[a], v[b])]
+            elif op == 1:
+                v[r] = [(x - y) % p for x, y in zip(v[a], v[b])]
+            elif op == 3:
+                v[r] = [x * y % p for x, y in zip(v[a], batch_inverse(v[b], p))]
+            else:
+                v[r] = batch_inverse(v[a], p)
+        if check_asserts:
+            for k in range(n):
+                self._check_asserts([column[k] for column in v])
+        return [list(row) for row in zip(*(v[i] for i in self.output))]
+
+    def _check_asserts(self, v: list[int]) -> None:
+        p = self.p
+        for op, a, b, r in self.assert_eq:
+            if op == TapeOps.ADD:
+                assert (v[a] + v[b]) % p == v[r], f"Assert eq {a} + {b} == {r} failed"
+            else:
+                assert v[a] * v[b] % p == v[r], f"Assert eq {a} * {b} == {r} failed"
+
+
 @dataclass(slots=True, frozen=True)
 class ValueSegmentItem:
     emulated_felt: PyFelt
@@ -259,6 +390,78 @@ class ValueSegment:
         # print("dw_arrays[add_offsets_ptr]", dw_arrays["add_offsets_ptr"])
         return dw_arrays
 
+    def to_program(self, p: int) -> CircuitProgram:
+        """
+        Records the instructions of a transformed ValueSegment as a CircuitProgram.
+        Must be called on the output of non_interactive_transform, where the segment is ordered by stack.
+        """
+        slots = {offset: i for i, offset in enumerate(self.segment)}
+        constants = tuple(
+            item.value for item in self.segment_stacks[WriteOps.CONSTANT].values()
+        )
+        n_inputs = sum(
+            len(self.segment_stacks[stack])
+            for stack in [
+                WriteOps.INPUT,
+                WriteOps.COMMIT,
+                WriteOps.WITNESS,
+                WriteOps.FELT,
+            ]
+        )
+        tape = []
+        for offset, item in self.segment_stacks[WriteOps.BUILTIN].items():
+            instruction = item.instruction
+            left, right, result = (
+                slots[instruction.left_offset],
+                slots[instruction.right_offset],
+                slots[instruction.result_offset],
+            )
+            slot = slots[offset]
+            assert slot == len(constants) + n_inputs + len(
+                tape
+            ), f"Segment {self.name} is not ordered by stack, call non_interactive_transform first"
+            match instruction.operation:
+                case ModBuiltinOps.ADD if result == slot:
+                    tape.append((TapeOps.ADD.value, left, right, slot))
+                case ModBuiltinOps.ADD if right == slot:
+                    tape.append((TapeOps.SUB.value, result, left, slot))
+                case ModBuiltinOps.ADD if left == slot:
+                    tape.append((TapeOps.SUB.value, result, right, slot))
+                case ModBuiltinOps.MUL if result == slot and right != slot:
+                    tape.append((TapeOps.MUL.value, left, right, slot))
+                case ModBuiltinOps.MUL if result == slot:
+                    tape.append((TapeOps.INV.value, left, left, slot))
+                case ModBuiltinOps.MUL if right == slot:
+                    tape.append((TapeOps.DIV.value, result, left, slot))
+                case ModBuiltinOps.MUL if left == slot:
+                    tape.append((TapeOps.DIV.value, result, right, slot))
+                case _:
+                    raise ValueError(
+                        f"Instruction {instruction} does not write its own offset {offset}"
+                    )
+        assert_eq = tuple(
+            (
+                (
+                    TapeOps.ADD.value
+                    if instruction.operation == ModBuiltinOps.ADD
+                    else TapeOps.MUL.value
+                ),
+                slots[instruction.left_offset],
+                slots[instruction.right_offset],
+                slots[instruction.result_offset],
+            )
+            for instruction in self.assert_eq_instructions
+        )
+        return CircuitProgram(
+            name=self.name,
+            p=p,
+            constants=constants,
+            n_inputs=n_inputs,
+            tape=tuple(tape),
+            assert_eq=assert_eq,
+            output=tuple(slots[elmt.offset] for elmt in self.output),
+        )
+
     def print(self):
         # ANSI escape codes for some colors
         RED = "\033[31m"  # Red text
@@ -827,6 +1030,13 @@ class ModuloCircuit:
     def print_value_segment(self):
         self.values_segment.print()
 
+    def compile_program(self) -> CircuitProgram:
+        """
+        Records the traced circuit as a CircuitProgram that can be replayed on new inputs of the same shape.
+        Unlike compile_circuit, the values segment of the circuit is left untouched.
+        """
+        return self.values_segment.non_interactive_transform().to_program(self.field.p)
+
     def compile_circuit(self, function_name: str = None):
         if self.is_empty_circuit():
             return "", ""
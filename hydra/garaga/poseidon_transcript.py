@@ -17,6 +17,36 @@ def hades_permutation(s0: int, s1: int, s2: int) -> tuple[int, int, int]:
     )
 
 
+def hades_permutation_multi(
+    s0: int, s1: int, s2: int, inputs: list[tuple[int, int]]
+) -> tuple[int, int, int, int]:
+    """
+    Absorbs the (x, y) pairs one after the other, i.e. for each pair
+    (s0, s1, s2) = hades_permutation(s0 + x, s1 + y, s2), crossing the FFI boundary once.
+    Returns the final state and the number of permutations.
+    """
+    if not hasattr(garaga_rs, "hades_permutation_multi"):
+        # Extension built before the bulk binding was added.
+        for x, y in inputs:
+            s0, s1, s2 = hades_permutation(s0 + x, s1 + y, s2)
+        return s0, s1, s2, len(inputs)
+    r0, r1, r2, n = garaga_rs.hades_permutation_multi(
+        (s0 % STARK).to_bytes(32, "big"),
+        (s1 % STARK).to_bytes(32, "big"),
+        (s2 % STARK).to_bytes(32, "big"),
+        b"".join(
+            (x % STARK).to_bytes(32, "big") + (y % STARK).to_bytes(32, "big")
+            for x, y in inputs
+        ),
+    )
+    return (
+        int.from_bytes(r0, "big"),
+        int.from_bytes(r1, "big"),
+        int.from_bytes(r2, "big"),
+        n,
+    )
+
+
 class CairoPoseidonTranscript:
     """
     The CairoPoseidonTranscript class mimics the behaviour of the Cairo functions hashing
@@ -85,10 +115,36 @@ class CairoPoseidonTranscript:
         self.permutations_count += 1
         return self.s0
 
+    def absorb_multi(self, inputs: list[tuple[int, int]]):
+        """
+        Absorbs the (x, y) pairs in a single call, equivalent to calling
+        update_sponge_state(x, y) on each pair and counting the permutations.
+        """
+        self.s0, self.s1, self.s2, n = hades_permutation_multi(
+            self.s0, self.s1, self.s2, inputs
+        )
+        self.permutations_count += n
+        return self.s0
+
     def hash_u256_multi(self, X: list[PyFelt | int]):
+        inputs = []
         for x in X:
-            self.hash_u256(x)
-        return self.s0
+            assert isinstance(x, (PyFelt, int))
+            if isinstance(x, PyFelt):
+                x = x.value
+            assert 0 <= x < 2**256
+            inputs.append((x % 2**128, x >> 128))
+        return self.absorb_multi(inputs)
+
+    def hash_u128_multi(self, X: list[PyFelt | int]):
+        inputs = []
+        for x in X:
+            assert isinstance(x, (PyFelt, int))
+            if isinstance(x, PyFelt):
+                x = x.value
+            assert 0 <= x < 2**128
+            inputs.append((x, 0))
+        return self.absorb_multi(inputs)
 
     def hash_limbs_multi(
         self,
@@ -98,10 +154,16 @@ class CairoPoseidonTranscript:
     ):
         if sparsity:
             X = [x for i, x in enumerate(X) if sparsity[i] != 0]
-        for X_elem in X:
-            if debug:
+        if debug:
+            for X_elem in X:
                 print(f"\t s0 : {self.s0}")
-            self.hash_element(X_elem, debug=debug)
+                self.hash_element(X_elem, debug=debug)
+            return None
+        inputs = []
+        for X_elem in X:
+            limbs = bigint_split(X_elem, N_LIMBS, BASE)
+            inputs.append((limbs[0] + BASE * limbs[1], limbs[2] + BASE * limbs[3]))
+        self.absorb_multi(inputs)
         return None
 
 
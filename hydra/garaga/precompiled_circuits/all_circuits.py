@@ -1,4 +1,12 @@
+import ast
+import hashlib
+import importlib.metadata
+import importlib.util
+import io
+import json
+import os
 from enum import Enum
+from functools import lru_cache
 
 from garaga.definitions import CurveID
 from garaga.precompiled_circuits.compilable_circuits.base import (
@@ -373,6 +381,183 @@ ALL_CAIRO_CIRCUITS = {
 }
 
 
+# Compiled circuits by content key, and hashes of the generated files.
+CIRCUITS_CACHE_DIR = "build/circuits_cache"
+
+# Modules whose code is shared by the compilation of all circuits.
+COMPILER_MODULES = (
+    "garaga.definitions",
+    "garaga.modulo_circuit",
+    "garaga.modulo_circuit_structs",
+    "garaga.extension_field_modulo_circuit",
+    "garaga.precompiled_circuits.compilable_circuits.base",
+)
+
+
+def _module_file(module_name: str) -> str | None:
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.origin is None or not spec.origin.endswith(".py"):
+        return None
+    return spec.origin
+
+
+@lru_cache(maxsize=None)
+def _module_source_hash(module_name: str) -> bytes:
+    filename = _module_file(module_name)
+    if filename is None:
+        return b""
+    with open(filename, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+@lru_cache(maxsize=None)
+def _module_imports(module_name: str) -> tuple[str, ...]:
+    """
+    The garaga modules imported by a module, including the imports inside functions,
+    and its parent packages.
+    """
+    filename = _module_file(module_name)
+    if filename is None:
+        return ()
+    with open(filename, "rb") as f:
+        tree = ast.parse(f.read(), filename)
+    is_package = os.path.basename(filename) == "__init__.py"
+    package = module_name if is_package else module_name.rpartition(".")[0]
+    imported = {module_name.rpartition(".")[0]}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                base = importlib.util.resolve_name(
+                    "." * node.level + (node.module or ""), package
+                )
+            except (ImportError, ValueError):
+                continue
+            imported.add(base)
+            # Names imported from a package may be its submodules.
+            for alias in node.names:
+                if _module_file(f"{base}.{alias.name}") is not None:
+                    imported.add(f"{base}.{alias.name}")
+    return tuple(
+        sorted(
+            name
+            for name in imported
+            if name.split(".")[0] == "garaga" and _module_file(name) is not None
+        )
+    )
+
+
+def _module_dependencies(module_names: list[str]) -> list[str]:
+    """
+    The garaga modules some modules depend on, directly or indirectly, themselves
+    included.
+    """
+    modules = set()
+    stack = list(module_names)
+    while stack:
+        module_name = stack.pop()
+        if module_name not in modules:
+            modules.add(module_name)
+            stack.extend(_module_imports(module_name))
+    return sorted(modules)
+
+
+@lru_cache(maxsize=None)
+def _compiler_version() -> bytes:
+    h = hashlib.sha256()
+    try:
+        h.update(importlib.metadata.version("garaga").encode())
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    for module_name in _module_dependencies(list(COMPILER_MODULES)):
+        h.update(module_name.encode())
+        h.update(_module_source_hash(module_name))
+    return h.digest()
+
+
+def clear_source_hashes() -> None:
+    """
+    Forgets the hashes of the sources read so far, which may have changed on disk.
+    """
+    _module_source_hash.cache_clear()
+    _module_imports.cache_clear()
+    _compiler_version.cache_clear()
+
+
+def circuit_source_modules(circuit_class: type) -> list[str]:
+    """
+    The garaga modules the code of a circuit class depends on : the modules of its base
+    classes, and the garaga modules they import, directly or indirectly.
+    """
+    return _module_dependencies(
+        [
+            cls.__module__
+            for cls in circuit_class.__mro__
+            if cls.__module__.split(".")[0] == "garaga"
+        ]
+    )
+
+
+def circuit_cache_key(
+    circuit_class: type,
+    params: list[dict] | None,
+    curve_id: CurveID,
+    compilation_mode: int,
+) -> str:
+    """
+    Content key of the compilation of a circuit class for a curve : sha256 of the source
+    of the modules it depends on, of its parameters, of the curve, of the compilation mode
+    and of the compiler version.
+    """
+    h = hashlib.sha256(_compiler_version())
+    for module_name in circuit_source_modules(circuit_class):
+        h.update(module_name.encode())
+        h.update(_module_source_hash(module_name))
+    h.update(circuit_class.__qualname__.encode())
+    h.update(json.dumps(params, sort_keys=True, default=repr).encode())
+    h.update(f"{curve_id.value}:{compilation_mode}".encode())
+    return h.hexdigest()
+
+
+def _write_cache_file(filename: str, data: dict) -> None:
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        tmp = f"{filename}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, filename)
+    except OSError:
+        pass
+
+
+def _read_cache_file(filename: str) -> dict | None:
+    try:
+        with open(filename, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_compiled_circuit(key: str, entry: dict) -> None:
+    _write_cache_file(os.path.join(CIRCUITS_CACHE_DIR, f"{key}.json"), entry)
+
+
+def load_compiled_circuit(key: str) -> dict | None:
+    return _read_cache_file(os.path.join(CIRCUITS_CACHE_DIR, f"{key}.json"))
+
+
+def _sha256_file(path: str) -> str | None:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
 def initialize_compilation(
     PRECOMPILED_CIRCUITS_DIR: str, CIRCUITS_TO_COMPILE: dict
 ) -> tuple[
@@ -380,25 +565,23 @@ def initialize_compilation(
     dict[str, set[str]],
     dict[str, set[str]],
     dict[str, set[str]],
-    dict[str, open],
+    dict[str, io.StringIO],
 ]:
     """
-    Initialize the compilation process by creating the necessary directories and files.
+    Initialize the compilation process by creating the necessary directories and buffers.
     Returns :
         - filenames_used: set of all filenames that will be used
         - codes: dict of sets of strings, where each set contains the compiled circuits for a given filename
         - cairo1_tests_functions: dict of sets of strings, where each set contains the cairo1 tests for a given filename
         - cairo1_full_function_names: dict of sets of strings, where each set contains the full function names for a given filename
-        - files: dict of open files, where each file is for a given filename
+        - files: dict of in-memory buffers, where each buffer is for a given filename
     """
     create_directory(PRECOMPILED_CIRCUITS_DIR)
     filenames_used = set([v["filename"] for v in CIRCUITS_TO_COMPILE.values()])
     codes = {filename: set() for filename in filenames_used}
     cairo1_tests_functions = {filename: set() for filename in filenames_used}
     cairo1_full_function_names = {filename: set() for filename in filenames_used}
-    files = {
-        f: open(f"{PRECOMPILED_CIRCUITS_DIR}{f}.cairo", "w") for f in filenames_used
-    }
+    files = {f: io.StringIO() for f in filenames_used}
     return (
         filenames_used,
         codes,
@@ -409,7 +592,7 @@ def initialize_compilation(
 
 
 def write_headers(
-    files: dict[str, open],
+    files: dict[str, io.StringIO],
     compilation_mode: int,
     output_sizes_exceeding_limit: dict[str, set[int]],
 ) -> None:
@@ -467,37 +650,79 @@ def compile_circuits(
     cairo1_tests_functions: dict[str, set[str]],
     output_sizes_exceeding_limit: dict[str, set[int]],
     limit: int,
-) -> None:
+    use_cache: bool = True,
+) -> tuple[int, int]:
     """
-    Compile the circuits and write them to the files.
+    Compile the circuits, or load them from the cache when their key is unchanged.
+    Returns the number of cache hits and misses.
     """
+    hits, misses = 0, 0
     for circuit_id, circuit_info in CIRCUITS_TO_COMPILE.items():
         for curve_id in circuit_info.get(
             "curve_ids", [CurveID.BN254, CurveID.BLS12_381]
         ):
             filename_key = circuit_info["filename"]
-            compiled_circuits, full_function_names, circuit_instances = compile_circuit(
-                curve_id,
+            key = circuit_cache_key(
                 circuit_info["class"],
                 circuit_info["params"],
+                curve_id,
                 compilation_mode,
-                filename_key,
             )
-            codes[filename_key].update(compiled_circuits)
-            for circuit_instance in circuit_instances:
-                output_length = len(circuit_instance.circuit.output)
+            entry = load_compiled_circuit(key) if use_cache else None
+            if entry is None:
+                misses += 1
+                entry = compile_circuit_entry(
+                    curve_id, circuit_info, compilation_mode, filename_key
+                )
+                if use_cache:
+                    save_compiled_circuit(key, entry)
+            else:
+                hits += 1
+
+            codes[filename_key].update(entry["compiled_circuits"])
+            for output_length in entry["output_lengths"]:
                 if output_length > limit:
                     output_sizes_exceeding_limit[filename_key].add(output_length)
 
             if compilation_mode == 1:
-                cairo1_full_function_names[filename_key].update(full_function_names)
-                generate_cairo1_tests(
-                    circuit_instances,
-                    full_function_names,
-                    curve_id,
-                    cairo1_tests_functions,
-                    filename_key,
+                cairo1_full_function_names[filename_key].update(
+                    entry["full_function_names"]
                 )
+                cairo1_tests_functions[filename_key].update(entry["cairo1_tests"])
+    return hits, misses
+
+
+def compile_circuit_entry(
+    curve_id: CurveID, circuit_info: dict, compilation_mode: int, filename_key: str
+) -> dict:
+    """
+    Compile a circuit class for a curve, to the JSON entry stored in the cache.
+    """
+    compiled_circuits, full_function_names, circuit_instances = compile_circuit(
+        curve_id,
+        circuit_info["class"],
+        circuit_info["params"],
+        compilation_mode,
+        filename_key,
+    )
+    cairo1_tests = {filename_key: set()}
+    if compilation_mode == 1:
+        generate_cairo1_tests(
+            circuit_instances,
+            full_function_names,
+            curve_id,
+            cairo1_tests,
+            filename_key,
+        )
+    return {
+        "compiled_circuits": compiled_circuits,
+        "full_function_names": full_function_names,
+        "output_lengths": [
+            len(circuit_instance.circuit.output)
+            for circuit_instance in circuit_instances
+        ],
+        "cairo1_tests": sorted(cairo1_tests[filename_key]),
+    }
 
 
 def generate_cairo1_tests(
@@ -528,7 +753,7 @@ def generate_cairo1_tests(
 
 
 def write_compiled_circuits(
-    files: dict[str, open],
+    files: dict[str, io.StringIO],
     codes: dict[str, set[str]],
     cairo1_full_function_names: dict[str, set[str]],
     cairo1_tests_functions: dict[str, set[str]],
@@ -549,7 +774,7 @@ def write_compiled_circuits(
 
 
 def write_cairo1_tests(
-    file: open,
+    file: io.StringIO,
     filename: str,
     cairo1_full_function_names: dict[str, set[str]],
     cairo1_tests_functions: dict[str, set[str]],
@@ -564,18 +789,50 @@ def write_cairo1_tests(
     file.write("}\n")
 
 
+def write_changed_files(
+    PRECOMPILED_CIRCUITS_DIR: str, files: dict[str, io.StringIO]
+) -> tuple[list[str], dict]:
+    """
+    Write the .cairo files whose generated content changed since the last run, or that
+    were modified on disk since. Returns the written filenames and the files manifest.
+    """
+    manifest_path = os.path.join(CIRCUITS_CACHE_DIR, "files.json")
+    manifest = _read_cache_file(manifest_path) or {}
+    written = []
+    for filename, buffer in sorted(files.items()):
+        path = os.path.realpath(f"{PRECOMPILED_CIRCUITS_DIR}{filename}.cairo")
+        content = buffer.getvalue()
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        known = manifest.get(path, {})
+        if known.get("generated") == content_hash and _sha256_file(path) == known.get(
+            "formatted"
+        ):
+            continue
+        with open(path, "w") as f:
+            f.write(content)
+        manifest[path] = {"generated": content_hash}
+        written.append(filename)
+    return written, manifest
+
+
 def main(
     PRECOMPILED_CIRCUITS_DIR: str,
     CIRCUITS_TO_COMPILE: dict[CircuitID, dict],
     compilation_mode: int = 1,
+    use_cache: bool = True,
 ):
-    """Compiles and writes all circuits to .cairo files"""
+    """
+    Compiles and writes all circuits to .cairo files.
+    Compiled circuits are cached in CIRCUITS_CACHE_DIR, keyed by circuit_cache_key, and only
+    the .cairo files whose content changed are written and formatted.
+    """
+    clear_source_hashes()
     filenames_used, codes, cairo1_tests_functions, cairo1_full_function_names, files = (
         initialize_compilation(PRECOMPILED_CIRCUITS_DIR, CIRCUITS_TO_COMPILE)
     )
     output_sizes_exceeding_limit = {filename: set() for filename in filenames_used}
     limit = 15
-    compile_circuits(
+    hits, misses = compile_circuits(
         CIRCUITS_TO_COMPILE,
         compilation_mode,
         codes,
@@ -583,7 +840,9 @@ def main(
         cairo1_tests_functions,
         output_sizes_exceeding_limit,
         limit,
+        use_cache,
     )
+    print(f"Circuits cache: {hits} hits, {misses} misses")
     write_headers(files, compilation_mode, output_sizes_exceeding_limit)
     write_compiled_circuits(
         files,
@@ -593,12 +852,16 @@ def main(
         compilation_mode,
     )
 
-    for file in files.values():
-        file.close()
-
-    format_cairo_files_in_parallel(
-        filenames_used, compilation_mode, PRECOMPILED_CIRCUITS_DIR
-    )
+    written, manifest = write_changed_files(PRECOMPILED_CIRCUITS_DIR, files)
+    print(f"{len(written)}/{len(files)} .cairo files changed")
+    if written:
+        format_cairo_files_in_parallel(
+            written, compilation_mode, PRECOMPILED_CIRCUITS_DIR
+        )
+        for filename in written:
+            path = os.path.realpath(f"{PRECOMPILED_CIRCUITS_DIR}{filename}.cairo")
+            manifest[path]["formatted"] = _sha256_file(path)
+        _write_cache_file(os.path.join(CIRCUITS_CACHE_DIR, "files.json"), manifest)
     return None
 
 
@@ -6,7 +6,12 @@ from typing import Type
 
 from garaga.definitions import CurveID, get_base_field
 from garaga.hints.io import int_array_to_u384_array
-from garaga.modulo_circuit import ModuloCircuit, ModuloCircuitElement, PyFelt
+from garaga.modulo_circuit import (
+    CircuitProgram,
+    ModuloCircuit,
+    ModuloCircuitElement,
+    PyFelt,
+)
 from garaga.modulo_circuit_structs import Cairo1SerializableStruct
 
 
@@ -39,6 +44,7 @@ class BaseModuloCircuit(ABC):
         self.init_hash = None
         self.generic_over_curve = False
         self.compilation_mode = compilation_mode
+        self._program: CircuitProgram | None = None
         if auto_run:
             self.input = self.build_input()
             self.circuit: ModuloCircuit = self._run_circuit_inner(self.input.copy())
@@ -86,6 +92,34 @@ class BaseModuloCircuit(ABC):
         circuit_input = [self.field(x) for x in input]
         return self._run_circuit_inner(circuit_input)
 
+    @property
+    def program(self) -> CircuitProgram:
+        """
+        The recorded CircuitProgram of the circuit, compiled once from the traced ModuloCircuit.
+        """
+        if self._program is None:
+            if getattr(self, "circuit", None) is None:
+                raise ValueError("Circuit not run yet")
+            self._program = self.circuit.compile_program()
+        return self._program
+
+    def run_program(self, input: list[int], check_asserts: bool = False) -> list[int]:
+        """
+        Replays the recorded program on a new input of the same shape and returns the output values,
+        without re-tracing the circuit.
+        The input is ordered as the circuit input stacks (INPUT, COMMIT, WITNESS, FELT), which is
+        the same as the run_circuit input for circuits that only write INPUT elements.
+        """
+        return self.program.evaluate(input, check_asserts)
+
+    def run_program_batch(
+        self, inputs: list[list[int]], check_asserts: bool = False
+    ) -> list[list[int]]:
+        """
+        Replays the recorded program on many inputs of the same shape at once, see CircuitProgram.evaluate_batch.
+        """
+        return self.program.evaluate_batch(inputs, check_asserts)
+
 
 class BaseEXTFCircuit(BaseModuloCircuit):
     """
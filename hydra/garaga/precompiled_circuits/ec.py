@@ -1,5 +1,4 @@
-import sympy
-
+from garaga import modular_sqrt
 from garaga.definitions import CURVES
 from garaga.extension_field_modulo_circuit import (
     ExtensionFieldModuloCircuit,
@@ -14,14 +13,14 @@ def is_quad_residue(n, p):
     """
     Returns True if n is a quadratic residue mod p.
     """
-    return sympy.ntheory.residue_ntheory.is_quad_residue(n, p)
+    return n % p == 0 or modular_sqrt.is_square(n, p)
 
 
 def sqrt_mod_p(n, p):
     """
     Finds the minimum non-negative integer m such that (m*m) % p == n.
     """
-    return min(sympy.ntheory.residue_ntheory.sqrt_mod(n, p, all_roots=True))
+    return modular_sqrt.sqrt_roots(n, p)[0]
 
 
 class IsOnCurveCircuit(ModuloCircuit):
@@ -58,6 +58,14 @@ def bn256_scalar_mul(p1: tuple[int, int], scalar: int) -> tuple[int, int]:
     return (b.x, b.y)
 
 
+def bn256_msm(points: list[tuple[int, int]], scalars: list[int]) -> tuple[int, int]:
+    from garaga.definitions import G1Point  # shadowed locally
+
+    # The input points are checked to be on the curve, the intermediate sums are not.
+    res = G1Point.msm([G1Point(x, y, CurveID.BN254) for x, y in points], scalars)
+    return (res.x, res.y)
+
+
 def bn256_pairing(
     p1_list: list[tuple[int, int]], p2_list: list[tuple[int, int, int, int]]
 ) -> bool:
@@ -247,6 +255,11 @@ def ecAdd(point0: G1Point, point1: G1Point) -> G1Point:
     return G1Point(x=x, y=y)
 
 
+def ecMSM(points: list[G1Point], scalars: list[PyFelt]) -> G1Point:
+    (x, y) = bn256_msm([(p.x, p.y) for p in points], [s.value for s in scalars])
+    return G1Point(x=x, y=y)
+
+
 def ecNeg(point: G1Point) -> G1Point:
     return G1Point(x=point.x, y=(Q - point.y) % Q)
 
@@ -1607,18 +1620,15 @@ def computeCZetaX(
 
 # Scalar Mul and acumulate into total
 def batchMul(base: list[G1Point], scalars: list[PyFelt]) -> G1Point:
-    result = ecMul(base[0], scalars[0])
-    for i in range(1, LOG_N + 1):
-        result = ecAdd(result, ecMul(base[i], scalars[i]))
-    return result
+    return ecMSM(base[: LOG_N + 1], scalars[: LOG_N + 1])
 
 
 # This implementation is the same as above with different constants
 def batchMul2(base: list[G1Point], scalars: list[PyFelt]) -> G1Point:
-    result = ecMul(base[0], scalars[0])
-    for i in range(1, NUMBER_OF_ENTITIES + LOG_N + 1):
-        result = ecAdd(result, ecMul(base[i], scalars[i]))
-    return result
+    return ecMSM(
+        base[: NUMBER_OF_ENTITIES + LOG_N + 1],
+        scalars[: NUMBER_OF_ENTITIES + LOG_N + 1],
+    )
 
 
 def zkgReduceVerify(
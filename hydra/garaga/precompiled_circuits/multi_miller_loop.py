@@ -1,12 +1,16 @@
+import hashlib
+import os
 from typing import Iterator, Tuple
 
 from garaga.definitions import (
     BLS12_381_ID,
+    BN254_FROBENIUS_CONSTANTS,
     BN254_ID,
     CURVES,
     CurveID,
     G1Point,
     G2Point,
+    get_base_field,
     precompute_lineline_sparsity,
 )
 from garaga.extension_field_modulo_circuit import (
@@ -588,43 +592,13 @@ class MultiMillerLoopCircuit(ExtensionFieldModuloCircuit):
         Qs: list[tuple[list[ModuloCircuitElement], list[ModuloCircuitElement]]],
     ):
         def set_or_get_constants():
-            nr1p2 = [
-                self.set_or_get_constant(
-                    self.field(
-                        21575463638280843010398324269430826099269044274347216827212613867836435027261
-                    )
-                ),
-                self.set_or_get_constant(
-                    self.field(
-                        10307601595873709700152284273816112264069230130616436755625194854815875713954
-                    )
-                ),
-            ]  # Non residue 1 power 2
-
-            nr1p3 = [
-                self.set_or_get_constant(
-                    self.field(
-                        2821565182194536844548159561693502659359617185244120367078079554186484126554
-                    ),
-                ),
-                self.set_or_get_constant(
-                    self.field(
-                        3505843767911556378687030309984248845540243509899259641013678093033130930403
-                    ),
-                ),
-            ]  # Non residue 1 power 3
-
-            nr2p2 = self.set_or_get_constant(
-                self.field(
-                    21888242871839275220042445260109153167277707414472061641714758635765020556616
-                )  # non_residue_2_power_2
+            nr1p2, nr1p3, nr2p2, nr2p3 = BN254_FROBENIUS_CONSTANTS
+            return (
+                [self.set_or_get_constant(self.field(c)) for c in nr1p2],
+                [self.set_or_get_constant(self.field(c)) for c in nr1p3],
+                self.set_or_get_constant(self.field(nr2p2)),
+                self.set_or_get_constant(self.field(nr2p3)),
             )
-            nr2p3 = self.set_or_get_constant(
-                self.field(
-                    -21888242871839275222246405745257275088696311157297823662689037894645226208582
-                )
-            )  # (-1) * non_residue_2_power_3
-            return nr1p2, nr1p3, nr2p2, nr2p3
 
         new_lines = []
         for k in range(self.n_pairs):
@@ -740,9 +714,84 @@ class MultiMillerLoopCircuit(ExtensionFieldModuloCircuit):
         return f
 
 
-def precompute_lines(Qs: list[G2Point]) -> list[PyFelt]:
+LINES_CACHE_DIR = "build/lines_cache"
+_LINES_CACHE: dict[str, tuple[int, ...]] = {}
+
+
+def lines_cache_key(Qs: list[G2Point]) -> str:
+    """
+    Content address of the precomputed lines of Qs: sha256 of the curve id followed by
+    the fixed-width big-endian coordinates (x0, x1, y0, y1) of every point.
+    """
+    curve_id = Qs[0].curve_id
+    assert all(
+        Q.curve_id == curve_id for Q in Qs
+    ), f"All points must be on the same curve, got {[Q.curve_id for Q in Qs]}"
+    n_bytes = (CURVES[curve_id.value].p.bit_length() + 7) // 8
+    h = hashlib.sha256(curve_id.value.to_bytes(1, "big"))
+    for Q in Qs:
+        for c in (Q.x[0], Q.x[1], Q.y[0], Q.y[1]):
+            h.update(c.to_bytes(n_bytes, "big"))
+    return f"{curve_id.name.lower()}_{h.hexdigest()}"
+
+
+def save_lines(key: str, lines: list[int], n_bytes: int) -> None:
+    """
+    Writes the lines as a flat array of fixed-width big-endian integers.
+    The cache is best effort : a read-only or missing build directory only disables it.
+    """
+    filename = os.path.join(LINES_CACHE_DIR, f"{key}.bin")
+    try:
+        os.makedirs(LINES_CACHE_DIR, exist_ok=True)
+        tmp = f"{filename}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"".join(x.to_bytes(n_bytes, "big") for x in lines))
+        os.replace(tmp, filename)
+    except OSError:
+        pass
+
+
+def load_lines(key: str, n_bytes: int) -> list[int] | None:
+    filename = os.path.join(LINES_CACHE_DIR, f"{key}.bin")
+    try:
+        with open(filename, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) == 0 or len(data) % (4 * n_bytes) != 0:
+        return None
+    return [
+        int.from_bytes(data[i : i + n_bytes], "big")
+        for i in range(0, len(data), n_bytes)
+    ]
+
+
+def precompute_lines(Qs: list[G2Point], use_cache: bool = True) -> list[PyFelt]:
+    """
+    Returns the line coefficients of the Miller loop of the fixed G2 points Qs.
+    Results are cached in memory and in LINES_CACHE_DIR, keyed by lines_cache_key(Qs),
+    so that the lines of a given verifying key are only computed once.
+    """
     if len(Qs) == 0:
         return []
+    if not use_cache:
+        return _compute_lines(Qs)
+
+    field = get_base_field(Qs[0].curve_id)
+    n_bytes = (field.p.bit_length() + 7) // 8
+    key = lines_cache_key(Qs)
+    lines = _LINES_CACHE.get(key)
+    if lines is None:
+        lines = load_lines(key, n_bytes)
+        if lines is None:
+            lines = [x.value for x in _compute_lines(Qs)]
+            save_lines(key, lines, n_bytes)
+        lines = tuple(lines)
+        _LINES_CACHE[key] = lines
+    return [field(x) for x in lines]
+
+
+def _compute_lines(Qs: list[G2Point]) -> list[PyFelt]:
     curve_id = Qs[0].curve_id.value
     loop_counter = CURVES[curve_id].loop_counter
     start_index = len(loop_counter) - 2
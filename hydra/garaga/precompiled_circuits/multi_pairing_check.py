@@ -8,7 +8,10 @@ from garaga.definitions import (
     get_sparsity,
 )
 from garaga.hints.frobenius import generate_frobenius_maps
-from garaga.hints.multi_miller_witness import get_final_exp_witness
+from garaga.hints.multi_miller_witness import (
+    get_final_exp_witness,
+    multi_miller_loop,
+)
 from garaga.hints.tower_backup import E6, E12
 from garaga.modulo_circuit import ModuloCircuitElement, PyFelt, WriteOps
 from garaga.precompiled_circuits.multi_miller_loop import MultiMillerLoopCircuit
@@ -25,29 +28,44 @@ def get_root_and_scaling_factor(
         ]
     ],
     m: list[ModuloCircuitElement] = None,
+    debug: bool = False,
 ) -> tuple[list[PyFelt], list[PyFelt], list[int]]:
+    """
+    Computes the final exponentiation witnesses (lambda_root, scaling_factor) of the Miller loop output
+    of the pairs (P, Q), multiplied by m if given.
+    The Miller loop is computed natively on integers. In debug mode, it is also traced with a
+    MultiMillerLoopCircuit and both results are checked to be equal.
+    """
     assert (
         len(P) == len(Q) >= 2
     ), f"P and Q must have the same length and >= 2, got {len(P)} and {len(Q)}"
-    field = get_base_field(curve_id)
-    c_input: list[PyFelt] = []
-
-    c: MultiMillerLoopCircuit = MultiMillerLoopCircuit(
-        name="mock", curve_id=curve_id, n_pairs=len(P)
-    )
     if isinstance(P[0], G1Point):
-        c.write_p_and_q(P, Q)
+        P_ints = [(p.x, p.y) for p in P]
+        Q_ints = [(q.x, q.y) for q in Q]
     elif isinstance(P[0], tuple) and isinstance(P[0][0], ModuloCircuitElement):
-        for p, q in zip(P, Q):
-            c_input.append(p[0].felt)
-            c_input.append(p[1].felt)
-            c_input.append(q[0][0].felt)
-            c_input.append(q[0][1].felt)
-            c_input.append(q[1][0].felt)
-            c_input.append(q[1][1].felt)
+        P_ints = [(p[0].value, p[1].value) for p in P]
+        Q_ints = [
+            ((q[0][0].value, q[0][1].value), (q[1][0].value, q[1][1].value)) for q in Q
+        ]
+    else:
+        raise TypeError(f"Unsupported point type {type(P[0])}")
+
+    field = get_base_field(curve_id)
+    f = E12.from_direct(
+        [field(x) for x in multi_miller_loop(curve_id, P_ints, Q_ints)], curve_id
+    )
+
+    if debug:
+        c: MultiMillerLoopCircuit = MultiMillerLoopCircuit(
+            name="mock", curve_id=curve_id, n_pairs=len(P)
+        )
+        c_input: list[PyFelt] = []
+        for (px, py), ((qx0, qx1), (qy0, qy1)) in zip(P_ints, Q_ints):
+            c_input.extend([field(x) for x in (px, py, qx0, qx1, qy0, qy1)])
         c.write_p_and_q_raw(c_input)
+        f_traced = E12.from_direct(c.miller_loop(len(P)), curve_id)
+        assert f == f_traced, "Native and traced Miller loop outputs differ"
 
-    f = E12.from_direct(c.miller_loop(len(P)), curve_id)
     if m is not None:
         M = E12.from_direct(m, curve_id)
         f = f * M
@@ -5,10 +5,14 @@ Various tools for bls signatures or other signature schemes.
 from __future__ import annotations
 
 import hashlib
+from functools import lru_cache
 from typing import Protocol, TypeVar
 
+from garaga import garaga_rs, modular_sqrt
 from garaga.algebra import Polynomial, PyFelt, RationalFunction
 from garaga.definitions import CURVES, CurveID, G1Point, get_base_field
+from garaga.int_poly import batch_inverse
+from garaga.int_poly import evaluate as horner
 
 T = TypeVar("T", bound="HashProtocol")
 
@@ -168,71 +172,100 @@ def hash_to_field(
 def hash_to_curve(
     message: bytes, curve_id: CurveID, hash_name: str = "sha256"
 ) -> G1Point:
-    felt0, felt1 = hash_to_field(message, 2, curve_id, hash_name)
+    return hash_to_curve_many([message], curve_id, hash_name)[0]
 
-    pt0 = map_to_curve(felt0, curve_id)
-    # print(f"pt0 {pt0}\n\n")
-    pt1 = map_to_curve(felt1, curve_id)
-    # print(f"pt1 {pt1}")
-    assert pt0.iso_point == True, f"Point {pt0} is not an iso point"
-    assert pt1.iso_point == True, f"Point {pt1} is not an iso point"
 
+def hash_to_curve_many(
+    messages: list[bytes], curve_id: CurveID, hash_name: str = "sha256"
+) -> list[G1Point]:
+    """
+    Hashes many messages to G1. Done natively in a single garaga_rs call when available,
+    otherwise the isogeny of all the points is evaluated with a single field inversion.
+    """
+    curve_id = CurveID(curve_id)
+    if (
+        curve_id == CurveID.BLS12_381
+        and hash_name == "sha256"
+        and hasattr(garaga_rs, "hash_to_curve_many")
+    ):
+        res = garaga_rs.hash_to_curve_many(curve_id.value, DST, list(messages))
+        return [G1Point.trusted(x, y, curve_id) for x, y in res]
+
+    iso_points = []
+    for message in messages:
+        felt0, felt1 = hash_to_field(message, 2, curve_id, hash_name)
+        pt0 = map_to_curve(felt0, curve_id)
+        pt1 = map_to_curve(felt1, curve_id)
+        sum = pt0.add(pt1)
+        assert sum.iso_point == True, f"Point {sum} is not an iso point"
+        iso_points.append(sum)
+
+    cofactor = get_cofactor(curve_id)
+    return [pt.scalar_mul(cofactor) for pt in apply_isogeny_many(iso_points)]
+
+
+@lru_cache(maxsize=None)
+def get_cofactor(curve_id: CurveID) -> int:
+    """
+    Returns the scalar that clears the cofactor of the hashed points.
+    """
     if curve_id == CurveID.BLS12_381:
         x = CURVES[curve_id.value].x
         n = CURVES[curve_id.value].n
-        cofactor = (1 - (x % n)) % n
-    else:
-        cofactor = CURVES[curve_id.value].h
+        return (1 - (x % n)) % n
+    return CURVES[curve_id.value].h
 
-    # print(f"cofactor {cofactor}")
-    sum = pt0.add(pt1)
-    assert sum.iso_point == True, f"Point {sum} is not an iso point"
-
-    return apply_isogeny(sum).scalar_mul(cofactor)
 
+@lru_cache(maxsize=None)
+def get_swu_constants(curve_id: CurveID) -> tuple[int, int, int, int]:
+    """
+    Returns (p, A, B, Z), the parameters of the simplified SWU map of the curve.
+    """
+    curve = CURVES[CurveID(curve_id).value]
+    p = curve.p
+    return p, curve.swu_params.A % p, curve.swu_params.B % p, curve.swu_params.Z % p
 
-def map_to_curve(field_element: PyFelt, curve_id: CurveID) -> G1Point:
-    field = get_base_field(curve_id)
-    a = field(CURVES[curve_id.value].swu_params.A)
-    b = field(CURVES[curve_id.value].swu_params.B)
-    z = field(CURVES[curve_id.value].swu_params.Z)
 
-    u = field_element
-    zeta_u2 = z * u**2
-    ta = zeta_u2**2 + zeta_u2
-    num_x1 = b * (ta + field.one())
+def map_to_curve_int(u: int, curve_id: CurveID) -> tuple[int, int, bool, int, bool]:
+    """
+    Simplified SWU map to the isogenous curve, on integers.
+    Returns the affine coordinates (x, y) of the point, and the (gx1_is_square, y1,
+    y_flag) values of the map to curve hint.
+    """
+    p, a, b, z = get_swu_constants(curve_id)
+    zeta_u2 = z * u * u % p
+    ta = (zeta_u2 * zeta_u2 + zeta_u2) % p
+    num_x1 = b * (ta + 1) % p
 
-    if ta.value == 0:
-        div = a * z
+    if ta == 0:
+        div = a * z % p
     else:
-        div = a * -ta
+        div = -a * ta % p
 
-    num2_x1 = num_x1**2
-    div2 = div**2
-    div3 = div2 * div
-    assert div3.value != 0
+    div2 = div * div % p
+    div3 = div2 * div % p
+    assert div3 != 0
 
-    num_gx1 = (num2_x1 + a * div2) * num_x1 + b * div3
+    num_gx1 = ((num_x1 * num_x1 + a * div2) * num_x1 + b * div3) % p
+    num_x2 = zeta_u2 * num_x1 % p
 
-    num_x2 = zeta_u2 * num_x1
+    gx1 = num_gx1 * pow(div3, -1, p) % p
+    gx1_square = modular_sqrt.is_square(gx1, p)
+    _, y1 = modular_sqrt.sqrt_roots(gx1 if gx1_square else z * gx1 % p, p)
 
-    gx1 = num_gx1 / div3
-    gx1_square = gx1.is_quad_residue()
-    if gx1_square:
-        y1 = gx1.sqrt(min_root=False)
-        assert y1 * y1 == gx1
-    else:
-        y1 = (z * gx1).sqrt(min_root=False)
-        assert y1 * y1 == z * gx1
+    y2 = zeta_u2 * u * y1 % p
+    y = y1 if gx1_square else y2
+    y_flag = y % 2 == u % 2
 
-    y2 = zeta_u2 * u * y1
     num_x = num_x1 if gx1_square else num_x2
-    y = y1 if gx1_square else y2
-    x_affine = num_x / div
-    y_affine = -y if y.value % 2 != u.value % 2 else y
+    x_affine = num_x * pow(div, -1, p) % p
+    y_affine = y if y_flag else -y % p
+    return x_affine, y_affine, gx1_square, y1, y_flag
 
-    point_on_curve = G1Point(x_affine.value, y_affine.value, curve_id, iso_point=True)
-    return point_on_curve
+
+def map_to_curve(field_element: PyFelt, curve_id: CurveID) -> G1Point:
+    x, y, _, _, _ = map_to_curve_int(field_element.value, curve_id)
+    return G1Point.trusted(x, y, curve_id, iso_point=True)
 
 
 # https://github.com/arkworks-rs/algebra/blob/master/curves/bls12_381/src/curves/g1_swu_iso.rs
@@ -337,14 +370,51 @@ def get_isogeny_to_g1_map(
             )
 
 
+@lru_cache(maxsize=None)
+def get_isogeny_coefficients(
+    curve_id: CurveID,
+) -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], tuple[int, ...]]:
+    """
+    Returns the coefficients of the x numerator, x denominator, y numerator and
+    y denominator of the isogeny to G1, built once per curve.
+    """
+    return tuple(
+        tuple(c.value for c in poly.coefficients)
+        for rational in get_isogeny_to_g1_map(CurveID(curve_id))
+        for poly in (rational.numerator, rational.denominator)
+    )
+
+
 def apply_isogeny(pt: G1Point) -> G1Point:
-    assert pt.iso_point == True, f"Point {pt} is not an iso point"
-    field = get_base_field(pt.curve_id)
-    x_rational, y_rational = get_isogeny_to_g1_map(pt.curve_id)
-    x_affine = x_rational.evaluate(field(pt.x))
-    y_affine = y_rational.evaluate(field(pt.x)) * field(pt.y)
+    return apply_isogeny_many([pt])[0]
 
-    return G1Point(x_affine.value, y_affine.value, pt.curve_id, iso_point=False)
+
+def apply_isogeny_many(points: list[G1Point]) -> list[G1Point]:
+    """
+    Maps iso points to G1 with Horner evaluations of the isogeny, sharing a single
+    field inversion for all the denominators.
+    """
+    if len(points) == 0:
+        return []
+    assert all(
+        pt.iso_point == True for pt in points
+    ), f"Points {points} are not all iso points"
+    curve_id = points[0].curve_id
+    p = CURVES[curve_id.value].p
+    x_num, x_den, y_num, y_den = get_isogeny_coefficients(curve_id)
+
+    dens = []
+    for pt in points:
+        dens.append(horner(x_den, pt.x, p))
+        dens.append(horner(y_den, pt.x, p))
+    inv_dens = batch_inverse(dens, p)
+
+    res = []
+    for i, pt in enumerate(points):
+        x_affine = horner(x_num, pt.x, p) * inv_dens[2 * i] % p
+        y_affine = horner(y_num, pt.x, p) * inv_dens[2 * i + 1] * pt.y % p
+        res.append(G1Point.trusted(x_affine, y_affine, curve_id, iso_point=False))
+    return res
 
 
 if __name__ == "__main__":
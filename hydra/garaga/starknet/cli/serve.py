@@ -0,0 +1,275 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Annotated, List, Optional
+
+import rich
+import typer
+from aiohttp import web
+
+from garaga.starknet.groth16_contract_generator.calldata import (
+    groth16_calldata_from_vk_and_proof,
+)
+from garaga.starknet.groth16_contract_generator.parsing_utils import (
+    Groth16Proof,
+    Groth16VerifyingKey,
+)
+
+# Maximum number of verifying keys kept by the server, and parsed by each worker.
+MAX_VKS = 128
+
+# Parsed verifying keys of a worker process, by vk id, least recently used first.
+_WORKER_VKS: OrderedDict[str, Groth16VerifyingKey] = OrderedDict()
+_WORKER_MAX_VKS = MAX_VKS
+
+EXECUTOR = web.AppKey("executor", concurrent.futures.Executor)
+STATE = web.AppKey("state", "ServerState")
+
+
+def vk_id(vk: dict) -> str:
+    """
+    Content identifier of a verifying key JSON object.
+    """
+    return hashlib.sha256(json.dumps(vk, sort_keys=True).encode()).hexdigest()
+
+
+class WorkerMissingVk(Exception):
+    """
+    Raised by a worker asked for a verifying key by id only, that it has not parsed.
+    """
+
+
+def _init_worker(vks: dict[str, dict], max_vks: int) -> None:
+    global _WORKER_MAX_VKS
+    _WORKER_MAX_VKS = max_vks
+    # Keeps the server logs clean of the parsing logs.
+    with contextlib.redirect_stdout(sys.stderr):
+        for key, vk in vks.items():
+            _worker_vk(key, vk)
+
+
+def _worker_vk(key: str, vk: dict | None) -> Groth16VerifyingKey:
+    vk_obj = _WORKER_VKS.get(key)
+    if vk_obj is not None:
+        _WORKER_VKS.move_to_end(key)
+        return vk_obj
+    if vk is None:
+        raise WorkerMissingVk(key)
+    vk_obj = Groth16VerifyingKey.from_dict(vk)
+    _WORKER_VKS[key] = vk_obj
+    while len(_WORKER_VKS) > _WORKER_MAX_VKS:
+        _WORKER_VKS.popitem(last=False)
+    return vk_obj
+
+
+def _worker_calldata(
+    key: str, vk: dict | None, proof: dict, public_inputs: list | dict | None
+) -> list[int]:
+    """
+    vk is None when the worker is expected to have parsed it already.
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        vk_obj = _worker_vk(key, vk)
+        proof_obj = Groth16Proof.from_dict(proof, public_inputs)
+        return groth16_calldata_from_vk_and_proof(vk=vk_obj, proof=proof_obj)
+
+
+class ServerState:
+    def __init__(self, vks: dict[str, dict], max_pending: int, max_vks: int):
+        # Least recently used first.
+        self.vks: OrderedDict[str, dict] = OrderedDict(vks)
+        self.max_pending = max_pending
+        self.max_vks = max_vks
+        self.pending = 0
+        self.started_at = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.vk_uploads = 0
+
+    def use_vk(self, key: str, vk: dict | None = None) -> tuple[dict, bool]:
+        """
+        Returns the verifying key of an id, and whether it was just added.
+        """
+        if key in self.vks:
+            self.vks.move_to_end(key)
+            return self.vks[key], False
+        if vk is None:
+            raise ValueError(f"Unknown vk_id {key}, send the verifying key")
+        self.vks[key] = vk
+        while len(self.vks) > self.max_vks:
+            self.vks.popitem(last=False)
+        return vk, True
+
+    def metrics(self) -> dict:
+        done = self.requests - self.rejected
+        return {
+            "uptime_s": time.time() - self.started_at,
+            "requests": self.requests,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "in_flight": self.pending,
+            "vks": len(self.vks),
+            "avg_latency_s": self.total_latency / done if done else 0.0,
+            "max_latency_s": self.max_latency,
+            "vk_uploads": self.vk_uploads,
+        }
+
+
+async def handle_calldata(request: web.Request) -> web.Response:
+    """
+    POST /calldata with a JSON body {"vk": <vk> | "vk_id": <id>, "proof": <proof>,
+    "public_inputs": <optional public inputs>}. Returns {"vk_id": ..., "calldata": [...]}.
+    """
+    state = request.app[STATE]
+    state.requests += 1
+    if state.pending >= state.max_pending:
+        state.rejected += 1
+        return web.json_response({"error": "Too many pending requests"}, status=503)
+
+    start = time.perf_counter()
+    state.pending += 1
+    try:
+        body = await request.json()
+        if "vk" in body:
+            key = vk_id(body["vk"])
+            vk, new = state.use_vk(key, body["vk"])
+        else:
+            key = body.get("vk_id")
+            vk, new = state.use_vk(key)
+
+        async def run(vk: dict | None) -> list[int]:
+            if vk is not None:
+                state.vk_uploads += 1
+            return await asyncio.get_running_loop().run_in_executor(
+                request.app[EXECUTOR],
+                _worker_calldata,
+                key,
+                vk,
+                body["proof"],
+                body.get("public_inputs"),
+            )
+
+        # Only the id is sent to the workers that already parsed the key.
+        try:
+            calldata = await run(vk if new else None)
+        except WorkerMissingVk:
+            calldata = await run(vk)
+        return web.json_response({"vk_id": key, "calldata": calldata})
+    except Exception as e:
+        state.errors += 1
+        return web.json_response(
+            {"error": f"{type(e).__name__}: {e}"},
+            status=500 if isinstance(e, concurrent.futures.BrokenExecutor) else 400,
+        )
+    finally:
+        state.pending -= 1
+        latency = time.perf_counter() - start
+        state.total_latency += latency
+        state.max_latency = max(state.max_latency, latency)
+
+
+async def handle_metrics(request: web.Request) -> web.Response:
+    return web.json_response(request.app[STATE].metrics())
+
+
+async def handle_vks(request: web.Request) -> web.Response:
+    return web.json_response(sorted(request.app[STATE].vks))
+
+
+def create_app(
+    vks: list[dict] | None = None,
+    workers: int | None = None,
+    max_pending: int = 256,
+    max_vks: int = MAX_VKS,
+) -> web.Application:
+    """
+    Builds the calldata server. The verifying keys are parsed once per worker process
+    and kept in memory, the preloaded ones before the first request. The server and each
+    worker keep at most max_vks keys, evicting the least recently used ones.
+    """
+    vks = {vk_id(vk): vk for vk in vks or []}
+    max_vks = max(max_vks, len(vks))
+    workers = workers or os.cpu_count() or 1
+    app = web.Application()
+    app[STATE] = ServerState(vks, max_pending, max_vks)
+
+    async def start_executor(app: web.Application):
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(vks, max_vks)
+        )
+        app[EXECUTOR] = executor
+        # Starts the workers, which parse the preloaded verifying keys.
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, os.getpid) for _ in range(workers))
+        )
+        yield
+        executor.shutdown(cancel_futures=True)
+
+    app.cleanup_ctx.append(start_executor)
+    app.router.add_post("/calldata", handle_calldata)
+    app.router.add_get("/metrics", handle_metrics)
+    app.router.add_get("/vks", handle_vks)
+    return app
+
+
+def serve(
+    vk: Annotated[
+        Optional[List[Path]],
+        typer.Option(
+            help="Path to a verification key JSON file to preload. Can be repeated.",
+            file_okay=True,
+            dir_okay=False,
+            exists=True,
+            autocompletion=lambda: [],
+        ),
+    ] = None,
+    host: Annotated[str, typer.Option(help="Host to listen on")] = "127.0.0.1",
+    port: Annotated[int, typer.Option(help="Port to listen on")] = 8080,
+    unix_socket: Annotated[
+        Optional[Path],
+        typer.Option(help="Listen on this Unix socket instead of host:port"),
+    ] = None,
+    workers: Annotated[
+        Optional[int],
+        typer.Option(
+            help="Number of worker processes. Defaults to the number of CPUs.", min=1
+        ),
+    ] = None,
+    max_pending: Annotated[
+        int,
+        typer.Option(
+            help="Maximum number of requests in flight, above which requests are rejected with 503.",
+            min=1,
+        ),
+    ] = 256,
+    max_vks: Annotated[
+        int,
+        typer.Option(
+            help="Maximum number of verification keys kept in memory, least recently used ones are evicted.",
+            min=1,
+        ),
+    ] = MAX_VKS,
+):
+    """Run a local calldata server keeping verification keys warm in memory."""
+    vks = []
+    for path in vk or []:
+        with open(path) as f:
+            vks.append(json.load(f))
+    app = create_app(vks, workers, max_pending, max_vks)
+    for key in app[STATE].vks:
+        rich.print(f"[bold]Preloaded vk {key}[/bold]")
+    if unix_socket is not None:
+        web.run_app(app, path=str(unix_socket))
+    else:
+        web.run_app(app, host=host, port=port)
@@ -3,6 +3,7 @@ import typer
 from garaga.starknet.cli.declare import declare_project
 from garaga.starknet.cli.deploy import deploy_project
 from garaga.starknet.cli.gen import gen
+from garaga.starknet.cli.serve import serve
 from garaga.starknet.cli.verify import calldata, verify_onchain
 
 app = typer.Typer(
@@ -15,6 +16,7 @@ app.command(no_args_is_help=True)(declare_project)
 app.command(no_args_is_help=True)(deploy_project)
 app.command(no_args_is_help=True)(verify_onchain)
 app.command(no_args_is_help=True)(calldata)
+app.command()(serve)
 
 
 if __name__ == "__main__":
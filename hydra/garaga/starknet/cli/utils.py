@@ -1,12 +1,16 @@
 import asyncio
+import functools
 import glob
+import hashlib
 import json
 import os
+import re
 import shutil
 import subprocess
 from enum import Enum
 from importlib.metadata import PackageNotFoundError, version
 
+import aiohttp
 import rich
 from starknet_py.contract import Contract
 from starknet_py.net.account.account import Account
@@ -33,12 +37,12 @@ class Network(Enum):
     MAINNET = "mainnet"
 
 
-def load_account(network: Network):
+def load_account(network: Network, session: aiohttp.ClientSession | None = None):
     rpc_url = os.getenv(f"{network.name.upper()}_RPC_URL")
     account_address = os.getenv(f"{network.name.upper()}_ACCOUNT_ADDRESS")
     account_private_key = os.getenv(f"{network.name.upper()}_ACCOUNT_PRIVATE_KEY")
 
-    client = FullNodeClient(node_url=rpc_url)
+    client = FullNodeClient(node_url=rpc_url, session=session)
     account = Account(
         address=account_address,
         client=client,
@@ -52,8 +56,14 @@ def load_account(network: Network):
 
 
 def get_contract_if_exists(account: Account, contract_address: int) -> Contract | None:
+    return asyncio.run(get_contract_if_exists_async(account, contract_address))
+
+
+async def get_contract_if_exists_async(
+    account: Account, contract_address: int
+) -> Contract | None:
     try:
-        res = asyncio.run(Contract.from_address(contract_address, account))
+        res = await Contract.from_address(contract_address, account)
         return res
     except ContractNotFoundError:
 
@@ -65,7 +75,13 @@ def get_contract_if_exists(account: Account, contract_address: int) -> Contract
 
 
 def get_contract_iff_exists(account: Account, contract_address: int) -> Contract:
-    contract = get_contract_if_exists(account, contract_address)
+    return asyncio.run(get_contract_iff_exists_async(account, contract_address))
+
+
+async def get_contract_iff_exists_async(
+    account: Account, contract_address: int
+) -> Contract:
+    contract = await get_contract_if_exists_async(account, contract_address)
     if contract is None:
         rich.print(
             f"[red]Contract {contract_address} does not exists on {account._chain_id.name}[/red]"
@@ -138,12 +154,113 @@ def scarb_build_contract_folder(contract_folder_path: str):
         raise
 
 
+# Relative to the contract folder, kept by the target/dev cleanup before each build.
+SCARB_ARTIFACTS_CACHE_DIR = "target/garaga_artifacts_cache"
+
+
+@functools.lru_cache(maxsize=1)
+def get_scarb_version() -> str:
+    return subprocess.run(
+        ["scarb", "--version"], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _scarb_path_dependencies(package_path: str) -> list[str]:
+    with open(os.path.join(package_path, "Scarb.toml"), "r") as f:
+        scarb_toml = f.read()
+    return [
+        os.path.realpath(os.path.join(package_path, path))
+        for path in re.findall(r'path\s*=\s*"([^"]+)"', scarb_toml)
+    ]
+
+
+def scarb_artifacts_cache_key(contract_folder_path: str) -> str:
+    """
+    Content address of the build artifacts of a contract: sha256 of the scarb version
+    and of the Scarb.toml, Scarb.lock and Cairo sources of the package and of all its
+    local path dependencies.
+    """
+    h = hashlib.sha256(get_scarb_version().encode())
+    seen = set()
+    packages = [os.path.realpath(contract_folder_path)]
+    while packages:
+        package_path = packages.pop()
+        if package_path in seen:
+            continue
+        seen.add(package_path)
+        files = [
+            os.path.join(package_path, name)
+            for name in ("Scarb.toml", "Scarb.lock")
+            if os.path.isfile(os.path.join(package_path, name))
+        ]
+        files += sorted(
+            glob.glob(
+                os.path.join(package_path, "src", "**", "*.cairo"), recursive=True
+            )
+        )
+        for path in files:
+            with open(path, "rb") as f:
+                content = f.read()
+            h.update(os.path.relpath(path, package_path).encode())
+            h.update(len(content).to_bytes(8, "big"))
+            h.update(content)
+        packages.extend(_scarb_path_dependencies(package_path))
+    return h.hexdigest()
+
+
+def save_scarb_artifacts(
+    contract_folder_path: str, key: str, artifacts: tuple[str, str] | tuple[None, None]
+) -> None:
+    """
+    The cache is best effort : a read-only contract folder only disables it.
+    """
+    cache_dir = os.path.join(contract_folder_path, SCARB_ARTIFACTS_CACHE_DIR)
+    filename = os.path.join(cache_dir, f"{key}.json")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{filename}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"sierra": artifacts[0], "casm": artifacts[1]}, f)
+        os.replace(tmp, filename)
+    except OSError:
+        pass
+
+
+def load_scarb_artifacts(
+    contract_folder_path: str, key: str
+) -> tuple[str, str] | tuple[None, None] | None:
+    filename = os.path.join(
+        contract_folder_path, SCARB_ARTIFACTS_CACHE_DIR, f"{key}.json"
+    )
+    try:
+        with open(filename, "r") as f:
+            data = json.load(f)
+        return data["sierra"], data["casm"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
 def get_sierra_casm_artifacts(
-    contract_folder_path: str,
+    contract_folder_path: str, use_cache: bool = True
 ) -> tuple[None, None] | tuple[str, str]:
     """
     Get the Sierra and CASM artifacts for a contract.
+    Artifacts are cached on disk, keyed by scarb_artifacts_cache_key, so that scarb only
+    runs when the sources, the dependencies or the scarb version changed.
     """
+    if not use_cache:
+        return _build_sierra_casm_artifacts(contract_folder_path)
+    key = scarb_artifacts_cache_key(contract_folder_path)
+    artifacts = load_scarb_artifacts(contract_folder_path, key)
+    if artifacts is None:
+        artifacts = _build_sierra_casm_artifacts(contract_folder_path)
+        save_scarb_artifacts(contract_folder_path, key, artifacts)
+    return artifacts
+
+
+def _build_sierra_casm_artifacts(
+    contract_folder_path: str,
+) -> tuple[None, None] | tuple[str, str]:
     target_dir = os.path.join(contract_folder_path, "target/dev/")
 
     # Clean the target/dev/ folder if it already exists
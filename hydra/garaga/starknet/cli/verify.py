@@ -1,23 +1,31 @@
 import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import glob
+import json
+import os
+import sys
+import time
 from enum import Enum
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Iterator, Optional
 
+import aiohttp
 import rich
 import typer
 from dotenv import load_dotenv
-from starknet_py.contract import (
-    ContractFunction,
-    InvokeResult,
-    PreparedFunctionInvokeV3,
-)
+from starknet_py.contract import ContractFunction
+from starknet_py.net.account.account import Account
+from starknet_py.net.client_models import Call, ResourceBounds
+from starknet_py.transaction_errors import TransactionRejectedError
 
 from garaga.definitions import ProofSystem
 from garaga.hints.io import to_int
 from garaga.starknet.cli.utils import (
     Network,
     complete_proof_system,
-    get_contract_iff_exists,
+    get_contract_iff_exists_async,
     load_account,
     voyager_link_tx,
 )
@@ -55,7 +63,7 @@ def verify_onchain(
         ),
     ],
     proof: Annotated[
-        Path,
+        Optional[Path],
         typer.Option(
             help="Path to the proof JSON file",
             file_okay=True,
@@ -63,7 +71,7 @@ def verify_onchain(
             exists=True,
             autocompletion=lambda: [],
         ),
-    ],
+    ] = None,
     public_inputs: Annotated[
         Path,
         typer.Option(
@@ -74,6 +82,27 @@ def verify_onchain(
             autocompletion=lambda: [],
         ),
     ] = None,
+    batch: Annotated[
+        Optional[str],
+        typer.Option(
+            help="Verify many proofs: a directory of proof JSON files, a glob pattern, or '-' for newline delimited JSON proofs on stdin. Proofs must include their public inputs.",
+            autocompletion=lambda: [],
+        ),
+    ] = None,
+    workers: Annotated[
+        Optional[int],
+        typer.Option(
+            help="Number of worker processes generating the calldata in batch mode. Defaults to the number of CPUs.",
+            min=1,
+        ),
+    ] = None,
+    max_in_flight: Annotated[
+        int,
+        typer.Option(
+            help="Maximum number of transactions sent and not yet accepted.",
+            min=1,
+        ),
+    ] = 8,
     endpoint: Annotated[
         str,
         typer.Option(
@@ -99,54 +128,226 @@ def verify_onchain(
     ] = Network.SEPOLIA.value,
 ):
     """Invoke a SNARK verifier on Starknet given a contract address, a proof and a verification key."""
-    vk_obj = Groth16VerifyingKey.from_json(vk)
-    proof_obj = Groth16Proof.from_json(proof, public_inputs)
+    if (proof is None) == (batch is None):
+        raise typer.BadParameter("Exactly one of --proof and --batch must be given.")
 
-    load_dotenv(env_file)
-    account = load_account(network)
+    vk_obj = Groth16VerifyingKey.from_json(vk)
+    if batch is not None:
+        items = list(
+            stream_batch_calldata(vk_obj, iter_batch_inputs(batch), workers=workers)
+        )
+    else:
+        proof_obj = Groth16Proof.from_json(proof, public_inputs)
+        calldata = groth16_calldata_from_vk_and_proof(
+            vk=vk_obj,
+            proof=proof_obj,
+        )
+        items = [{"index": 0, "source": str(proof), "calldata": calldata}]
 
-    contract = get_contract_iff_exists(account, to_int(contract_address))
     if endpoint == "":
         endpoint = f"verify_{system.value}_proof_{vk_obj.curve_id.name.lower()}"
 
-    try:
-        function_call: ContractFunction = find_item_from_key_patterns(
-            contract.functions, [endpoint]
+    load_dotenv(env_file)
+    results = asyncio.run(
+        _verify_onchain_async(
+            network, to_int(contract_address), endpoint, items, max_in_flight
         )
-    except ValueError:
+    )
+
+    for result in results:
+        if "error" in result:
+            rich.print(f"[red]{result['source']}: {result['error']}[/red]")
+            continue
         rich.print(
-            f"[red]Function {endpoint} not found on contract {contract_address}[/red]"
+            f"[bold]{result['source']}: transaction hash {hex(result['tx_hash'])}, "
+            f"{result['status']}, fee {result['actual_fee']}, "
+            f"accepted in {result['accepted_s']:.1f}s[/bold]"
         )
-        raise ValueError(
-            f"Function {endpoint} not found on contract {contract_address}"
+        rich.print(
+            f"[bold green]Check it out on[/bold green] {voyager_link_tx(network, result['tx_hash'])}"
         )
+    n_errors = sum("error" in result for result in results)
+    if n_errors:
+        rich.print(f"[red]{n_errors} of {len(results)} proofs failed[/red]")
+        raise typer.Exit(code=1)
 
-    if public_inputs == "":
-        public_inputs = None
 
-    calldata = groth16_calldata_from_vk_and_proof(
-        vk=vk_obj,
-        proof=proof_obj,
-    )
-    prepare_invoke = PreparedFunctionInvokeV3(
-        to_addr=function_call.contract_data.address,
-        calldata=calldata,
-        selector=function_call.get_selector(function_call.name),
-        l1_resource_bounds=None,
-        _contract_data=function_call.contract_data,
-        _client=function_call.client,
-        _account=function_call.account,
-        _payload_transformer=function_call._payload_transformer,
-    )
+async def _verify_onchain_async(
+    network: Network,
+    contract_address: int,
+    endpoint: str,
+    items: list[dict],
+    max_in_flight: int,
+) -> list[dict]:
+    # A single session and event loop for all the RPC calls.
+    async with aiohttp.ClientSession() as session:
+        account = load_account(network, session=session)
+        contract = await get_contract_iff_exists_async(account, contract_address)
+        try:
+            function_call: ContractFunction = find_item_from_key_patterns(
+                contract.functions, [endpoint]
+            )
+        except ValueError:
+            rich.print(
+                f"[red]Function {endpoint} not found on contract {hex(contract_address)}[/red]"
+            )
+            raise ValueError(
+                f"Function {endpoint} not found on contract {hex(contract_address)}"
+            )
 
-    invoke_result: InvokeResult = asyncio.run(prepare_invoke.invoke(auto_estimate=True))
+        to_send = [item for item in items if "calldata" in item]
+        calls = [
+            Call(
+                to_addr=function_call.contract_data.address,
+                selector=function_call.get_selector(function_call.name),
+                calldata=item["calldata"],
+            )
+            for item in to_send
+        ]
+        invoked = await invoke_many_async(account, calls, max_in_flight)
 
-    asyncio.run(invoke_result.wait_for_acceptance())
+    results = {item["index"]: item for item in items}
+    for item, result in zip(to_send, invoked):
+        results[item["index"]] = {
+            "index": item["index"],
+            "source": item["source"],
+            **{key: value for key, value in result.items() if key != "index"},
+        }
+    return [results[index] for index in sorted(results)]
 
-    rich.print(f"[bold]Transaction hash : {hex(invoke_result.hash)}[/bold]")
-    rich.print(
-        f"[bold green]Check it out on[/bold green] {voyager_link_tx(network, invoke_result.hash)}"
-    )
+
+async def invoke_many_async(
+    account: Account, calls: list[Call], max_in_flight: int = 8
+) -> list[dict]:
+    """
+    Sends one invoke transaction per call and waits for their receipts.
+    Nonces are assigned locally, so that up to max_in_flight transactions are pending
+    at once. Fees are estimated with one RPC call per group of max_in_flight
+    transactions. Returns, in order, the transaction hash, execution status, actual fee
+    and timings of each transaction, or its error.
+    A rejected transaction does not use its nonce, so the following ones can not be
+    accepted: their receipts are no longer awaited, and once the previous ones are
+    accepted the nonce is read again and the remaining calls are sent again.
+    """
+    results = [{"index": i} for i in range(len(calls))]
+    client = account.client
+    in_flight = asyncio.Semaphore(max_in_flight)
+    # Index and receipt waiter of the transactions sent since the nonce was read, by
+    # nonce.
+    waiters: dict[int, tuple[int, asyncio.Task]] = {}
+    # Lowest nonce of a rejected transaction since the nonce was read.
+    rejected_nonce: int | None = None
+
+    async def wait_for_receipt(i: int, tx_hash: int, tx_nonce: int, start: float):
+        nonlocal rejected_nonce
+        try:
+            receipt = await client.wait_for_tx(tx_hash)
+            results[i].update(
+                status=receipt.execution_status.name,
+                actual_fee=receipt.actual_fee.amount,
+                block_number=receipt.block_number,
+                accepted_s=time.perf_counter() - start,
+            )
+        except TransactionRejectedError as e:
+            results[i]["error"] = f"{type(e).__name__}: {e}"
+            if rejected_nonce is None or tx_nonce < rejected_nonce:
+                rejected_nonce = tx_nonce
+            for other_nonce, (_, waiter) in waiters.items():
+                if other_nonce > tx_nonce:
+                    waiter.cancel()
+        except Exception as e:
+            results[i]["error"] = f"{type(e).__name__}: {e}"
+
+    async def wait_all():
+        await asyncio.gather(
+            *(waiter for _, waiter in waiters.values()), return_exceptions=True
+        )
+
+    async def estimate_fees(chunk: list[int]) -> list:
+        # With zero resource bounds, estimate_fee signs them again as queries.
+        txs = [
+            await account.sign_invoke_v3(
+                calls[i],
+                nonce=nonce + j,
+                l1_resource_bounds=ResourceBounds.init_with_zeros(),
+            )
+            for j, i in enumerate(chunk)
+        ]
+        fees = await account.estimate_fee(txs)
+        return fees if isinstance(fees, list) else [fees]
+
+    async def send(indices: list[int]) -> list[int]:
+        """
+        Sends the calls of indices from the current nonce, until a transaction is
+        rejected. Returns the indices of the calls left to send.
+        """
+        nonlocal nonce
+        for chunk_start in range(0, len(indices), max_in_flight):
+            chunk = indices[chunk_start : chunk_start + max_in_flight]
+            try:
+                fees = await estimate_fees(chunk)
+            except Exception:
+                # The node may not see the pending transactions yet, hence the nonces:
+                # estimate again once they are accepted.
+                await wait_all()
+                if rejected_nonce is not None:
+                    return indices[chunk_start:]
+                nonce = await account.get_nonce(block_number="pending")
+                try:
+                    fees = await estimate_fees(chunk)
+                except Exception as e:
+                    for i in chunk:
+                        results[i]["error"] = f"{type(e).__name__}: {e}"
+                    continue
+
+            for j, (i, fee) in enumerate(zip(chunk, fees)):
+                await in_flight.acquire()
+                if rejected_nonce is not None:
+                    in_flight.release()
+                    return indices[chunk_start + j :]
+                start = time.perf_counter()
+                try:
+                    tx = await account.sign_invoke_v3(
+                        calls[i],
+                        nonce=nonce,
+                        l1_resource_bounds=fee.to_resource_bounds(
+                            account.ESTIMATED_AMOUNT_MULTIPLIER,
+                            account.ESTIMATED_UNIT_PRICE_MULTIPLIER,
+                        ).l1_gas,
+                    )
+                    sent = await client.send_transaction(tx)
+                except Exception as e:
+                    in_flight.release()
+                    results[i]["error"] = f"{type(e).__name__}: {e}"
+                    continue
+                results[i].update(
+                    tx_hash=sent.transaction_hash,
+                    nonce=nonce,
+                    submitted_s=time.perf_counter() - start,
+                )
+                waiter = asyncio.create_task(
+                    wait_for_receipt(i, sent.transaction_hash, nonce, start)
+                )
+                # Also released when the waiter is cancelled before it starts.
+                waiter.add_done_callback(lambda _: in_flight.release())
+                waiters[nonce] = (i, waiter)
+                nonce += 1
+        return []
+
+    remaining = list(range(len(calls)))
+    while remaining:
+        nonce = await account.get_nonce(block_number="pending")
+        waiters.clear()
+        rejected_nonce = None
+        unsent = await send(remaining)
+        await wait_all()
+        cancelled = [
+            i for _, (i, waiter) in sorted(waiters.items()) if waiter.cancelled()
+        ]
+        for i in cancelled:
+            results[i] = {"index": i}
+        remaining = cancelled + unsent
+    return results
 
 
 class CalldataFormat(str, Enum):
@@ -154,6 +355,86 @@ class CalldataFormat(str, Enum):
     array = "array"
 
 
+# Set in the calldata worker processes by _init_calldata_worker.
+_WORKER_VK: Groth16VerifyingKey | None = None
+
+
+def iter_batch_inputs(batch: str) -> Iterator[tuple[str, str | Path]]:
+    """
+    Yields the (source, proof) items of a batch, in input order: the sorted JSON files of
+    a directory, the files matching a glob pattern, or the lines of newline delimited
+    JSON on stdin when batch is "-".
+    """
+    if batch == "-":
+        for line_number, line in enumerate(sys.stdin, start=1):
+            if line.strip():
+                yield f"stdin:{line_number}", line
+    elif os.path.isdir(batch):
+        for path in sorted(Path(batch).glob("*.json")):
+            yield str(path), path
+    else:
+        paths = sorted(glob.glob(batch, recursive=True))
+        if len(paths) == 0:
+            raise ValueError(f"No proof file matches {batch}")
+        for path in paths:
+            yield path, Path(path)
+
+
+def _init_calldata_worker(vk: Groth16VerifyingKey) -> None:
+    global _WORKER_VK
+    _WORKER_VK = vk
+
+
+def _calldata_worker(item: tuple[str, str | Path]) -> dict:
+    source, proof = item
+    try:
+        # Keeps the NDJSON output clean of the parsing logs.
+        with contextlib.redirect_stdout(sys.stderr):
+            if isinstance(proof, Path):
+                proof_obj = Groth16Proof.from_json(proof)
+            else:
+                proof_obj = Groth16Proof.from_dict(json.loads(proof))
+            calldata = groth16_calldata_from_vk_and_proof(
+                vk=_WORKER_VK, proof=proof_obj
+            )
+        return {"source": source, "calldata": calldata}
+    except Exception as e:
+        return {"source": source, "error": f"{type(e).__name__}: {e}"}
+
+
+def stream_batch_calldata(
+    vk: Groth16VerifyingKey,
+    items: Iterator[tuple[str, str | Path]],
+    workers: int | None = None,
+) -> Iterator[dict]:
+    """
+    Generates the calldata of many proofs for a single verifying key over a process pool.
+    Results are yielded in input order as soon as they are ready, with at most a few
+    proofs per worker in flight, so that large inputs are streamed.
+    Failed proofs yield an "error" entry instead of a "calldata" one.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_calldata_worker(vk)
+        for index, item in enumerate(items):
+            yield {"index": index, **_calldata_worker(item)}
+        return
+
+    window = 4 * workers
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_calldata_worker, initargs=(vk,)
+    ) as executor:
+        pending = collections.deque()
+        for index, item in enumerate(items):
+            pending.append((index, executor.submit(_calldata_worker, item)))
+            if len(pending) >= window:
+                index, future = pending.popleft()
+                yield {"index": index, **future.result()}
+        while pending:
+            index, future = pending.popleft()
+            yield {"index": index, **future.result()}
+
+
 def calldata(
     system: Annotated[
         ProofSystem,
@@ -170,7 +451,7 @@ def calldata(
         ),
     ],
     proof: Annotated[
-        Path,
+        Optional[Path],
         typer.Option(
             help="Path to the proof JSON file",
             file_okay=True,
@@ -178,7 +459,7 @@ def calldata(
             exists=True,
             autocompletion=lambda: [],
         ),
-    ],
+    ] = None,
     public_inputs: Annotated[
         Path,
         typer.Option(
@@ -189,16 +470,52 @@ def calldata(
             autocompletion=lambda: [],
         ),
     ] = None,
+    batch: Annotated[
+        Optional[str],
+        typer.Option(
+            help="Batch mode: a directory of proof JSON files, a glob pattern, or '-' for newline delimited JSON proofs on stdin. Proofs must include their public inputs. Outputs one JSON object per proof, in input order, and exits with code 1 if any proof failed.",
+            autocompletion=lambda: [],
+        ),
+    ] = None,
+    workers: Annotated[
+        Optional[int],
+        typer.Option(
+            help="Number of worker processes in batch mode. Defaults to the number of CPUs.",
+            min=1,
+        ),
+    ] = None,
     format: Annotated[
-        CalldataFormat,
+        Optional[CalldataFormat],
         typer.Option(
-            help="Format",
+            help="Format. Defaults to starkli.",
             case_sensitive=False,
             show_choices=True,
         ),
-    ] = CalldataFormat.starkli,
+    ] = None,
 ):
     """Generate Starknet verifier calldata given a proof and a verification key."""
+    if (proof is None) == (batch is None):
+        raise typer.BadParameter("Exactly one of --proof and --batch must be given.")
+
+    if batch is not None:
+        if format is not None or public_inputs is not None:
+            raise typer.BadParameter(
+                "--format and --public-inputs can not be used with --batch."
+            )
+        if system != ProofSystem.Groth16:
+            raise ValueError(f"Proof system {system} not supported")
+        vk_obj = Groth16VerifyingKey.from_json(vk)
+        n_results, n_errors = 0, 0
+        for result in stream_batch_calldata(vk_obj, iter_batch_inputs(batch), workers):
+            print(json.dumps(result), flush=True)
+            n_results += 1
+            n_errors += "error" in result
+        if n_errors:
+            rich.print(
+                f"[red]{n_errors} of {n_results} proofs failed[/red]", file=sys.stderr
+            )
+            raise typer.Exit(code=1)
+        return
 
     if system == ProofSystem.Groth16:
         vk_obj = Groth16VerifyingKey.from_json(vk)
@@ -211,7 +528,7 @@ def calldata(
     else:
         raise ValueError(f"Proof system {system} not supported")
 
-    if format == CalldataFormat.starkli:
+    if format is None or format == CalldataFormat.starkli:
         print(" ".join([str(x) for x in calldata]))
     elif format == CalldataFormat.array:
         print(calldata)
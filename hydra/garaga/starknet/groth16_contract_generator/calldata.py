@@ -20,6 +20,7 @@ def groth16_calldata_from_vk_and_proof(
         vk.curve_id == proof.curve_id
     ), f"Curve ID mismatch: {vk.curve_id} != {proof.curve_id}"
 
+    vk.precompute_tables(persist=False)
     vk_x = vk.ic[0].add(G1Point.msm(vk.ic[1:], proof.public_inputs))
 
     calldata = []
@@ -198,11 +198,23 @@ class Groth16VerifyingKey:
             == self.delta.curve_id
         ), "All points must be on the same curve."
         assert all(point.curve_id == self.alpha.curve_id for point in self.ic)
+        assert all(
+            G1Point.is_in_prime_order_subgroup_many([self.alpha] + self.ic)
+        ) and all(
+            G2Point.is_in_prime_order_subgroup_many([self.beta, self.gamma, self.delta])
+        ), "All points must be in the prime order subgroup."
 
     @property
     def curve_id(self) -> CurveID:
         return self.alpha.curve_id
 
+    def precompute_tables(self, persist: bool = False) -> None:
+        """
+        Registers the fixed-base tables of the ic points multiplied by the public inputs,
+        see G1Point.precompute_tables. The tables are only written to disk if persist is True.
+        """
+        G1Point.precompute_tables(self.ic[1:], persist=persist)
+
     def from_dict(data: dict) -> "Groth16VerifyingKey":
         try:
             curve_id = try_guessing_curve_id_from_json(data)
@@ -328,6 +340,10 @@ class Groth16Proof:
             self.a.curve_id == self.b.curve_id == self.c.curve_id
         ), f"All points must be on the same curve, got {self.a.curve_id}, {self.b.curve_id}, {self.c.curve_id}"
         self.curve_id = self.a.curve_id
+        assert (
+            all(G1Point.is_in_prime_order_subgroup_many([self.a, self.c]))
+            and self.b.is_in_prime_order_subgroup()
+        ), "All points must be in the prime order subgroup."
 
     def from_dict(
         data: dict, public_inputs: None | list | dict = None
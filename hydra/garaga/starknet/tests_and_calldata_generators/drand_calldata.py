@@ -1,11 +1,18 @@
+import concurrent.futures
+import functools
+import os
+
 import garaga.hints.io as io
 from garaga.drand.client import (
     DrandNetwork,
     G2Point,
+    RandomnessBeacon,
     digest_func,
     get_chain_info,
     get_randomness,
+    get_randomness_many,
 )
+from garaga.precompiled_circuits.multi_miller_loop import precompute_lines
 from garaga.signature import hash_to_curve
 from garaga.starknet.tests_and_calldata_generators.map_to_curve import *
 from garaga.starknet.tests_and_calldata_generators.mpcheck import (
@@ -15,22 +22,54 @@ from garaga.starknet.tests_and_calldata_generators.mpcheck import (
 
 
 def drand_round_to_calldata(round_number: int) -> list[int]:
+    chain = get_chain_info(DrandNetwork.quicknet.value)
+    round = get_randomness(chain.hash, round_number)
+    return _beacon_to_calldata(chain.public_key, round)
 
-    message = digest_func(round_number)
-    # print(f"round {round_number} message {message}")
-    msg_point = hash_to_curve(message, CurveID.BLS12_381, "sha256")
 
+def drand_rounds_to_calldata(
+    round_numbers: list[int], max_workers: int | None = None
+) -> list[list[int]]:
+    """
+    Batch version of drand_round_to_calldata. The rounds are fetched concurrently, the
+    chain info and the lines of the fixed G2 points are computed once, and the calldata
+    of the rounds is built in parallel.
+    """
+    if len(round_numbers) == 0:
+        return []
     chain = get_chain_info(DrandNetwork.quicknet.value)
+    rounds = get_randomness_many(chain.hash, round_numbers)
 
-    round = get_randomness(chain.hash, round_number)
+    # Fills the in-memory and on-disk lines caches, shared by the workers.
+    precompute_lines(_fixed_g2_points(chain.public_key))
+
+    to_calldata = functools.partial(_beacon_to_calldata, chain.public_key)
+    max_workers = min(max_workers or os.cpu_count() or 1, len(rounds))
+    if max_workers == 1:
+        return [to_calldata(round) for round in rounds]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        chunksize = max(1, len(rounds) // (4 * max_workers))
+        return list(executor.map(to_calldata, rounds, chunksize=chunksize))
+
+
+def _fixed_g2_points(public_key: G2Point) -> list[G2Point]:
+    return [G2Point.get_nG(CurveID.BLS12_381, 1), -public_key]
+
+
+def _beacon_to_calldata(public_key: G2Point, round: RandomnessBeacon) -> list[int]:
+    round_number = round.round_number
+    message = digest_func(round_number)
+    # print(f"round {round_number} message {message}")
+    msg_point = hash_to_curve(message, CurveID.BLS12_381, "sha256")
 
     sig_pt = round.signature_point
     ###################
+    g2_gen, neg_public_key = _fixed_g2_points(public_key)
     mpc_builder = MPCheckCalldataBuilder(
         curve_id=CurveID.BLS12_381,
         pairs=[
-            G1G2Pair(p=sig_pt, q=G2Point.get_nG(CurveID.BLS12_381, 1)),
-            G1G2Pair(p=msg_point, q=-chain.public_key),
+            G1G2Pair(p=sig_pt, q=g2_gen),
+            G1G2Pair(p=msg_point, q=neg_public_key),
         ],
         n_fixed_g2=2,
         public_pair=None,
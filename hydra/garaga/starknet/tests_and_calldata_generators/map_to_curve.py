@@ -2,9 +2,14 @@ from dataclasses import dataclass
 
 import garaga.modulo_circuit_structs as structs
 from garaga.algebra import PyFelt
-from garaga.definitions import CURVES, CurveID, G1Point, get_base_field
+from garaga.definitions import CurveID, G1Point, get_base_field
 from garaga.hints.io import bigint_split, int_to_u384
-from garaga.signature import apply_isogeny, hash_to_field
+from garaga.signature import (
+    apply_isogeny,
+    get_cofactor,
+    hash_to_field,
+    map_to_curve_int,
+)
 from garaga.starknet.tests_and_calldata_generators.msm import MSMCalldataBuilder
 
 
@@ -45,50 +50,14 @@ class HashToCurveHint:
 
 
 def build_map_to_curve_hint(u: PyFelt) -> tuple[G1Point, MapToCurveHint]:
-    field = get_base_field(CurveID.BLS12_381)
-    a = field(CURVES[CurveID.BLS12_381.value].swu_params.A)
-    b = field(CURVES[CurveID.BLS12_381.value].swu_params.B)
-    z = field(CURVES[CurveID.BLS12_381.value].swu_params.Z)
-
-    zeta_u2 = z * u**2
-    ta = zeta_u2**2 + zeta_u2
-    num_x1 = b * (ta + field.one())
-
-    if ta.value == 0:
-        div = a * z
-    else:
-        div = a * -ta
-
-    num2_x1 = num_x1**2
-    div2 = div**2
-    div3 = div2 * div
-    assert div3.value != 0
-
-    num_gx1 = (num2_x1 + a * div2) * num_x1 + b * div3
-    num_x2 = zeta_u2 * num_x1
-
-    gx1 = num_gx1 / div3
-    gx1_square = gx1.is_quad_residue()
-    if gx1_square:
-        y1 = gx1.sqrt(min_root=False)
-        assert y1 * y1 == gx1
-    else:
-        y1 = (z * gx1).sqrt(min_root=False)
-        assert y1 * y1 == z * gx1
-
-    y2 = zeta_u2 * u * y1
-    y = y1 if gx1_square else y2
-    y_flag = y.value % 2 == u.value % 2
-
-    num_x = num_x1 if gx1_square else num_x2
-    x_affine = num_x / div
-    y_affine = -y if y.value % 2 != u.value % 2 else y
-
-    point_on_curve = G1Point(
-        x_affine.value, y_affine.value, CurveID.BLS12_381, iso_point=True
+    x_affine, y_affine, gx1_square, y1, y_flag = map_to_curve_int(
+        u.value, CurveID.BLS12_381
+    )
+    point_on_curve = G1Point.trusted(
+        x_affine, y_affine, CurveID.BLS12_381, iso_point=True
     )
     return point_on_curve, MapToCurveHint(
-        gx1_is_square=gx1_square, y1=y1, y_flag=y_flag
+        gx1_is_square=gx1_square, y1=PyFelt(y1, u.p), y_flag=y_flag
     )
 
 
@@ -104,9 +73,7 @@ def build_hash_to_curve_hint(message: bytes) -> HashToCurveHint:
     # print(
     #     f"sum_pt: {int_to_u384(sum_pt.x, as_hex=False)} {int_to_u384(sum_pt.y, as_hex=False)}"
     # )
-    x = CURVES[CurveID.BLS12_381.value].x
-    n = CURVES[CurveID.BLS12_381.value].n
-    cofactor = (1 - (x % n)) % n
+    cofactor = get_cofactor(CurveID.BLS12_381)
     # print(f"cofactor: {cofactor}, hex :{hex(cofactor)}")
 
     msm_builder = MSMCalldataBuilder(
@@ -95,25 +95,23 @@ class MSMCalldataBuilder:
                 transcript.hash_limbs_multi(_b_num)
                 transcript.hash_limbs_multi(_b_den)
 
-        for point in self.points:
-            transcript.hash_element(self.field(point.x))
-            transcript.hash_element(self.field(point.y))
+        transcript.hash_limbs_multi(
+            [self.field(c) for point in self.points for c in (point.x, point.y)]
+        )
 
         results = [Q_low, Q_high, Q_high_shifted] if not risc0_mode else [Q_low]
         if risc0_mode:
             assert (
                 Q_high.is_infinity() and Q_high_shifted.is_infinity()
             ), "Q_high and Q_high_shifted must be infinity in risc0 mode"
-        for result_point in results:
-            transcript.hash_element(self.field(result_point.x))
-            transcript.hash_element(self.field(result_point.y))
+        transcript.hash_limbs_multi(
+            [self.field(c) for point in results for c in (point.x, point.y)]
+        )
 
         if not risc0_mode:
-            for scalar in self.scalars:
-                transcript.hash_u256(scalar)
+            transcript.hash_u256_multi(self.scalars)
         else:
-            for scalar in self.scalars:
-                transcript.hash_u128(scalar)
+            transcript.hash_u128_multi(self.scalars)
 
         return transcript.s0
 
@@ -157,7 +155,7 @@ class MSMCalldataBuilder:
         #############################
         ######## Sanity check #######
         _x, _y, _ = ecip.derive_ec_point_from_X(_x_coordinate, self.curve_id)
-        _A0 = G1Point(curve_id=self.curve_id, x=_x.value, y=_y.value)
+        _A0 = G1Point.trusted(curve_id=self.curve_id, x=_x.value, y=_y.value)
         ecip.verify_ecip(
             self.points,
             self.scalars_split()[0],
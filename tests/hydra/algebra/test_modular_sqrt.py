@@ -0,0 +1,33 @@
+import random
+
+import pytest
+from sympy import jacobi_symbol, legendre_symbol, sqrt_mod
+
+from garaga import modular_sqrt
+from garaga.definitions import CURVES, STARK
+
+PRIMES = [3, 5, 7, 13, 17, 41, 97, 257, 65537, STARK] + sorted(
+    {curve.p for curve in CURVES.values()}
+)
+
+
+@pytest.mark.parametrize("p", PRIMES)
+def test_legendre(p):
+    for a in [0, 1, 2, p - 1] + [random.randrange(p) for _ in range(20)]:
+        assert modular_sqrt.legendre(a, p) == legendre_symbol(a % p, p)
+    n = p * random.randrange(1, 2**64, 2)
+    a = random.randrange(n)
+    assert modular_sqrt.jacobi(a, n) == jacobi_symbol(a, n)
+
+
+@pytest.mark.parametrize("p", PRIMES)
+def test_sqrt(p):
+    for a in [0, 1, 4, p - 1] + [random.randrange(p) for _ in range(20)]:
+        if modular_sqrt.legendre(a, p) == -1:
+            with pytest.raises(ValueError):
+                modular_sqrt.sqrt(a, p)
+            continue
+        roots = sqrt_mod(a, p, all_roots=True)
+        assert modular_sqrt.sqrt_roots(a, p) == (min(roots), max(roots))
+        x = random.randrange(p)
+        assert modular_sqrt.sqrt(x * x, p) in (x, p - x)
@@ -1,6 +1,7 @@
 import pytest
 
-from garaga.algebra import BaseField, Polynomial
+from garaga import int_poly
+from garaga.algebra import BaseField, IntPolynomial, Polynomial, RationalFunction
 from garaga.definitions import CURVES, CurveID
 
 # List of curve IDs to test
@@ -56,3 +57,131 @@ def test_lagrange_interpolation(degree: int):
     )
     for x, y in zip(domain_large, values_large):
         assert interpolated_poly_large.evaluate(x) == y
+
+
+@pytest.mark.parametrize(
+    "len_a, len_b", [(1, 1), (1, 40), (5, 9), (24, 24), (30, 77), (64, 64), (150, 131)]
+)
+def test_int_poly_mul(len_a: int, len_b: int):
+    field = BaseField(p)
+    a = [field.random().value for _ in range(len_a)]
+    b = [field.random().value for _ in range(len_b)]
+    if len_a > 2:
+        a[len_a // 2] = 0
+
+    expected = int_poly.mul_schoolbook(a, b, p)
+    assert len(expected) == len_a + len_b - 1
+    assert int_poly.mul_karatsuba(a, b, p) == expected
+    assert int_poly.mul_kronecker(a, b, p) == expected
+    assert int_poly.mul(a, b, p) == expected
+
+    # Matches the PyFelt product, trailing zeros removed.
+    x = Polynomial([field(c) for c in a])
+    y = Polynomial([field(c) for c in b] + [field.zero()])
+    assert (x * y).get_value_coeffs() == expected
+    assert (x * zero).coefficients == zero.coefficients
+
+
+@pytest.mark.parametrize("degree_x", [0, 3, 10, 40])
+@pytest.mark.parametrize("degree_y", [0, 2, 7, 33])
+def test_int_polynomial_matches_polynomial(degree_x: int, degree_y: int):
+    field = BaseField(p)
+    x = Polynomial([field.random() for _ in range(degree_x + 1)])
+    y = Polynomial([field.random() for _ in range(degree_y + 1)])
+    ix, iy = IntPolynomial.from_polynomial(x), IntPolynomial.from_polynomial(y)
+    c = field.random()
+
+    assert ix.to_polynomial() == x
+    assert ix.degree() == x.degree()
+    assert (ix + iy) == x + y
+    assert (ix - iy) == x - y
+    assert (-ix) == -x
+    assert (ix * iy) == x * y
+    assert (ix * c) == x * c
+    assert ix.differentiate() == x.differentiate()
+    assert (ix // iy) == x // y
+    assert (ix % iy) == x % y
+    assert ix.evaluate(c) == x.evaluate(c)
+    assert ix.get_coeffs() == x.get_coeffs()
+
+    a, b, g = IntPolynomial.xgcd(ix, iy)
+    ea, eb, eg = Polynomial.xgcd(x, y)
+    assert (a, b, g) == (ea, eb, eg)
+    assert a * ix + b * iy == g
+
+    assert (ix - ix).is_zero()
+    assert (ix - ix).get_coeffs() == zero.get_coeffs()
+
+
+def test_int_polynomial_rational_function_simplify():
+    field = BaseField(p)
+    common = Polynomial([field.random() for _ in range(4)] + [field.one()])
+    num = Polynomial([field.random() for _ in range(3)]) * common
+    den = Polynomial([field.random() for _ in range(5)]) * common
+
+    expected = RationalFunction(num, den).simplify()
+    res = RationalFunction(
+        IntPolynomial.from_polynomial(num), IntPolynomial.from_polynomial(den)
+    ).simplify()
+    assert res.numerator == expected.numerator
+    assert res.denominator == expected.denominator
+
+
+@pytest.mark.parametrize("len_a, len_b", [(5, 3), (40, 40), (100, 1), (200, 70)])
+def test_int_poly_divmod(len_a: int, len_b: int):
+    field = BaseField(p)
+    a = [field.random().value for _ in range(len_a)]
+    b = [field.random().value for _ in range(len_b)]
+
+    q, r = int_poly.divmod_schoolbook(a, b, p)
+    assert int_poly.divmod_newton(a, b, p) == (q, r)
+    assert int_poly.divmod_(a, b, p) == (q, r)
+    assert int_poly.trim(int_poly.add(int_poly.mul(q, b, p), r, p)) == a
+
+    # The PyFelt remainder keeps the length of the numerator.
+    x = Polynomial([field(c) for c in a] + [field.zero()])
+    quo, rem = divmod(x, Polynomial([field(c) for c in b]))
+    assert quo.get_value_coeffs() == q
+    assert len(rem.coefficients) == len_a + 1
+    assert int_poly.trim(rem.get_value_coeffs()) == r
+
+
+@pytest.mark.parametrize("degree_x, degree_y", [(60, 45), (45, 60), (50, 50)])
+def test_int_poly_half_gcd_xgcd(monkeypatch, degree_x: int, degree_y: int):
+    field = BaseField(p)
+    common = [field.random().value for _ in range(6)] + [1]
+    x = int_poly.mul([field.random().value for _ in range(degree_x - 5)], common, p)
+    y = int_poly.mul([field.random().value for _ in range(degree_y - 5)], common, p)
+
+    monkeypatch.setattr(int_poly, "HGCD_THRESHOLD", 10**9)
+    expected = int_poly.xgcd(x, y, p)
+    monkeypatch.setattr(int_poly, "HGCD_THRESHOLD", 4)
+    s, t, g = int_poly.xgcd(x, y, p)
+
+    assert (s, t, g) == expected
+    assert g == common
+    assert (
+        int_poly.trim(int_poly.add(int_poly.mul(s, x, p), int_poly.mul(t, y, p), p))
+        == g
+    )
+
+
+@pytest.mark.parametrize("n_points", [1, 5, 33, 100])
+def test_multipoint_evaluation_and_interpolation(monkeypatch, n_points: int):
+    monkeypatch.setattr(int_poly, "MULTIPOINT_THRESHOLD", 4)
+    field = BaseField(p)
+    poly = Polynomial([field.random() for _ in range(n_points)])
+    domain = [field.random() for _ in range(n_points)]
+
+    values = poly.evaluate_many(domain)
+    assert values == [
+        sum((c * x**i for i, c in enumerate(poly.coefficients)), field.zero())
+        for x in domain
+    ]
+    assert values == [poly.evaluate(x) for x in domain]
+    assert IntPolynomial.from_polynomial(poly).evaluate_many(domain) == values
+
+    assert Polynomial.lagrange_interpolation(p, domain, values) == poly
+
+    with pytest.raises(ValueError):
+        Polynomial.lagrange_interpolation(p, domain + domain[:1], values + values[:1])
@@ -0,0 +1,103 @@
+import os
+import shutil
+
+from garaga.precompiled_circuits import all_circuits
+from garaga.precompiled_circuits.all_circuits import ALL_CAIRO_CIRCUITS, CircuitID
+
+CIRCUITS = {
+    circuit_id: ALL_CAIRO_CIRCUITS[circuit_id]
+    for circuit_id in (
+        CircuitID.DUMMY,
+        CircuitID.IS_ON_CURVE_G1,
+        CircuitID.ADD_EC_POINT,
+    )
+}
+
+
+def test_incremental_compilation(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(
+        all_circuits, "CIRCUITS_CACHE_DIR", str(tmp_path / "circuits_cache")
+    )
+    formatted = []
+    # scarb fmt is not needed to check which files are rewritten.
+    monkeypatch.setattr(
+        all_circuits,
+        "format_cairo_files_in_parallel",
+        lambda filenames, mode, directory: formatted.append(sorted(filenames)),
+    )
+    out_dir = f"{tmp_path}/circuits/"
+
+    all_circuits.main(out_dir, CIRCUITS, compilation_mode=1)
+    assert "0 hits, 6 misses" in capsys.readouterr().out
+    assert formatted == [["dummy", "ec"]]
+    contents = {f: open(out_dir + f).read() for f in os.listdir(out_dir)}
+    assert "fn run_ADD_EC_POINT_circuit" in contents["ec.cairo"]
+
+    all_circuits.main(out_dir, CIRCUITS, compilation_mode=1)
+    assert "6 hits, 0 misses" in capsys.readouterr().out
+    assert formatted == [["dummy", "ec"]]
+    assert {f: open(out_dir + f).read() for f in os.listdir(out_dir)} == contents
+
+    # A file modified on disk is regenerated, from the cache.
+    with open(out_dir + "dummy.cairo", "a") as f:
+        f.write("// edited\n")
+    all_circuits.main(out_dir, CIRCUITS, compilation_mode=1)
+    assert "6 hits, 0 misses" in capsys.readouterr().out
+    assert formatted[-1] == ["dummy"]
+    assert open(out_dir + "dummy.cairo").read() == contents["dummy.cairo"]
+
+    # Without the cache, everything is compiled again with the same output.
+    all_circuits.main(out_dir, CIRCUITS, compilation_mode=1, use_cache=False)
+    assert "0 hits, 6 misses" in capsys.readouterr().out
+    assert {f: open(out_dir + f).read() for f in os.listdir(out_dir)} == contents
+
+
+def test_circuit_cache_key():
+    key = all_circuits.circuit_cache_key
+    info = ALL_CAIRO_CIRCUITS[CircuitID.EVAL_FUNCTION_CHALLENGE_DUPL]
+    cls, params = info["class"], info["params"]
+    bn, bls = all_circuits.CurveID.BN254, all_circuits.CurveID.BLS12_381
+    assert key(cls, params, bn, 1) == key(cls, list(params), bn, 1)
+    assert len({key(cls, params, bn, 1), key(cls, params, bls, 1)}) == 2
+    assert key(cls, params, bn, 1) != key(cls, params[:-1], bn, 1)
+    assert key(cls, params, bn, 1) != key(cls, params, bn, 0)
+    assert "garaga.precompiled_circuits.compilable_circuits.base" in (
+        all_circuits.circuit_source_modules(cls)
+    )
+    # Indirect dependencies, including the imports inside functions.
+    modules = all_circuits.circuit_source_modules(
+        ALL_CAIRO_CIRCUITS[CircuitID.MP_CHECK_BIT0_LOOP]["class"]
+    )
+    assert {
+        "garaga.precompiled_circuits.multi_miller_loop",
+        "garaga.hints.extf_mul",
+        "garaga.hints.frobenius",
+        "garaga.int_poly",
+        "garaga.poseidon_transcript",
+        "garaga.hints.io",
+    } <= set(modules)
+
+
+def test_circuit_cache_key_indirect_dependency(tmp_path, monkeypatch):
+    info = ALL_CAIRO_CIRCUITS[CircuitID.MP_CHECK_BIT0_LOOP]
+    cls, params = info["class"], info["params"]
+    bn = all_circuits.CurveID.BN254
+    module_file = all_circuits._module_file
+    copy = tmp_path / "extf_mul.py"
+    shutil.copy(module_file("garaga.hints.extf_mul"), copy)
+    monkeypatch.setattr(
+        all_circuits,
+        "_module_file",
+        lambda name: (
+            str(copy) if name == "garaga.hints.extf_mul" else module_file(name)
+        ),
+    )
+    all_circuits.clear_source_hashes()
+    key = all_circuits.circuit_cache_key(cls, params, bn, 1)
+    assert all_circuits.circuit_cache_key(cls, params, bn, 1) == key
+
+    with open(copy, "a") as f:
+        f.write("\n# edited\n")
+    all_circuits.clear_source_hashes()
+    assert all_circuits.circuit_cache_key(cls, params, bn, 1) != key
+    all_circuits.clear_source_hashes()
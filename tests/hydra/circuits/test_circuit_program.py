@@ -0,0 +1,118 @@
+import pytest
+
+from garaga.definitions import CurveID
+from garaga.modulo_circuit import ModuloCircuit, WriteOps, batch_inverse
+from garaga.precompiled_circuits.compilable_circuits.cairo1_mpcheck_circuits import (
+    EvalE12D,
+    FixedG2MPCheckBit0,
+    MPCheckPreparePairs,
+)
+from garaga.precompiled_circuits.compilable_circuits.cairo1_tower_pairing import (
+    E12TInverseCircuit,
+    TowerMillerBit1,
+)
+from garaga.precompiled_circuits.compilable_circuits.common_cairo_fustat_circuits import (
+    AddECPointCircuit,
+    DummyCircuit,
+    EvalFunctionChallengeDuplCircuit,
+    IsOnCurveG1G2Circuit,
+)
+
+CIRCUITS = [
+    (DummyCircuit, {}, 0),
+    (DummyCircuit, {}, 1),
+    (IsOnCurveG1G2Circuit, {}, 1),
+    (AddECPointCircuit, {}, 0),
+    (AddECPointCircuit, {}, 1),
+    (EvalFunctionChallengeDuplCircuit, {"n_points": 3}, 1),
+    (FixedG2MPCheckBit0, {"n_pairs": 2, "n_fixed_g2": 1}, 1),
+    (MPCheckPreparePairs, {"n_pairs": 2}, 1),
+    (EvalE12D, {}, 1),
+    (E12TInverseCircuit, {}, 1),
+    (TowerMillerBit1, {"n_pairs": 1}, 1),
+]
+
+
+def program_input(circuit: ModuloCircuit) -> list[int]:
+    segment = circuit.values_segment
+    return [
+        item.value
+        for stack in [WriteOps.INPUT, WriteOps.COMMIT, WriteOps.WITNESS, WriteOps.FELT]
+        for item in segment.segment_stacks[stack].values()
+    ]
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+@pytest.mark.parametrize("circuit_class, params, compilation_mode", CIRCUITS)
+def test_program_replay_matches_trace(
+    circuit_class, params, compilation_mode: int, curve_id: CurveID
+):
+    recorded = circuit_class(
+        curve_id=curve_id.value, compilation_mode=compilation_mode, **params
+    )
+    program = recorded.program
+    assert recorded.run_program(program_input(recorded.circuit), True) == [
+        x.value for x in recorded.circuit.output
+    ]
+
+    # A fresh trace on a new random input gives the same outputs as the replay.
+    fresh = circuit_class(
+        curve_id=curve_id.value, compilation_mode=compilation_mode, **params
+    )
+    assert fresh.circuit.compile_program().tape == program.tape
+    assert program.evaluate(program_input(fresh.circuit), check_asserts=True) == [
+        x.value for x in fresh.circuit.output
+    ]
+
+
+def test_program_ops():
+    circuit = ModuloCircuit("test", CurveID.BN254.value, compilation_mode=1)
+    x, y = circuit.write_elements([circuit.field(7), circuit.field(3)], WriteOps.INPUT)
+    circuit.extend_output(
+        [
+            circuit.add(x, y),
+            circuit.sub(x, y),
+            circuit.mul(x, y),
+            circuit.inv(y),
+            circuit.neg(x),
+            circuit.div(x, y),
+        ]
+    )
+    program = circuit.compile_program()
+    p = circuit.field.p
+    assert program.evaluate([11, 5]) == [
+        16,
+        6,
+        55,
+        pow(5, -1, p),
+        -11 % p,
+        11 * pow(5, -1, p) % p,
+    ]
+    # The traced circuit is left untouched.
+    assert circuit.values_segment.offset == circuit.values_offset
+    assert [x.value for x in circuit.output][:3] == [10, 4, 21]
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+@pytest.mark.parametrize("circuit_class, params, compilation_mode", CIRCUITS)
+def test_program_batch_matches_trace(
+    circuit_class, params, compilation_mode: int, curve_id: CurveID
+):
+    circuits = [
+        circuit_class(
+            curve_id=curve_id.value, compilation_mode=compilation_mode, **params
+        )
+        for _ in range(4)
+    ]
+    outputs = circuits[0].run_program_batch(
+        [program_input(c.circuit) for c in circuits], check_asserts=True
+    )
+    assert outputs == [[x.value for x in c.circuit.output] for c in circuits]
+
+
+def test_batch_inverse():
+    p = CurveID.BN254.p
+    values = [1, 2, 3, p - 1, 12345678901234567890]
+    assert batch_inverse(values, p) == [pow(x, -1, p) for x in values]
+    with pytest.raises(ValueError):
+        batch_inverse([1, 0, 2], p)
@@ -2,6 +2,7 @@ import copy
 
 import pytest
 
+import garaga.precompiled_circuits.multi_miller_loop as mml
 from garaga.definitions import CurveID, G1Point, G2Point
 from garaga.hints.extf_mul import nondeterministic_extension_field_mul_divmod
 from garaga.modulo_circuit import WriteOps
@@ -113,3 +114,21 @@ def test_prod_miller_loop_equals_multi_miller_loop(
     _, R = nondeterministic_extension_field_mul_divmod(fis, curve_id, 12)
 
     assert f0 == R
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+def test_precompute_lines_cache(curve_id: CurveID, tmp_path, monkeypatch):
+    monkeypatch.setattr(mml, "LINES_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(mml, "_LINES_CACHE", {})
+    Qs = [G2Point.gen_random_point(curve_id) for _ in range(2)]
+    expected = precompute_lines(Qs, use_cache=False)
+
+    assert precompute_lines(Qs) == expected
+    key = mml.lines_cache_key(Qs)
+    assert (tmp_path / f"{key}.bin").exists()
+    assert key != mml.lines_cache_key(Qs[::-1])
+
+    # Hit from disk after the memory cache is dropped.
+    mml._LINES_CACHE.clear()
+    assert precompute_lines(Qs) == expected
+    assert key in mml._LINES_CACHE
@@ -0,0 +1,5 @@
+from garaga.definitions import G1Point
+
+# Re-validate the points built with G1Point.trusted in the whole test suite,
+# so that an internally produced point that is not on the curve never slips through.
+G1Point.validate_trusted = True
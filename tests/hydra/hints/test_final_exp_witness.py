@@ -2,18 +2,21 @@ import random
 
 import pytest
 
-from garaga.definitions import CURVES, CurveID, get_sparsity
+from garaga.definitions import CURVES, CurveID, G1Point, G2Point, get_sparsity
 from garaga.hints.multi_miller_witness import (
     get_final_exp_witness,
     get_lambda,
     get_miller_loop_output,
+    multi_miller_loop,
 )
 from garaga.hints.tower_backup import E6, E12
+from garaga.precompiled_circuits.multi_miller_loop import MultiMillerLoopCircuit
 from garaga.precompiled_circuits.multi_pairing_check import (
     MultiPairingCheckCircuit,
     WriteOps,
     get_max_Q_degree,
     get_pairing_check_input,
+    get_root_and_scaling_factor,
 )
 
 
@@ -92,3 +95,33 @@ def test_mpcheck(curve_id: CurveID, n_pairs: int, include_m: bool):
     print(f"\nTest {curve_id.name} {n_pairs=} {'with m' if include_m else 'without m'}")
     print(f"Total cost: {cost}")
     print(f"Q max degree: {q_max_degree}")
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+@pytest.mark.parametrize("n_pairs", [1, 2, 3])
+def test_native_miller_loop_matches_circuit(curve_id: CurveID, n_pairs: int):
+    Ps = [G1Point.gen_random_point(curve_id) for _ in range(n_pairs)]
+    Qs = [G2Point.gen_random_point(curve_id) for _ in range(n_pairs)]
+    c = MultiMillerLoopCircuit(name="mock", curve_id=curve_id.value, n_pairs=n_pairs)
+    c.write_p_and_q(Ps, Qs)
+    expected = [x.value for x in c.miller_loop(n_pairs)]
+
+    assert (
+        multi_miller_loop(
+            curve_id.value, [(P.x, P.y) for P in Ps], [(Q.x, Q.y) for Q in Qs]
+        )
+        == expected
+    )
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+@pytest.mark.parametrize("include_m", [False, True])
+def test_root_and_scaling_factor_debug(curve_id: CurveID, include_m: bool):
+    c = MultiPairingCheckCircuit(name="mock", curve_id=curve_id.value, n_pairs=3)
+    circuit_input, m = get_pairing_check_input(curve_id, 3, include_m=include_m)
+    c.write_p_and_q_raw(circuit_input)
+    M = c.write_elements(m, WriteOps.INPUT) if m is not None else None
+    # Checks the native Miller loop against the traced one.
+    assert get_root_and_scaling_factor(
+        curve_id.value, c.P, c.Q, M, debug=True
+    ) == get_root_and_scaling_factor(curve_id.value, c.P, c.Q, M)
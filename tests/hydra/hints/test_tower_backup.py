@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from garaga import garaga_rs
+from garaga.definitions import CURVES, CurveID, G1G2Pair, G1Point, G2Point
+from garaga.hints import tower_backup
+from garaga.hints.tower_backup import E6, E12
+
+
+@pytest.mark.parametrize("native", [False, True])
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+def test_e12_cyclotomic_pow(curve_id, native, monkeypatch):
+    if native and not hasattr(garaga_rs, "e12_cyclotomic_exp"):
+        pytest.skip("garaga_rs was built without e12_cyclotomic_exp")
+    monkeypatch.setattr(tower_backup, "NATIVE_CYCLOTOMIC_EXP", native)
+    gt = G1G2Pair.pair(
+        [
+            G1G2Pair(
+                p=G1Point.gen_random_point(curve_id),
+                q=G2Point.gen_random_point(curve_id),
+            )
+        ]
+    )
+    assert gt.cyclotomic
+    assert gt.cyclotomic_square() == gt.square()
+
+    # Same element, without the cyclotomic flag.
+    generic = E12(gt.value_coeffs, curve_id.value)
+    assert not generic.cyclotomic and generic == gt
+
+    n = CURVES[curve_id.value].n
+    for e in [0, 1, 2, 7, 9, 16, 17, -5, random.randrange(n), -random.randrange(n)]:
+        assert gt**e == generic**e
+        assert (gt**e).cyclotomic
+    assert gt**n == E12.one(curve_id.value)
+
+
+@pytest.mark.parametrize("native", [False, True])
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+def test_tower_arithmetic(curve_id, native, monkeypatch):
+    if native and not hasattr(garaga_rs, "tower_mul"):
+        pytest.skip("garaga_rs was built without the tower arithmetic")
+    monkeypatch.setattr(tower_backup, "NATIVE_TOWER", native)
+    for cls in (E6, E12):
+        x, y = cls.random(curve_id.value), cls.random(curve_id.value)
+        one = cls.one(curve_id.value)
+        assert x * y == y * x
+        assert x * x.__inv__() == one
+        assert x**3 == x * x * x
+        assert x**-2 == (x * x).__inv__()
+    x = E12.random(curve_id.value)
+    assert x.square() == x * x
+
+    if not hasattr(garaga_rs, "tower_mul"):
+        return
+    # Both backends agree.
+    y = E12.random(curve_id.value)
+    a, b = E6.random(curve_id.value), E6.random(curve_id.value)
+
+    def compute():
+        return (
+            ((x * y).square().__inv__() ** 12345).value_coeffs,
+            ((a * b).__inv__() ** 12345).value_coeffs,
+        )
+
+    expected = compute()
+    monkeypatch.setattr(tower_backup, "NATIVE_TOWER", not native)
+    assert compute() == expected
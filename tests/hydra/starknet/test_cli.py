@@ -0,0 +1,410 @@
+import asyncio
+import json
+import shutil
+from types import SimpleNamespace
+
+import pytest
+from starknet_py.net.account.account import Account
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import (
+    Call,
+    EstimatedFee,
+    PriceUnit,
+    SentTransactionResponse,
+    SierraContractClass,
+    TransactionExecutionStatus,
+)
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.models import StarknetChainId
+from starknet_py.net.signer.stark_curve_signer import KeyPair
+from starknet_py.transaction_errors import TransactionRejectedError
+from typer.testing import CliRunner
+
+from garaga.starknet.cli.starknet_cli import app
+from garaga.starknet.groth16_contract_generator.calldata import (
+    groth16_calldata_from_vk_and_proof,
+)
+from garaga.starknet.groth16_contract_generator.parsing_utils import (
+    Groth16Proof,
+    Groth16VerifyingKey,
+)
+
+EXAMPLES = "hydra/garaga/starknet/groth16_contract_generator/examples"
+VK_PATH = f"{EXAMPLES}/vk_bn254.json"
+PROOF_PATH = f"{EXAMPLES}/proof_bn254.json"
+
+
+@pytest.fixture
+def expected_calldata():
+    return groth16_calldata_from_vk_and_proof(
+        Groth16VerifyingKey.from_json(VK_PATH), Groth16Proof.from_json(PROOF_PATH)
+    )
+
+
+def _run_batch(
+    args: list[str], input: str | None = None, exit_code: int = 0
+) -> list[dict]:
+    result = CliRunner().invoke(
+        app,
+        ["calldata", "--system", "groth16", "--vk", VK_PATH, *args],
+        input=input,
+    )
+    assert result.exit_code == exit_code, result.output
+    if exit_code:
+        assert "proofs failed" in result.stderr
+    return [json.loads(line) for line in result.stdout.splitlines()]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_calldata_batch_directory(tmp_path, expected_calldata, workers):
+    for i in range(3):
+        shutil.copy(PROOF_PATH, tmp_path / f"proof_{i}.json")
+    (tmp_path / "proof_3.json").write_text("{}")
+
+    results = _run_batch(
+        ["--batch", str(tmp_path), "--workers", str(workers)], exit_code=1
+    )
+    assert [r["index"] for r in results] == [0, 1, 2, 3]
+    assert [r["source"] for r in results] == [
+        str(tmp_path / f"proof_{i}.json") for i in range(4)
+    ]
+    assert all(r["calldata"] == expected_calldata for r in results[:3])
+    assert "error" in results[3] and "calldata" not in results[3]
+
+    # Glob pattern.
+    results = _run_batch(["--batch", str(tmp_path / "proof_[12].json")])
+    assert [r["calldata"] for r in results] == [expected_calldata] * 2
+
+
+def test_calldata_batch_stdin(expected_calldata):
+    with open(PROOF_PATH) as f:
+        proof = json.dumps(json.load(f))
+    results = _run_batch(
+        ["--batch", "-", "--workers", "2"],
+        input=f"{proof}\nnot json\n\n{proof}\n",
+        exit_code=1,
+    )
+    assert [r["source"] for r in results] == ["stdin:1", "stdin:2", "stdin:4"]
+    assert results[0]["calldata"] == results[2]["calldata"] == expected_calldata
+    assert results[1]["error"].startswith("JSONDecodeError")
+
+
+def test_calldata_requires_proof_or_batch():
+    result = CliRunner().invoke(
+        app, ["calldata", "--system", "groth16", "--vk", VK_PATH]
+    )
+    assert result.exit_code != 0
+
+
+@pytest.mark.parametrize(
+    "option", [["--format", "array"], ["--public-inputs", PROOF_PATH]]
+)
+def test_calldata_batch_rejects_single_proof_options(tmp_path, option):
+    shutil.copy(PROOF_PATH, tmp_path / "proof.json")
+    result = CliRunner().invoke(
+        app,
+        ["calldata", "--system", "groth16", "--vk", VK_PATH]
+        + ["--batch", str(tmp_path), *option],
+    )
+    assert result.exit_code == 2
+    assert "can not be used with --batch" in result.output
+
+
+@pytest.mark.asyncio
+async def test_serve_calldata(expected_calldata):
+    from aiohttp.test_utils import TestClient, TestServer
+
+    from garaga.starknet.cli.serve import create_app, vk_id
+
+    with open(VK_PATH) as f:
+        vk = json.load(f)
+    with open(PROOF_PATH) as f:
+        proof = json.load(f)
+
+    async with TestClient(TestServer(create_app([vk], workers=2))) as client:
+        assert await (await client.get("/vks")).json() == [vk_id(vk)]
+
+        responses = await asyncio.gather(
+            client.post("/calldata", json={"vk_id": vk_id(vk), "proof": proof}),
+            client.post("/calldata", json={"vk": vk, "proof": proof}),
+            client.post("/calldata", json={"vk_id": "unknown", "proof": proof}),
+            client.post("/calldata", json={"vk_id": vk_id(vk), "proof": {}}),
+        )
+        results = [await r.json() for r in responses]
+        assert [r.status for r in responses] == [200, 200, 400, 400]
+        assert results[0]["calldata"] == results[1]["calldata"] == expected_calldata
+        assert "Unknown vk_id" in results[2]["error"]
+
+        metrics = await (await client.get("/metrics")).json()
+        assert metrics["requests"] == 4 and metrics["errors"] == 2
+        assert metrics["in_flight"] == 0 and metrics["vks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_serve_evicts_vks(expected_calldata):
+    from aiohttp.test_utils import TestClient, TestServer
+
+    from garaga.starknet.cli.serve import create_app, vk_id
+
+    with open(VK_PATH) as f:
+        vk = json.load(f)
+    with open(PROOF_PATH) as f:
+        proof = json.load(f)
+    with open(f"{EXAMPLES}/vk_bls.json") as f:
+        other_vk = json.load(f)
+    with open(f"{EXAMPLES}/proof_bls.json") as f:
+        other_proof = json.load(f)
+
+    async def post(client, body):
+        response = await client.post("/calldata", json=body)
+        return response.status, await response.json()
+
+    app = create_app(workers=1, max_vks=1)
+    async with TestClient(TestServer(app)) as client:
+        assert (await post(client, {"vk": vk, "proof": proof}))[0] == 200
+        # The worker already has the key: only its id is sent.
+        assert (await post(client, {"vk": vk, "proof": proof}))[0] == 200
+        assert (await post(client, {"vk_id": vk_id(vk), "proof": proof}))[0] == 200
+        assert (await (await client.get("/metrics")).json())["vk_uploads"] == 1
+
+        status, _ = await post(client, {"vk": other_vk, "proof": other_proof})
+        assert status == 200
+        assert await (await client.get("/vks")).json() == [vk_id(other_vk)]
+        status, result = await post(client, {"vk_id": vk_id(vk), "proof": proof})
+        assert status == 400 and "Unknown vk_id" in result["error"]
+
+        status, result = await post(client, {"vk": vk, "proof": proof})
+        assert status == 200 and result["calldata"] == expected_calldata
+        metrics = await (await client.get("/metrics")).json()
+        assert metrics["vks"] == 1 and metrics["vk_uploads"] == 3
+
+    # Workers that did not parse a key yet get it on a retry.
+    async with TestClient(TestServer(create_app(workers=2))) as client:
+        assert (await post(client, {"vk": vk, "proof": proof}))[0] == 200
+        results = await asyncio.gather(
+            *(post(client, {"vk_id": vk_id(vk), "proof": proof}) for _ in range(4))
+        )
+        assert all(
+            r == (200, {"vk_id": vk_id(vk), "calldata": expected_calldata})
+            for r in results
+        )
+        # At most one retry per request, never on the worker that parsed the key first.
+        assert 1 <= (await (await client.get("/metrics")).json())["vk_uploads"] <= 5
+
+
+def test_serve_worker_vks_lru(monkeypatch):
+    from collections import OrderedDict
+
+    from garaga.starknet.cli import serve
+
+    with open(VK_PATH) as f:
+        vk = json.load(f)
+    with open(f"{EXAMPLES}/vk_bls.json") as f:
+        other_vk = json.load(f)
+    monkeypatch.setattr(serve, "_WORKER_VKS", OrderedDict())
+    monkeypatch.setattr(serve, "_WORKER_MAX_VKS", 1)
+
+    with pytest.raises(serve.WorkerMissingVk):
+        serve._worker_vk("a", None)
+    parsed = serve._worker_vk("a", vk)
+    assert serve._worker_vk("a", None) is parsed
+    serve._worker_vk("b", other_vk)
+    assert list(serve._WORKER_VKS) == ["b"]
+
+
+class FakeNode(FullNodeClient):
+    """
+    RPC stand-in: pending transactions are not visible to the fee estimation until
+    they are accepted, and transactions must be sent in nonce order. Transactions with
+    777 as last calldata are rejected, which drops the following pending ones.
+    """
+
+    def __init__(self, max_in_flight: int):
+        super().__init__(node_url="http://127.0.0.1:0")
+        self.max_in_flight = max_in_flight
+        self.accepted_nonce = 5
+        self.next_nonce = 5
+        self.in_flight = 0
+        self.estimate_calls = 0
+        # Nonce and rejection of the sent transactions, by hash.
+        self.sent = {}
+
+    async def get_class_at(self, contract_address, block_hash=None, block_number=None):
+        return SierraContractClass("0.1.0", [], None)
+
+    async def get_contract_nonce(
+        self, contract_address, block_hash=None, block_number=None
+    ):
+        return self.accepted_nonce
+
+    async def estimate_fee(self, tx, skip_validate=False, **kwargs):
+        self.estimate_calls += 1
+        assert [t.nonce for t in tx] == list(range(tx[0].nonce, tx[0].nonce + len(tx)))
+        if tx[0].nonce != self.accepted_nonce:
+            raise ClientError("Invalid transaction nonce")
+        return [
+            EstimatedFee(1000, 10, 0, 0, 10000, PriceUnit.FRI) for _ in range(len(tx))
+        ]
+
+    async def send_transaction(self, transaction):
+        if transaction.calldata[-1] == 666:
+            raise ClientError("Transaction execution error")
+        assert transaction.nonce == self.next_nonce
+        assert transaction.resource_bounds.l1_gas.max_price_per_unit > 0
+        self.next_nonce += 1
+        self.in_flight += 1
+        assert self.in_flight <= self.max_in_flight
+        tx_hash = len(self.sent) + 1000
+        self.sent[tx_hash] = (transaction.nonce, transaction.calldata[-1] == 777)
+        return SentTransactionResponse(transaction_hash=tx_hash)
+
+    async def wait_for_tx(self, tx_hash, check_interval=2, retries=500):
+        await asyncio.sleep(0.01)
+        nonce, rejected = self.sent[tx_hash]
+        assert nonce == self.accepted_nonce  # Accepted in nonce order.
+        if rejected:
+            self.next_nonce = self.accepted_nonce
+            self.in_flight = 0
+            raise TransactionRejectedError()
+        self.accepted_nonce += 1
+        self.in_flight -= 1
+        return SimpleNamespace(
+            execution_status=TransactionExecutionStatus.SUCCEEDED,
+            actual_fee=SimpleNamespace(amount=9000),
+            block_number=nonce,
+        )
+
+
+@pytest.mark.asyncio
+async def test_invoke_many_async():
+    from garaga.starknet.cli.verify import invoke_many_async
+
+    node = FakeNode(max_in_flight=3)
+    account = Account(
+        address=0x123,
+        client=node,
+        key_pair=KeyPair.from_private_key(0x456),
+        chain=StarknetChainId.SEPOLIA,
+    )
+    calls = [
+        Call(to_addr=0x789, selector=0x1, calldata=[i if i != 4 else 666])
+        for i in range(8)
+    ]
+    results = await invoke_many_async(account, calls, max_in_flight=3)
+
+    assert [r["index"] for r in results] == list(range(8))
+    assert "Transaction execution error" in results[4]["error"]
+    ok = [r for r in results if "error" not in r]
+    assert [r["nonce"] for r in ok] == list(range(5, 12))
+    assert all(r["status"] == "SUCCEEDED" and r["actual_fee"] == 9000 for r in ok)
+    assert node.accepted_nonce == node.next_nonce == 12
+    # One estimation per group of 3, and a retry once the pending ones are accepted.
+    assert node.estimate_calls == 5
+
+
+@pytest.mark.asyncio
+async def test_invoke_many_async_rejected():
+    from garaga.starknet.cli.verify import invoke_many_async
+
+    node = FakeNode(max_in_flight=3)
+    account = Account(
+        address=0x123,
+        client=node,
+        key_pair=KeyPair.from_private_key(0x456),
+        chain=StarknetChainId.SEPOLIA,
+    )
+    calls = [
+        Call(to_addr=0x789, selector=0x1, calldata=[i if i != 1 else 777])
+        for i in range(6)
+    ]
+    results = await invoke_many_async(account, calls, max_in_flight=3)
+
+    assert [r["index"] for r in results] == list(range(6))
+    assert "TransactionRejectedError" in results[1]["error"]
+    # The following calls are sent again from the nonce of the rejected one.
+    ok = [r for r in results if "error" not in r]
+    assert [r["index"] for r in ok] == [0, 2, 3, 4, 5]
+    assert [r["nonce"] for r in ok] == list(range(5, 10))
+    assert all(r["status"] == "SUCCEEDED" for r in ok)
+    assert node.accepted_nonce == node.next_nonce == 10
+    assert len(node.sent) == 7
+
+
+@pytest.mark.asyncio
+async def test_verify_onchain_async_merges_results(monkeypatch):
+    from garaga.starknet.cli import verify
+
+    invoked = [{"index": 0, "tx_hash": 0x1, "status": "SUCCEEDED"}]
+
+    async def fake_invoke_many_async(account, calls, max_in_flight):
+        assert [call.calldata for call in calls] == [[1, 2]]
+        return invoked
+
+    async def fake_get_contract(account, contract_address):
+        function = SimpleNamespace(
+            name="verify_groth16_proof_bn254",
+            contract_data=SimpleNamespace(address=contract_address),
+            get_selector=lambda name: 0x1,
+        )
+        return SimpleNamespace(functions={function.name: function})
+
+    monkeypatch.setattr(verify, "load_account", lambda network, session: None)
+    monkeypatch.setattr(verify, "get_contract_iff_exists_async", fake_get_contract)
+    monkeypatch.setattr(verify, "invoke_many_async", fake_invoke_many_async)
+    items = [
+        {"index": 0, "source": "a.json", "error": "ValueError: invalid proof"},
+        {"index": 1, "source": "b.json", "calldata": [1, 2]},
+    ]
+    results = await verify._verify_onchain_async(
+        verify.Network.SEPOLIA, 0x789, "verify_groth16_proof_bn254", items, 8
+    )
+    assert results == [
+        items[0],
+        {"index": 1, "source": "b.json", "tx_hash": 0x1, "status": "SUCCEEDED"},
+    ]
+    # The results of invoke_many_async are left untouched.
+    assert invoked == [{"index": 0, "tx_hash": 0x1, "status": "SUCCEEDED"}]
+
+
+def test_scarb_artifacts_cache(tmp_path, monkeypatch):
+    from garaga.starknet.cli import utils
+
+    lib = tmp_path / "lib"
+    (lib / "src").mkdir(parents=True)
+    (lib / "Scarb.toml").write_text('[package]\nname = "lib"\n')
+    (lib / "src" / "lib.cairo").write_text("fn f() {}")
+    contract = tmp_path / "contract"
+    (contract / "src").mkdir(parents=True)
+    (contract / "Scarb.toml").write_text(
+        '[package]\nname = "contract"\n\n[dependencies]\nlib = { path = "../lib" }\n'
+    )
+    (contract / "src" / "lib.cairo").write_text("mod verifier;")
+
+    builds = []
+
+    def fake_scarb_build(contract_folder_path):
+        builds.append(contract_folder_path)
+        target_dir = contract / "target" / "dev"
+        (target_dir / "c.starknet_artifacts.json").write_text(
+            json.dumps(
+                {"contracts": [{"artifacts": {"sierra": "c.sierra", "casm": "c.casm"}}]}
+            )
+        )
+        (target_dir / "c.sierra").write_text(f"sierra {len(builds)}")
+        (target_dir / "c.casm").write_text(f"casm {len(builds)}")
+
+    scarb_version = "scarb 2.8.4"
+    monkeypatch.setattr(utils, "get_scarb_version", lambda: scarb_version)
+    monkeypatch.setattr(utils, "scarb_build_contract_folder", fake_scarb_build)
+
+    assert utils.get_sierra_casm_artifacts(contract) == ("sierra 1", "casm 1")
+    assert utils.get_sierra_casm_artifacts(contract) == ("sierra 1", "casm 1")
+    assert len(builds) == 1
+
+    # Changes in a path dependency invalidate the cache.
+    (lib / "src" / "lib.cairo").write_text("fn g() {}")
+    assert utils.get_sierra_casm_artifacts(contract) == ("sierra 2", "casm 2")
+    scarb_version = "scarb 2.9.1"
+    assert utils.get_sierra_casm_artifacts(contract) == ("sierra 3", "casm 3")
+    assert utils.get_sierra_casm_artifacts(contract, use_cache=False)[0] == "sierra 4"
+    assert len(builds) == 4
@@ -1,5 +1,6 @@
 import pytest
 
+from garaga import definitions
 from garaga.starknet.groth16_contract_generator.calldata import (
     groth16_calldata_from_vk_and_proof,
 )
@@ -86,3 +87,13 @@ def test_calldata_generation(
     end = time.time()
     print(f"Rust time: {end - start}")
     assert calldata == calldata_rust
+
+
+def test_python_calldata_does_not_persist_tables(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "fixed_base_cache"
+    monkeypatch.setattr(definitions, "FIXED_BASE_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(definitions, "_FIXED_BASE_TABLES", {})
+    vk = Groth16VerifyingKey.from_json(f"{PATH}/vk_bn254.json")
+    proof = Groth16Proof.from_json(f"{PATH}/proof_bn254.json")
+    groth16_calldata_from_vk_and_proof(vk, proof, use_rust=False)
+    assert not cache_dir.exists()
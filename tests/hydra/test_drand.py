@@ -1,13 +1,21 @@
+import asyncio
 import hashlib
 import random
 
 import pytest
+from aiohttp import web
 
 from garaga.definitions import CurveID, G1G2Pair, G2Point
+from garaga.drand import client
 from garaga.drand.client import (
     DrandNetwork,
+    DrandRequestError,
     digest_func,
+    get_chain_info,
+    get_chain_info_async,
+    get_chains_async,
     get_randomness,
+    get_randomness_async,
     print_all_chain_info,
 )
 from garaga.drand.tlock import decrypt_at_round, encrypt_for_round
@@ -95,3 +103,176 @@ def test_tlock_encrypt_same_message_gives_different_ciphertexts(round: int):
 
     assert msg_decrypted1 == msg
     assert msg_decrypted2 == msg
+
+
+QUICKNET_ROUND_1 = {
+    "round": 1,
+    "randomness": "d8e2c5ca3d1ec8b9dd04d1b0a2d6b2fbbbf2b8d1fc6a5c1f8b3f2c6c4a8a1b0c",
+    "signature": "b4e2c5ca",
+}
+
+
+async def _start_mirror(handler) -> tuple[web.AppRunner, str]:
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}/"
+
+
+@pytest.mark.asyncio
+async def test_drand_client_mirror_racing(tmp_path, monkeypatch):
+    monkeypatch.setattr(client, "DRAND_CACHE_DIR", str(tmp_path))
+    chain_hash = DrandNetwork.quicknet.value
+    calls = {"good": 0}
+
+    async def broken(request):
+        return web.Response(status=500)
+
+    async def wrong_round(request):
+        return web.json_response({**QUICKNET_ROUND_1, "round": 2})
+
+    async def not_a_dict(request):
+        return web.json_response([QUICKNET_ROUND_1])
+
+    async def slow(request):
+        await asyncio.sleep(5)
+        return web.json_response(QUICKNET_ROUND_1)
+
+    async def good(request):
+        calls["good"] += 1
+        # Answers after the invalid mirrors.
+        await asyncio.sleep(0.2)
+        assert request.path == f"/{chain_hash}/public/1"
+        return web.json_response(QUICKNET_ROUND_1)
+
+    runners, urls = [], []
+    for handler in [broken, wrong_round, not_a_dict, slow, good]:
+        runner, url = await _start_mirror(handler)
+        runners.append(runner)
+        urls.append(url)
+    try:
+        beacon = await asyncio.wait_for(
+            get_randomness_async(chain_hash, 1, base_urls=urls), timeout=10
+        )
+        assert beacon.round_number == 1
+        assert beacon.signature == QUICKNET_ROUND_1["signature"]
+        assert calls["good"] == 1
+
+        # Finalized rounds are served from the local cache.
+        cached = await get_randomness_async(chain_hash, 1, base_urls=[])
+        assert cached == beacon
+        assert calls["good"] == 1
+
+        with pytest.raises(DrandRequestError):
+            await get_randomness_async(chain_hash, 3, base_urls=urls[:3])
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_drand_client_chain_info_memoized(monkeypatch):
+    monkeypatch.setattr(client, "_CHAIN_INFOS", {})
+    chain_hash = DrandNetwork.quicknet.value
+    calls = {"info": 0}
+
+    async def info(request):
+        calls["info"] += 1
+        return web.json_response(
+            {
+                "public_key": "00",
+                "period": 3,
+                "genesis_time": 1692803367,
+                "hash": chain_hash,
+                "groupHash": "f477d5c89f21a17c863a7f937c6a6d15859414d2be09cd448d4279af331c5d3e",
+                "schemeID": "bls-unchained-g1-rfc9380",
+                "metadata": {"beaconID": "quicknet"},
+            }
+        )
+
+    runner, url = await _start_mirror(info)
+    try:
+        first = await get_chain_info_async(chain_hash, base_urls=[url])
+        second = await get_chain_info_async(chain_hash, base_urls=[url])
+        assert first is second
+        # The sync API can be called from a running event loop.
+        assert get_chain_info(chain_hash) is first
+        assert first.period == 3 and first.beacon_id == "quicknet"
+        assert calls["info"] == 1
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_drand_client_chains():
+    known = [DrandNetwork.quicknet.value, DrandNetwork.default.value]
+
+    async def chains(request):
+        assert request.path == "/chains"
+        return web.json_response([*known, "00" * 32])
+
+    async def not_a_list(request):
+        return web.json_response({"chains": known})
+
+    runner, url = await _start_mirror(chains)
+    invalid_runner, invalid_url = await _start_mirror(not_a_list)
+    try:
+        assert await get_chains_async(base_urls=[url]) == known
+        with pytest.raises(DrandRequestError, match="expected a JSON list"):
+            await get_chains_async(base_urls=[invalid_url])
+    finally:
+        await runner.cleanup()
+        await invalid_runner.cleanup()
+
+
+def test_drand_rounds_to_calldata(tmp_path, monkeypatch):
+    # Offline chain with a known key, whose rounds are served from the local cache.
+    from garaga.drand.client import NetworkInfo, save_round
+    from garaga.starknet.tests_and_calldata_generators.drand_calldata import (
+        drand_round_to_calldata,
+        drand_rounds_to_calldata,
+    )
+
+    chain_hash = DrandNetwork.quicknet.value
+    secret_key = random.randrange(1, 2**128)
+    monkeypatch.setattr(client, "DRAND_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        client,
+        "_CHAIN_INFOS",
+        {
+            chain_hash: NetworkInfo(
+                public_key=G2Point.get_nG(CurveID.BLS12_381, secret_key),
+                period=3,
+                genesis_time=1692803367,
+                hash=chain_hash,
+                group_hash="",
+                scheme_id="bls-unchained-g1-rfc9380",
+            )
+        },
+    )
+    monkeypatch.setattr(client, "BASE_URLS", [])
+    rounds = [1, 2, 1000]
+    for round_number in rounds:
+        msg_point = hash_to_curve(
+            digest_func(round_number), CurveID.BLS12_381, "sha256"
+        )
+        signature = msg_point.scalar_mul(secret_key)
+        save_round(
+            chain_hash,
+            {
+                "round": round_number,
+                "randomness": hashlib.sha256(b"%d" % round_number).hexdigest(),
+                "signature": (
+                    signature.x.to_bytes(48, "big") + signature.y.to_bytes(48, "big")
+                ).hex(),
+            },
+        )
+
+    expected = [drand_round_to_calldata(r) for r in rounds]
+    assert drand_rounds_to_calldata(rounds, max_workers=1) == expected
+    assert drand_rounds_to_calldata(rounds, max_workers=2) == expected
+    assert drand_rounds_to_calldata([]) == []
@@ -1,10 +1,15 @@
+import functools
+import random
+
 import pytest
 
+from garaga import definitions, garaga_rs, jacobian
 from garaga.definitions import (
     CURVES,
     CurveID,
     G1Point,
     TwistedEdwardsCurve,
+    get_base_field,
     is_generator,
 )
 
@@ -152,6 +157,54 @@ def test_g1point_msm_vs_scalar_mul(curve_id):
     assert msm_result == scalar_mul_result
 
 
+@pytest.mark.parametrize("native", [False, True])
+@pytest.mark.parametrize("curve_id", curve_ids)
+@pytest.mark.parametrize("n_points", [2, 5, 40])
+def test_g1point_msm_matches_scalar_muls(curve_id, n_points, native, monkeypatch):
+    if native and not hasattr(garaga_rs, "g1_msm"):
+        pytest.skip("garaga_rs was built without g1_msm")
+    monkeypatch.setattr(definitions, "NATIVE_G1_MSM", native)
+    n = CURVES[curve_id.value].n
+    points = [G1Point.gen_random_point(curve_id) for _ in range(n_points)]
+    scalars = [random.randint(-n + 1, n - 1) for _ in range(n_points)]
+    # Edge cases : zero scalar, repeated point, opposite point, point at infinity.
+    scalars[0] = 0
+    points[1] = points[0]
+    if n_points > 2:
+        points[2] = -points[1]
+        scalars[2] = scalars[1]
+        points[3] = G1Point.infinity(curve_id)
+
+    expected = functools.reduce(
+        lambda acc, P: acc.add(P),
+        [P.scalar_mul(s) for P, s in zip(points, scalars)],
+    )
+    assert G1Point.msm(points, scalars) == expected
+
+    curve = CURVES[curve_id.value]
+    res = jacobian.msm([(P.x, P.y) for P in points], scalars, curve.a, curve.p)
+    assert jacobian.to_affine(res, curve.p) == (expected.x, expected.y)
+
+
+def test_g1point_msm_iso_points():
+    curve_id = CurveID.BLS12_381
+    params = CURVES[curve_id.value].swu_params
+    field = get_base_field(curve_id)
+    points = []
+    while len(points) < 6:
+        x = field.random()
+        y2 = x**3 + params.A * x + params.B
+        if y2.is_quad_residue():
+            points.append(G1Point(x.value, y2.sqrt().value, curve_id, iso_point=True))
+    scalars = [random.randint(1, 2**64) for _ in points]
+
+    expected = functools.reduce(
+        lambda acc, P: acc.add(P),
+        [P.scalar_mul(s) for P, s in zip(points, scalars)],
+    )
+    assert G1Point.msm(points, scalars) == expected
+
+
 # Edge case tests for scalar multiplication
 @pytest.mark.parametrize("curve_id", curve_ids)
 def test_g1point_scalar_mul_zero(curve_id):
@@ -204,3 +257,59 @@ def test_g1point_scalar_mul_larger_than_order(curve_id):
     for p in random_points:
         result = p.scalar_mul(CURVES[curve_id.value].n + 1)
         assert result == p
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_g1point_trusted(curve_id, monkeypatch):
+    curve = CURVES[curve_id.value]
+    assert G1Point.trusted(curve.Gx, curve.Gy, curve_id) == G1Point(
+        curve.Gx, curve.Gy, curve_id
+    )
+
+    monkeypatch.setattr(G1Point, "validate_trusted", False)
+    p = G1Point.trusted(curve.Gx, 3, curve_id)
+    assert not p.is_on_curve()
+    with pytest.raises(ValueError):
+        G1Point(curve.Gx, 3, curve_id)
+
+    monkeypatch.setattr(G1Point, "validate_trusted", True)
+    with pytest.raises(ValueError):
+        G1Point.trusted(curve.Gx, 3, curve_id)
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_g1point_fixed_base_tables(curve_id, monkeypatch, tmp_path):
+    monkeypatch.setattr(definitions, "_FIXED_BASE_TABLES", {})
+    monkeypatch.setattr(definitions, "FIXED_BASE_CACHE_DIR", str(tmp_path))
+    n = CURVES[curve_id.value].n
+    points = [G1Point.gen_random_point(curve_id) for _ in range(3)]
+    scalars = [random.randint(-n + 1, n - 1) for _ in range(3)] + [0, n - 1]
+    expected_muls = [P.scalar_mul(s) for P, s in zip(points, scalars)]
+    expected_msm = G1Point.msm(points, scalars[:3])
+
+    G1Point.precompute_tables(points + [G1Point.infinity(curve_id)], persist=True)
+    assert [P.scalar_mul(s) for P, s in zip(points, scalars)] == expected_muls
+    assert points[0].scalar_mul(0).is_infinity()
+    assert points[0].scalar_mul(n - 1) == -points[0]
+    assert G1Point.msm(points, scalars[:3]) == expected_msm
+    assert G1Point.msm(points + [G1Point.infinity(curve_id)], scalars[:3] + [5]) == (
+        expected_msm
+    )
+
+    # Reloaded from the cache directory.
+    tables = [definitions._FIXED_BASE_TABLES[P] for P in points]
+    monkeypatch.setattr(definitions, "_FIXED_BASE_TABLES", {})
+    assert len(list(tmp_path.iterdir())) == 1
+    G1Point.precompute_tables(points, persist=True)
+    assert [definitions._FIXED_BASE_TABLES[P] for P in points] == tables
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_g1point_is_in_prime_order_subgroup_many(curve_id):
+    n = CURVES[curve_id.value].n
+    points = [G1Point.gen_random_point(curve_id) for _ in range(3)]
+    points.append(G1Point.infinity(curve_id))
+    if CURVES[curve_id.value].h != 1:
+        points += [G1Point.gen_random_point_not_in_subgroup(curve_id) for _ in range(3)]
+    expected = [P.scalar_mul(n).is_infinity() for P in points]
+    assert G1Point.is_in_prime_order_subgroup_many(points) == expected
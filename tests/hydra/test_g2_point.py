@@ -2,7 +2,8 @@ import random
 
 import pytest
 
-from garaga.definitions import CURVES, CurveID, G2Point
+from garaga import definitions, garaga_rs
+from garaga.definitions import CURVES, CurveID, Fp2, G2Point, get_base_field
 
 # List of curve IDs to test
 curve_ids = [CurveID.BN254, CurveID.BLS12_381]
@@ -65,8 +66,10 @@ def test_g2point_addition(curve_id):
 @pytest.mark.parametrize("curve_id", curve_ids)
 def test_g2point_negation(curve_id):
     p = get_g2_generator_point(curve_id)
+    p_mod = CURVES[curve_id.value].p
     neg_p = -p
     assert neg_p.is_on_curve()
+    assert neg_p == G2Point(p.x, (-p.y[0] % p_mod, -p.y[1] % p_mod), curve_id)
     assert p.add(neg_p).is_infinity()
 
 
@@ -147,3 +150,66 @@ def test_g2point_scalar_mul_larger_than_order_random_points(curve_id):
     for p in random_points:
         result = p.scalar_mul(CURVES[curve_id.value].n + 1)
         assert result == p
+
+
+@pytest.mark.parametrize("native", [False, True])
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_g2point_batch_ops(curve_id, native, monkeypatch):
+    if native and not hasattr(garaga_rs, "g2_scalar_mul_batch"):
+        pytest.skip("garaga_rs was built without the batched G2 bindings")
+    monkeypatch.setattr(definitions, "NATIVE_G2_BATCH", native)
+    n = CURVES[curve_id.value].n
+    points = [G2Point.gen_random_point(curve_id) for _ in range(6)]
+    others = [G2Point.gen_random_point(curve_id) for _ in range(6)]
+    scalars = [random.randint(-n + 1, n - 1) for _ in range(6)]
+    scalars[0] = 0
+    others[1] = -points[1]
+    others[2] = G2Point.infinity(curve_id)
+
+    products = G2Point.scalar_mul_many(points, scalars)
+    assert products == [P.scalar_mul(s) for P, s in zip(points, scalars)]
+    sums = G2Point.add_many(points, others)
+    assert sums == [P.add(Q) for P, Q in zip(points, others)]
+    assert sums[1].is_infinity()
+    assert all(P.is_on_curve() for P in products + sums if not P.is_infinity())
+
+    expected = products[0]
+    for P in products[1:]:
+        expected = expected.add(P)
+    assert G2Point.msm(points, scalars) == expected
+
+
+def gen_random_point_not_in_subgroup(curve_id):
+    curve = CURVES[curve_id.value]
+    field = get_base_field(curve_id, Fp2)
+    while True:
+        x = field((random.randrange(curve.p), random.randrange(curve.p)))
+        y2 = x**3 + field((curve.b20, curve.b21))
+        if y2.is_quad_residue():
+            y = y2.sqrt()
+            return G2Point((x.a0.value, x.a1.value), (y.a0.value, y.a1.value), curve_id)
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_g2point_is_in_prime_order_subgroup(curve_id, monkeypatch):
+    G = get_g2_generator_point(curve_id)
+    assert G.psi().is_on_curve()
+    points = [G2Point.gen_random_point(curve_id) for _ in range(3)]
+    assert G2Point.is_in_prime_order_subgroup_many(points) == [True] * 3
+    assert G2Point.infinity(curve_id).is_in_prime_order_subgroup()
+    bad = [gen_random_point_not_in_subgroup(curve_id) for _ in range(3)]
+    assert G2Point.is_in_prime_order_subgroup_many(bad + points[:1]) == [
+        False,
+        False,
+        False,
+        True,
+    ]
+
+    if not hasattr(garaga_rs, "g2_subgroup_check_batch"):
+        return
+    # The Jacobian fallback agrees with the native checks.
+    monkeypatch.delattr(garaga_rs, "g2_subgroup_check_batch")
+    assert (
+        G2Point.is_in_prime_order_subgroup_many(bad + points)
+        == [False] * 3 + [True] * 3
+    )
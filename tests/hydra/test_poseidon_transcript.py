@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from garaga.algebra import PyFelt
+from garaga.definitions import CurveID, get_base_field
+from garaga.poseidon_transcript import CairoPoseidonTranscript
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+@pytest.mark.parametrize("n", [0, 1, 7])
+def test_hash_limbs_multi_matches_hash_element(curve_id: CurveID, n: int):
+    field = get_base_field(curve_id)
+    X = [field.random() for _ in range(n)]
+
+    expected = CairoPoseidonTranscript(init_hash=0)
+    for x in X:
+        expected.hash_element(x)
+    expected.RLC_coeff
+
+    transcript = CairoPoseidonTranscript(init_hash=0)
+    transcript.hash_limbs_multi(X)
+    transcript.RLC_coeff
+
+    assert (transcript.s0, transcript.s1, transcript.s2) == (
+        expected.s0,
+        expected.s1,
+        expected.s2,
+    )
+    assert transcript.permutations_count == expected.permutations_count == n + 1
+    assert transcript.poseidon_ptr_indexes == expected.poseidon_ptr_indexes
+
+
+def test_hash_u256_and_u128_multi():
+    random.seed(0)
+    u256s = [random.randint(0, 2**256 - 1) for _ in range(5)]
+    u128s = [PyFelt(random.randint(0, 2**128 - 1), 2**128) for _ in range(5)]
+
+    expected = CairoPoseidonTranscript(init_hash=1)
+    for x in u256s:
+        expected.hash_u256(x)
+    for x in u128s:
+        expected.hash_u128(x)
+
+    transcript = CairoPoseidonTranscript(init_hash=1)
+    transcript.hash_u256_multi(u256s)
+    transcript.hash_u128_multi(u128s)
+
+    assert transcript.s0 == expected.s0
+    assert transcript.permutations_count == expected.permutations_count
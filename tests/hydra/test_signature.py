@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from garaga import garaga_rs
+from garaga.definitions import CurveID, G1Point
+from garaga.signature import (
+    apply_isogeny,
+    apply_isogeny_many,
+    hash_to_curve,
+    hash_to_curve_many,
+    hash_to_field,
+    map_to_curve,
+)
+
+
+def test_hash_to_curve_many(monkeypatch):
+    curve_id = CurveID.BLS12_381
+    messages = [random.randbytes(random.randint(0, 64)) for _ in range(8)]
+    points = hash_to_curve_many(messages, curve_id)
+    assert points == [hash_to_curve(m, curve_id) for m in messages]
+    for pt in points:
+        assert G1Point(pt.x, pt.y, curve_id) == pt
+        assert pt.is_in_prime_order_subgroup()
+
+    if not hasattr(garaga_rs, "hash_to_curve_many"):
+        return
+    # The python path agrees with the native one.
+    monkeypatch.delattr(garaga_rs, "hash_to_curve_many")
+    assert hash_to_curve_many(messages, curve_id) == points
+
+
+def test_apply_isogeny_many():
+    curve_id = CurveID.BLS12_381
+    iso_points = [
+        map_to_curve(u, curve_id)
+        for u in hash_to_field(random.randbytes(32), 4, curve_id, "sha256")
+    ]
+    assert apply_isogeny_many(iso_points) == [apply_isogeny(pt) for pt in iso_points]
+    assert apply_isogeny_many([]) == []
+    with pytest.raises(AssertionError):
+        apply_isogeny_many(apply_isogeny_many(iso_points))
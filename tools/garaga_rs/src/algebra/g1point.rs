@@ -110,6 +110,56 @@ impl<F: IsPrimeField + CurveParamsProvider<F>> G1Point<F> {
         result
     }
 
+    /// Computes sum(scalars[i] * points[i]) with Pippenger's bucket method.
+    /// Buckets and sums are kept in Jacobian coordinates, with a single inversion at the end.
+    pub fn msm(points: &[G1Point<F>], scalars: &[BigUint]) -> G1Point<F> {
+        assert_eq!(
+            points.len(),
+            scalars.len(),
+            "Points and scalars length mismatch"
+        );
+        let (points, limbs): (Vec<&G1Point<F>>, Vec<Vec<u64>>) = points
+            .iter()
+            .zip(scalars)
+            .filter(|(point, scalar)| !point.is_infinity() && scalar.bits() != 0)
+            .map(|(point, scalar)| (point, scalar.to_u64_digits()))
+            .unzip();
+        let max_bits = scalars.iter().map(|s| s.bits()).max().unwrap_or(0) as usize;
+        if points.is_empty() {
+            return G1Point::new_unchecked(FieldElement::<F>::zero(), FieldElement::<F>::zero());
+        }
+        let c: usize = match points.len() {
+            0..=3 => 2,
+            4..=31 => 3,
+            n => std::cmp::max(4, (usize::BITS - n.leading_zeros()) as usize - 2),
+        };
+        let n_windows = (max_bits + c - 1) / c;
+        let a = F::get_curve_params().a;
+
+        let mut result = JacobianPoint::<F>::infinity();
+        for w in (0..n_windows).rev() {
+            for _ in 0..c {
+                result = result.double(&a);
+            }
+            let mut buckets = vec![JacobianPoint::<F>::infinity(); (1 << c) - 1];
+            for (point, limbs) in points.iter().zip(&limbs) {
+                let digit = window_digit(limbs, w * c, c);
+                if digit != 0 {
+                    buckets[digit - 1] = buckets[digit - 1].add_affine(point, &a);
+                }
+            }
+            // sum(d * buckets[d - 1]) as a running sum from the highest bucket.
+            let mut running = JacobianPoint::<F>::infinity();
+            let mut window_sum = JacobianPoint::<F>::infinity();
+            for bucket in buckets.iter().rev() {
+                running = running.add(bucket, &a);
+                window_sum = window_sum.add(&running, &a);
+            }
+            result = result.add(&window_sum, &a);
+        }
+        result.to_affine()
+    }
+
     pub fn is_on_curve(&self) -> bool {
         if self.is_infinity() {
             return true;
@@ -136,8 +186,175 @@ impl<F: IsPrimeField + CurveParamsProvider<F>> G1Point<F> {
     }
 }
 
+/// Bits [offset, offset + c) of the scalar given by its little endian u64 limbs, with c < 64.
+fn window_digit(limbs: &[u64], offset: usize, c: usize) -> usize {
+    let (limb, shift) = (offset / 64, offset % 64);
+    let mut bits = limbs.get(limb).copied().unwrap_or(0) >> shift;
+    if shift + c > 64 {
+        bits |= limbs.get(limb + 1).copied().unwrap_or(0) << (64 - shift);
+    }
+    (bits & ((1_u64 << c) - 1)) as usize
+}
+
+/// Point (X / Z^2, Y / Z^3) in Jacobian coordinates, the point at infinity having Z = 0.
+/// Mirrors hydra/garaga/jacobian.py.
+#[derive(Debug, Clone)]
+struct JacobianPoint<F: IsPrimeField> {
+    x: FieldElement<F>,
+    y: FieldElement<F>,
+    z: FieldElement<F>,
+}
+
+impl<F: IsPrimeField + CurveParamsProvider<F>> JacobianPoint<F> {
+    fn infinity() -> Self {
+        Self {
+            x: FieldElement::<F>::one(),
+            y: FieldElement::<F>::one(),
+            z: FieldElement::<F>::zero(),
+        }
+    }
+
+    fn is_infinity(&self) -> bool {
+        self.z == FieldElement::<F>::zero()
+    }
+
+    fn to_affine(&self) -> G1Point<F> {
+        if self.is_infinity() {
+            return G1Point::new_unchecked(FieldElement::<F>::zero(), FieldElement::<F>::zero());
+        }
+        let z_inv = self.z.inv().unwrap();
+        let z_inv2 = z_inv.square();
+        G1Point::new_unchecked(&self.x * &z_inv2, &self.y * &(&z_inv2 * &z_inv))
+    }
+
+    fn double(&self, a: &FieldElement<F>) -> Self {
+        if self.is_infinity() || self.y == FieldElement::<F>::zero() {
+            return Self::infinity();
+        }
+        let yy = self.y.square();
+        let s = FieldElement::<F>::from(4_u64) * &self.x * &yy;
+        let m = FieldElement::<F>::from(3_u64) * &self.x.square() + a * &self.z.square().square();
+        let x3 = m.square() - FieldElement::<F>::from(2_u64) * &s;
+        let y3 = &m * &(&s - &x3) - FieldElement::<F>::from(8_u64) * &yy.square();
+        let z3 = FieldElement::<F>::from(2_u64) * &self.y * &self.z;
+        Self {
+            x: x3,
+            y: y3,
+            z: z3,
+        }
+    }
+
+    fn add(&self, other: &Self, a: &FieldElement<F>) -> Self {
+        if self.is_infinity() {
+            return other.clone();
+        }
+        if other.is_infinity() {
+            return self.clone();
+        }
+        let z1z1 = self.z.square();
+        let z2z2 = other.z.square();
+        let u1 = &self.x * &z2z2;
+        let u2 = &other.x * &z1z1;
+        let s1 = &self.y * &other.z * &z2z2;
+        let s2 = &other.y * &self.z * &z1z1;
+        let h = &u2 - &u1;
+        let r = &s2 - &s1;
+        if h == FieldElement::<F>::zero() {
+            if r == FieldElement::<F>::zero() {
+                return self.double(a);
+            }
+            return Self::infinity();
+        }
+        let hh = h.square();
+        let hhh = &h * &hh;
+        let v = &u1 * &hh;
+        let x3 = r.square() - &hhh - FieldElement::<F>::from(2_u64) * &v;
+        let y3 = &r * &(&v - &x3) - &s1 * &hhh;
+        let z3 = &self.z * &other.z * &h;
+        Self {
+            x: x3,
+            y: y3,
+            z: z3,
+        }
+    }
+
+    /// Mixed addition with a finite affine point.
+    fn add_affine(&self, other: &G1Point<F>, a: &FieldElement<F>) -> Self {
+        if self.is_infinity() {
+            return Self {
+                x: other.x.clone(),
+                y: other.y.clone(),
+                z: FieldElement::<F>::one(),
+            };
+        }
+        let z1z1 = self.z.square();
+        let u2 = &other.x * &z1z1;
+        let s2 = &other.y * &self.z * &z1z1;
+        let h = &u2 - &self.x;
+        let r = &s2 - &self.y;
+        if h == FieldElement::<F>::zero() {
+            if r == FieldElement::<F>::zero() {
+                return self.double(a);
+            }
+            return Self::infinity();
+        }
+        let hh = h.square();
+        let hhh = &h * &hh;
+        let v = &self.x * &hh;
+        let x3 = r.square() - &hhh - FieldElement::<F>::from(2_u64) * &v;
+        let y3 = &r * &(&v - &x3) - &self.y * &hhh;
+        let z3 = &self.z * &h;
+        Self {
+            x: x3,
+            y: y3,
+            z: z3,
+        }
+    }
+}
+
 impl<F: IsPrimeField> PartialEq for G1Point<F> {
     fn eq(&self, other: &Self) -> bool {
         self.x == other.x && self.y == other.y
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::definitions::{BN254PrimeField, SECP256K1PrimeField};
+
+    fn check_msm<F: IsPrimeField + CurveParamsProvider<F>>() {
+        let g = G1Point::<F>::generator();
+        let points: Vec<G1Point<F>> = (1..=40_u64)
+            .map(|k| g.scalar_mul(BigInt::from(k * 7919)))
+            .collect();
+        let mut scalars: Vec<BigUint> = (0..40_u64)
+            .map(|k| (BigUint::from(0x9e3779b97f4a7c15_u64) << (3 * k)) + k)
+            .collect();
+        scalars[3] = BigUint::ZERO;
+        for n in [1, 2, 5, 40] {
+            let expected = points[..n]
+                .iter()
+                .zip(&scalars[..n])
+                .fold(g.scalar_mul(BigInt::ZERO), |acc, (p, k)| {
+                    acc.add(&p.scalar_mul(BigInt::from(k.clone())))
+                });
+            assert_eq!(G1Point::msm(&points[..n], &scalars[..n]), expected);
+        }
+        // Doublings and cancellations inside the buckets.
+        let pairs = [g.clone(), g.clone(), g.neg()];
+        let ones = vec![BigUint::from(5_u64); 3];
+        assert_eq!(G1Point::msm(&pairs, &ones), g.scalar_mul(BigInt::from(5)));
+        assert!(G1Point::<F>::msm(&[], &[]).is_infinity());
+    }
+
+    #[test]
+    fn test_msm_bn254() {
+        check_msm::<BN254PrimeField>();
+    }
+
+    #[test]
+    fn test_msm_secp256k1() {
+        check_msm::<SECP256K1PrimeField>();
+    }
+}
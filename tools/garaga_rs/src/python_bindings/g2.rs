@@ -1,4 +1,7 @@
 use super::*;
+use ark_ec::short_weierstrass::{Affine, Projective, SWCurveConfig};
+use ark_ec::{CurveGroup, VariableBaseMSM};
+use ark_ff::{Fp2, Fp2Config};
 
 #[pyfunction]
 pub fn g2_add(
@@ -118,3 +121,220 @@ pub fn g2_scalar_mul(
 
     panic!("Curve ID {} not supported", curve_id);
 }
+
+fn g2_points_from_biguints<C, P>(values: &[BigUint]) -> PyResult<Vec<Affine<C>>>
+where
+    C: SWCurveConfig<BaseField = Fp2<P>>,
+    P: Fp2Config,
+{
+    if values.len() % 4 != 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "G2 points must be given as a flattened list of 4 coordinates per point",
+        ));
+    }
+    values
+        .chunks_exact(4)
+        .map(|c| {
+            if c.iter().all(|x| x == &BigUint::ZERO) {
+                return Ok(Affine::<C>::identity());
+            }
+            let point = Affine::<C>::new_unchecked(
+                Fp2::<P>::new(P::Fp::from(c[0].clone()), P::Fp::from(c[1].clone())),
+                Fp2::<P>::new(P::Fp::from(c[2].clone()), P::Fp::from(c[3].clone())),
+            );
+            if !point.is_on_curve() {
+                return Err(pyo3::exceptions::PyValueError::new_err(
+                    "G2 point is not on the curve",
+                ));
+            }
+            Ok(point)
+        })
+        .collect()
+}
+
+fn g2_points_to_biguints<C, P>(points: &[Affine<C>]) -> Vec<BigUint>
+where
+    C: SWCurveConfig<BaseField = Fp2<P>>,
+    P: Fp2Config,
+{
+    // The point at infinity has (0, 0) coordinates.
+    points
+        .iter()
+        .flat_map(|c| [c.x.c0.into(), c.x.c1.into(), c.y.c0.into(), c.y.c1.into()])
+        .collect()
+}
+
+fn g2_msm_inner<C, P>(values: &[BigUint], scalars: &[BigUint]) -> PyResult<Vec<BigUint>>
+where
+    C: SWCurveConfig<BaseField = Fp2<P>>,
+    P: Fp2Config,
+{
+    let points = g2_points_from_biguints::<C, P>(values)?;
+    if points.len() != scalars.len() {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "Points and scalars length mismatch",
+        ));
+    }
+    let scalars = scalars
+        .iter()
+        .map(|k| {
+            <C::ScalarField as PrimeField>::BigInt::try_from(k.clone()).map_err(|_| {
+                pyo3::exceptions::PyValueError::new_err("Scalar is larger than the group order")
+            })
+        })
+        .collect::<PyResult<Vec<_>>>()?;
+    let c: Affine<C> = Projective::<C>::msm_bigint(&points, &scalars).into();
+    Ok(g2_points_to_biguints(&[c]))
+}
+
+fn g2_add_batch_inner<C, P>(values_1: &[BigUint], values_2: &[BigUint]) -> PyResult<Vec<BigUint>>
+where
+    C: SWCurveConfig<BaseField = Fp2<P>>,
+    P: Fp2Config,
+{
+    let a = g2_points_from_biguints::<C, P>(values_1)?;
+    let b = g2_points_from_biguints::<C, P>(values_2)?;
+    if a.len() != b.len() {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "Points lists length mismatch",
+        ));
+    }
+    let c: Vec<Projective<C>> = a.iter().zip(b.iter()).map(|(a, b)| *a + b).collect();
+    Ok(g2_points_to_biguints(&Projective::<C>::normalize_batch(&c)))
+}
+
+fn g2_scalar_mul_batch_inner<C, P>(
+    values: &[BigUint],
+    scalars: &[BigUint],
+) -> PyResult<Vec<BigUint>>
+where
+    C: SWCurveConfig<BaseField = Fp2<P>>,
+    P: Fp2Config,
+{
+    let points = g2_points_from_biguints::<C, P>(values)?;
+    if points.len() != scalars.len() {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "Points and scalars length mismatch",
+        ));
+    }
+    let c: Vec<Projective<C>> = points
+        .iter()
+        .zip(scalars)
+        .map(|(a, k)| a.mul_bigint(k.to_u64_digits()))
+        .collect();
+    Ok(g2_points_to_biguints(&Projective::<C>::normalize_batch(&c)))
+}
+
+fn g2_subgroup_check_batch_inner<C, P>(values: &[BigUint]) -> PyResult<Vec<bool>>
+where
+    C: SWCurveConfig<BaseField = Fp2<P>>,
+    P: Fp2Config,
+{
+    // Uses the endomorphism based checks of the curve configurations.
+    Ok(g2_points_from_biguints::<C, P>(values)?
+        .iter()
+        .map(|p| p.is_in_correct_subgroup_assuming_on_curve())
+        .collect())
+}
+
+fn extract_biguints(py_list: &Bound<'_, PyList>) -> PyResult<Vec<BigUint>> {
+    py_list
+        .into_iter()
+        .map(|x| x.extract())
+        .collect::<Result<Vec<BigUint>, _>>()
+}
+
+/// Multi-scalar multiplication of G2 points given as a flattened list [x0_0, x0_1, y0_0, y0_1, ...].
+/// Scalars must be non negative and smaller than the group order.
+/// Returns the result as a tuple (x0, x1, y0, y1), all zeros for the point at infinity.
+#[pyfunction]
+pub fn g2_msm(
+    py: Python,
+    curve_id: usize,
+    py_list_1: &Bound<'_, PyList>,
+    py_list_2: &Bound<'_, PyList>,
+) -> PyResult<PyObject> {
+    let values = extract_biguints(py_list_1)?;
+    let scalars = extract_biguints(py_list_2)?;
+    let result = match curve_id {
+        CURVE_BN254 => {
+            g2_msm_inner::<ark_bn254::g2::Config, ark_bn254::Fq2Config>(&values, &scalars)?
+        }
+        CURVE_BLS12_381 => {
+            g2_msm_inner::<ark_bls12_381::g2::Config, ark_bls12_381::Fq2Config>(&values, &scalars)?
+        }
+        _ => panic!("Curve ID {} not supported", curve_id),
+    };
+    Ok(PyTuple::new_bound(py, result).into())
+}
+
+/// Adds two lists of G2 points given as flattened lists of coordinates, pairwise.
+/// Returns the flattened list of the sums.
+#[pyfunction]
+pub fn g2_add_batch(
+    py: Python,
+    curve_id: usize,
+    py_list_1: &Bound<'_, PyList>,
+    py_list_2: &Bound<'_, PyList>,
+) -> PyResult<PyObject> {
+    let values_1 = extract_biguints(py_list_1)?;
+    let values_2 = extract_biguints(py_list_2)?;
+    let result = match curve_id {
+        CURVE_BN254 => {
+            g2_add_batch_inner::<ark_bn254::g2::Config, ark_bn254::Fq2Config>(&values_1, &values_2)?
+        }
+        CURVE_BLS12_381 => {
+            g2_add_batch_inner::<ark_bls12_381::g2::Config, ark_bls12_381::Fq2Config>(
+                &values_1, &values_2,
+            )?
+        }
+        _ => panic!("Curve ID {} not supported", curve_id),
+    };
+    Ok(PyList::new_bound(py, result).into())
+}
+
+/// Multiplies each G2 point of a flattened list of coordinates by the corresponding non negative scalar.
+/// Returns the flattened list of the products.
+#[pyfunction]
+pub fn g2_scalar_mul_batch(
+    py: Python,
+    curve_id: usize,
+    py_list_1: &Bound<'_, PyList>,
+    py_list_2: &Bound<'_, PyList>,
+) -> PyResult<PyObject> {
+    let values = extract_biguints(py_list_1)?;
+    let scalars = extract_biguints(py_list_2)?;
+    let result = match curve_id {
+        CURVE_BN254 => g2_scalar_mul_batch_inner::<ark_bn254::g2::Config, ark_bn254::Fq2Config>(
+            &values, &scalars,
+        )?,
+        CURVE_BLS12_381 => g2_scalar_mul_batch_inner::<
+            ark_bls12_381::g2::Config,
+            ark_bls12_381::Fq2Config,
+        >(&values, &scalars)?,
+        _ => panic!("Curve ID {} not supported", curve_id),
+    };
+    Ok(PyList::new_bound(py, result).into())
+}
+
+/// Checks whether each G2 point of a flattened list of coordinates is in the prime order subgroup.
+/// The points must be on the curve, and are not required to be in the subgroup.
+#[pyfunction]
+pub fn g2_subgroup_check_batch(
+    py: Python,
+    curve_id: usize,
+    py_list: &Bound<'_, PyList>,
+) -> PyResult<PyObject> {
+    let values = extract_biguints(py_list)?;
+    let result = match curve_id {
+        CURVE_BN254 => {
+            g2_subgroup_check_batch_inner::<ark_bn254::g2::Config, ark_bn254::Fq2Config>(&values)?
+        }
+        CURVE_BLS12_381 => g2_subgroup_check_batch_inner::<
+            ark_bls12_381::g2::Config,
+            ark_bls12_381::Fq2Config,
+        >(&values)?,
+        _ => panic!("Curve ID {} not supported", curve_id),
+    };
+    Ok(PyList::new_bound(py, result).into())
+}
@@ -32,3 +32,50 @@ pub fn hades_permutation(
 
     Ok(py_tuple.into())
 }
+
+/// Absorbs a list of (x, y) pairs into the Poseidon sponge (s0, s1, s2) in a single call.
+/// For each pair, computes hades_permutation(s0 + x, s1 + y, s2).
+/// `py_inputs` is the concatenation of the 32-byte big-endian encodings of x0, y0, x1, y1, ...
+/// Returns the final state and the number of permutations performed.
+#[pyfunction]
+pub fn hades_permutation_multi(
+    py: Python,
+    py_value_1: &Bound<'_, PyBytes>,
+    py_value_2: &Bound<'_, PyBytes>,
+    py_value_3: &Bound<'_, PyBytes>,
+    py_inputs: &Bound<'_, PyBytes>,
+) -> PyResult<PyObject> {
+    let inputs: &[u8] = py_inputs.as_bytes();
+    if inputs.len() % 64 != 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "Inputs length must be a multiple of 64 bytes",
+        ));
+    }
+
+    let mut state: Vec<FieldElement<Stark252PrimeField>> = vec![
+        FieldElement::<Stark252PrimeField>::from_bytes_be(py_value_1.as_bytes())
+            .expect("Unable to convert first param from bytes to FieldElement"),
+        FieldElement::<Stark252PrimeField>::from_bytes_be(py_value_2.as_bytes())
+            .expect("Unable to convert second param from bytes to FieldElement"),
+        FieldElement::<Stark252PrimeField>::from_bytes_be(py_value_3.as_bytes())
+            .expect("Unable to convert third param from bytes to FieldElement"),
+    ];
+
+    for chunk in inputs.chunks_exact(64) {
+        let x = FieldElement::<Stark252PrimeField>::from_bytes_be(&chunk[0..32])
+            .expect("Unable to convert input from bytes to FieldElement");
+        let y = FieldElement::<Stark252PrimeField>::from_bytes_be(&chunk[32..64])
+            .expect("Unable to convert input from bytes to FieldElement");
+        state[0] += x;
+        state[1] += y;
+        PoseidonCairoStark252::hades_permutation(&mut state);
+    }
+
+    Ok((
+        PyBytes::new_bound(py, &state[0].to_bytes_be()),
+        PyBytes::new_bound(py, &state[1].to_bytes_be()),
+        PyBytes::new_bound(py, &state[2].to_bytes_be()),
+        inputs.len() / 64,
+    )
+        .into_py(py))
+}
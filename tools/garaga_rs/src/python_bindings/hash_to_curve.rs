@@ -0,0 +1,46 @@
+use super::*;
+use ark_ec::hashing::{
+    curve_maps::wb::WBMap, map_to_curve_hasher::MapToCurveBasedHasher, HashToCurve,
+};
+use ark_ff::field_hashers::DefaultFieldHasher;
+
+type BLS12381G1Hasher = MapToCurveBasedHasher<
+    ark_ec::short_weierstrass::Projective<ark_bls12_381::g1::Config>,
+    DefaultFieldHasher<sha2::Sha256, 128>,
+    WBMap<ark_bls12_381::g1::Config>,
+>;
+
+/// Hashes messages to G1 with the SSWU map and the sha256 XMD expander of RFC 9380,
+/// with the given domain separation tag. Returns the list of affine points (x, y).
+#[pyfunction]
+pub fn hash_to_curve_many(
+    py: Python,
+    curve_id: usize,
+    dst: &[u8],
+    messages: Vec<Vec<u8>>,
+) -> PyResult<PyObject> {
+    if curve_id != CURVE_BLS12_381 {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "Unsupported curve {} for hash to curve",
+            curve_id
+        )));
+    }
+    let hasher = BLS12381G1Hasher::new(dst)
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("{:?}", e)))?;
+    let points = messages
+        .iter()
+        .map(|message| {
+            let point = hasher
+                .hash(message)
+                .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("{:?}", e)))?;
+            Ok(PyTuple::new_bound(
+                py,
+                [
+                    BigUint::from(point.x.into_bigint()),
+                    BigUint::from(point.y.into_bigint()),
+                ],
+            ))
+        })
+        .collect::<PyResult<Vec<_>>>()?;
+    Ok(PyList::new_bound(py, points).into())
+}
@@ -4,9 +4,11 @@ pub mod final_exp_witness;
 pub mod g2;
 pub mod groth16_calldata;
 pub mod hades_permutation;
+pub mod hash_to_curve;
 pub mod mpc_calldata;
 pub mod msm;
 pub mod pairing;
+pub mod tower;
 
 use ark_ec::pairing::Pairing;
 use ark_ec::AffineRepr;
@@ -29,19 +31,34 @@ const CURVE_BLS12_381: usize = 1;
 fn garaga_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(g2::g2_add, m)?)?;
     m.add_function(wrap_pyfunction!(g2::g2_scalar_mul, m)?)?;
+    m.add_function(wrap_pyfunction!(g2::g2_msm, m)?)?;
+    m.add_function(wrap_pyfunction!(g2::g2_add_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(g2::g2_scalar_mul_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(g2::g2_subgroup_check_batch, m)?)?;
     m.add_function(wrap_pyfunction!(pairing::multi_pairing, m)?)?;
     m.add_function(wrap_pyfunction!(pairing::multi_miller_loop, m)?)?;
+    m.add_function(wrap_pyfunction!(pairing::e12_cyclotomic_exp, m)?)?;
+    m.add_function(wrap_pyfunction!(tower::tower_mul, m)?)?;
+    m.add_function(wrap_pyfunction!(tower::tower_square, m)?)?;
+    m.add_function(wrap_pyfunction!(tower::tower_inv, m)?)?;
+    m.add_function(wrap_pyfunction!(tower::tower_pow, m)?)?;
     m.add_function(wrap_pyfunction!(
         final_exp_witness::get_final_exp_witness,
         m
     )?)?;
     m.add_function(wrap_pyfunction!(hades_permutation::hades_permutation, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        hades_permutation::hades_permutation_multi,
+        m
+    )?)?;
     m.add_function(wrap_pyfunction!(
         extf_mul::nondeterministic_extension_field_mul_divmod,
         m
     )?)?;
+    m.add_function(wrap_pyfunction!(hash_to_curve::hash_to_curve_many, m)?)?;
     m.add_function(wrap_pyfunction!(ecip::zk_ecip_hint, m)?)?;
     m.add_function(wrap_pyfunction!(msm::msm_calldata_builder, m)?)?;
+    m.add_function(wrap_pyfunction!(msm::g1_msm, m)?)?;
     m.add_function(wrap_pyfunction!(mpc_calldata::mpc_calldata_builder, m)?)?;
     m.add_function(wrap_pyfunction!(groth16_calldata::get_groth16_calldata, m)?)?;
     Ok(())
@@ -1,4 +1,12 @@
 use super::*;
+use crate::algebra::g1point::G1Point;
+use crate::definitions::{
+    CurveParamsProvider, SECP256K1PrimeField, SECP256R1PrimeField, X25519PrimeField,
+};
+use crate::io::{
+    field_elements_from_big_uints, field_elements_to_big_uints,
+    parse_g1_points_from_flattened_field_elements_list,
+};
 
 #[pyfunction]
 #[allow(clippy::too_many_arguments)]
@@ -33,3 +41,47 @@ pub fn msm_calldata_builder(
     let py_list = PyList::new_bound(py, result);
     Ok(py_list.into())
 }
+
+/// Multi-scalar multiplication of G1 points given as a flattened list [x0, y0, x1, y1, ...].
+/// Scalars must be non negative. Returns the result as [x, y], (0, 0) being the point at infinity.
+#[pyfunction]
+pub fn g1_msm(
+    py: Python,
+    py_list1: &Bound<'_, PyList>,
+    py_list2: &Bound<'_, PyList>,
+    curve_id: usize,
+) -> PyResult<PyObject> {
+    let values = py_list1
+        .into_iter()
+        .map(|x| x.extract())
+        .collect::<Result<Vec<BigUint>, _>>()?;
+    let scalars = py_list2
+        .into_iter()
+        .map(|x| x.extract())
+        .collect::<Result<Vec<BigUint>, _>>()?;
+    let result = match curve_id {
+        0 => handle_g1_msm::<BN254PrimeField>(&values, &scalars),
+        1 => handle_g1_msm::<BLS12381PrimeField>(&values, &scalars),
+        2 => handle_g1_msm::<SECP256K1PrimeField>(&values, &scalars),
+        3 => handle_g1_msm::<SECP256R1PrimeField>(&values, &scalars),
+        4 => handle_g1_msm::<X25519PrimeField>(&values, &scalars),
+        _ => Err(String::from("Invalid curve ID")),
+    }
+    .map_err(PyErr::new::<pyo3::exceptions::PyValueError, _>)?;
+    let py_list = PyList::new_bound(py, result);
+    Ok(py_list.into())
+}
+
+fn handle_g1_msm<F>(values: &[BigUint], scalars: &[BigUint]) -> Result<Vec<BigUint>, String>
+where
+    F: IsPrimeField + CurveParamsProvider<F>,
+    FieldElement<F>: ByteConversion,
+{
+    if values.len() != 2 * scalars.len() {
+        return Err(String::from("Points and scalars length mismatch"));
+    }
+    let elements = field_elements_from_big_uints::<F>(values);
+    let points = parse_g1_points_from_flattened_field_elements_list(&elements)?;
+    let result = G1Point::msm(&points, scalars);
+    Ok(field_elements_to_big_uints(&[result.x, result.y]))
+}
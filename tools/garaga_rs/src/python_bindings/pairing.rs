@@ -1,4 +1,6 @@
+use super::tower::TowerElement;
 use super::*;
+use ark_ff::CyclotomicMultSubgroup;
 
 #[pyfunction]
 pub fn multi_pairing(
@@ -181,3 +183,41 @@ pub fn multi_miller_loop(
 
     panic!("Curve ID {} not supported", curve_id);
 }
+
+fn e12_cyclotomic_exp_inner<F: TowerElement + CyclotomicMultSubgroup>(
+    values: &[BigUint],
+    exponent: &BigUint,
+) -> Vec<BigUint> {
+    F::from_coeffs(values)
+        .cyclotomic_exp(exponent.to_u64_digits())
+        .to_coeffs()
+}
+
+/// Raises an element of the cyclotomic subgroup of Fp12, given by its 12 tower coefficients,
+/// to a non negative exponent, with the cyclotomic squarings of arkworks.
+#[pyfunction]
+pub fn e12_cyclotomic_exp(
+    py: Python,
+    curve_id: usize,
+    py_list_1: &Bound<'_, PyList>,
+    py_int_2: &Bound<'_, PyInt>,
+) -> PyResult<PyObject> {
+    let values: Vec<BigUint> = py_list_1.extract()?;
+    if values.len() != 12 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "Fp12 elements must be given as 12 coefficients",
+        ));
+    }
+    let exponent: BigUint = py_int_2.extract()?;
+    let res = match curve_id {
+        CURVE_BN254 => e12_cyclotomic_exp_inner::<ark_bn254::Fq12>(&values, &exponent),
+        CURVE_BLS12_381 => e12_cyclotomic_exp_inner::<ark_bls12_381::Fq12>(&values, &exponent),
+        _ => {
+            return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "Unsupported curve {} for the cyclotomic exponentiation",
+                curve_id
+            )))
+        }
+    };
+    Ok(PyList::new_bound(py, res).into())
+}
@@ -0,0 +1,140 @@
+use super::*;
+use ark_ff::{Field, Fp12, Fp12Config, Fp2, Fp2Config, Fp6, Fp6Config};
+
+/// Extension field elements given as their flattened tower coefficients, in the same order
+/// as the Python E2, E6 and E12 classes (c0.b0.a0, c0.b0.a1, c0.b1.a0, ...).
+pub(super) trait TowerElement: Field {
+    fn from_coeffs(c: &[BigUint]) -> Self;
+    fn to_coeffs(&self) -> Vec<BigUint>;
+}
+
+impl<P: Fp2Config> TowerElement for Fp2<P> {
+    fn from_coeffs(c: &[BigUint]) -> Self {
+        Fp2::<P>::new(P::Fp::from(c[0].clone()), P::Fp::from(c[1].clone()))
+    }
+
+    fn to_coeffs(&self) -> Vec<BigUint> {
+        vec![self.c0.into(), self.c1.into()]
+    }
+}
+
+impl<P: Fp6Config> TowerElement for Fp6<P> {
+    fn from_coeffs(c: &[BigUint]) -> Self {
+        Fp6::<P>::new(
+            Fp2::<P::Fp2Config>::from_coeffs(&c[0..2]),
+            Fp2::<P::Fp2Config>::from_coeffs(&c[2..4]),
+            Fp2::<P::Fp2Config>::from_coeffs(&c[4..6]),
+        )
+    }
+
+    fn to_coeffs(&self) -> Vec<BigUint> {
+        [
+            self.c0.to_coeffs(),
+            self.c1.to_coeffs(),
+            self.c2.to_coeffs(),
+        ]
+        .concat()
+    }
+}
+
+impl<P: Fp12Config> TowerElement for Fp12<P> {
+    fn from_coeffs(c: &[BigUint]) -> Self {
+        Fp12::<P>::new(
+            Fp6::<P::Fp6Config>::from_coeffs(&c[0..6]),
+            Fp6::<P::Fp6Config>::from_coeffs(&c[6..12]),
+        )
+    }
+
+    fn to_coeffs(&self) -> Vec<BigUint> {
+        [self.c0.to_coeffs(), self.c1.to_coeffs()].concat()
+    }
+}
+
+enum TowerOp<'a> {
+    Mul(&'a [BigUint]),
+    Square,
+    Inv,
+    Pow(&'a BigUint),
+}
+
+fn tower_eval<F: TowerElement>(a: &[BigUint], op: TowerOp) -> PyResult<Vec<BigUint>> {
+    let x = F::from_coeffs(a);
+    let res = match op {
+        TowerOp::Mul(b) => {
+            if b.len() != a.len() {
+                return Err(pyo3::exceptions::PyValueError::new_err(
+                    "Extension degrees mismatch",
+                ));
+            }
+            x * F::from_coeffs(b)
+        }
+        TowerOp::Square => x.square(),
+        TowerOp::Inv => x
+            .inverse()
+            .ok_or_else(|| pyo3::exceptions::PyZeroDivisionError::new_err("Inverse of zero"))?,
+        TowerOp::Pow(e) => x.pow(e.to_u64_digits()),
+    };
+    Ok(res.to_coeffs())
+}
+
+fn tower_dispatch(curve_id: usize, a: &[BigUint], op: TowerOp) -> PyResult<Vec<BigUint>> {
+    match (curve_id, a.len()) {
+        (CURVE_BN254, 2) => tower_eval::<ark_bn254::Fq2>(a, op),
+        (CURVE_BN254, 6) => tower_eval::<ark_bn254::Fq6>(a, op),
+        (CURVE_BN254, 12) => tower_eval::<ark_bn254::Fq12>(a, op),
+        (CURVE_BLS12_381, 2) => tower_eval::<ark_bls12_381::Fq2>(a, op),
+        (CURVE_BLS12_381, 6) => tower_eval::<ark_bls12_381::Fq6>(a, op),
+        (CURVE_BLS12_381, 12) => tower_eval::<ark_bls12_381::Fq12>(a, op),
+        _ => Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "Unsupported curve {} or extension degree {}",
+            curve_id,
+            a.len()
+        ))),
+    }
+}
+
+/// Product of two elements of Fp2, Fp6 or Fp12 (the degree is the number of coefficients).
+#[pyfunction]
+pub fn tower_mul(
+    py: Python,
+    curve_id: usize,
+    py_list_1: &Bound<'_, PyList>,
+    py_list_2: &Bound<'_, PyList>,
+) -> PyResult<PyObject> {
+    let a: Vec<BigUint> = py_list_1.extract()?;
+    let b: Vec<BigUint> = py_list_2.extract()?;
+    let res = tower_dispatch(curve_id, &a, TowerOp::Mul(&b))?;
+    Ok(PyList::new_bound(py, res).into())
+}
+
+#[pyfunction]
+pub fn tower_square(
+    py: Python,
+    curve_id: usize,
+    py_list_1: &Bound<'_, PyList>,
+) -> PyResult<PyObject> {
+    let a: Vec<BigUint> = py_list_1.extract()?;
+    let res = tower_dispatch(curve_id, &a, TowerOp::Square)?;
+    Ok(PyList::new_bound(py, res).into())
+}
+
+#[pyfunction]
+pub fn tower_inv(py: Python, curve_id: usize, py_list_1: &Bound<'_, PyList>) -> PyResult<PyObject> {
+    let a: Vec<BigUint> = py_list_1.extract()?;
+    let res = tower_dispatch(curve_id, &a, TowerOp::Inv)?;
+    Ok(PyList::new_bound(py, res).into())
+}
+
+/// Raises an element of Fp2, Fp6 or Fp12 to a non negative exponent.
+#[pyfunction]
+pub fn tower_pow(
+    py: Python,
+    curve_id: usize,
+    py_list_1: &Bound<'_, PyList>,
+    py_int_2: &Bound<'_, PyInt>,
+) -> PyResult<PyObject> {
+    let a: Vec<BigUint> = py_list_1.extract()?;
+    let e: BigUint = py_int_2.extract()?;
+    let res = tower_dispatch(curve_id, &a, TowerOp::Pow(&e))?;
+    Ok(PyList::new_bound(py, res).into())
+}
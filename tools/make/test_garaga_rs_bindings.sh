@@ -0,0 +1,39 @@
+#!/bin/bash
+# Checks that the garaga_rs extension built by `maturin develop` exposes the bindings the
+# Python package picks up with hasattr, then runs the tests comparing them to the Python paths.
+set -e
+
+BINDINGS=(
+    hades_permutation_multi
+    g1_msm
+    g2_msm
+    g2_add_batch
+    g2_scalar_mul_batch
+    g2_subgroup_check_batch
+    e12_cyclotomic_exp
+    tower_mul
+    tower_square
+    tower_inv
+    tower_pow
+    hash_to_curve_many
+)
+
+TESTS=(
+    tests/hydra/test_poseidon_transcript.py
+    tests/hydra/test_g1_point.py
+    tests/hydra/test_g2_point.py
+    tests/hydra/hints/test_tower_backup.py
+    tests/hydra/test_signature.py
+)
+
+python - "${BINDINGS[@]}" <<'PY'
+import sys
+
+from garaga import garaga_rs
+
+missing = [name for name in sys.argv[1:] if not hasattr(garaga_rs, name)]
+if missing:
+    sys.exit(f"garaga_rs was built without the bindings {missing}")
+PY
+
+pytest "${TESTS[@]}"